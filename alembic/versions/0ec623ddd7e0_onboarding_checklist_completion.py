@@ -0,0 +1,125 @@
+"""onboarding checklist completion
+
+Revision ID: 0ec623ddd7e0
+Revises: da839305b3b4
+Create Date: 2026-10-19 11:02:17.540913
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import re
+
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0ec623ddd7e0'
+down_revision: Union[str, Sequence[str], None] = 'da839305b3b4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Snapshot of app/utils/onboarding_checklist.py at this revision, so the
+# backfill does not change when the live module does.
+ITEM_BITS = {
+    "aadhar_card": 1 << 0,
+    "qualification_certificates": 1 << 1,
+    "bank_account_proof": 1 << 2,
+    "pan_card": 1 << 3,
+    "passport_size_photo": 1 << 4,
+    "employee_reference": 1 << 5,
+    "last_3_months_pay_slips": 1 << 6,
+    "offer_letter": 1 << 7,
+    "hike_letter": 1 << 8,
+    "experience_letter": 1 << 9,
+    "relieving_letter": 1 << 10,
+    "internship_proof": 1 << 11,
+}
+COMMON_MASK = 0b111111
+FRESHER_MASK = COMMON_MASK | ITEM_BITS["internship_proof"]
+EXPERIENCED_MASK = COMMON_MASK | 0b11111000000
+
+DOCUMENT_TYPE_ALIASES = {
+    "aadhar": "aadhar_card",
+    "aadhaar": "aadhar_card",
+    "aadhaar_card": "aadhar_card",
+    "qualification_certificate": "qualification_certificates",
+    "educational_certificates": "qualification_certificates",
+    "degree_certificate": "qualification_certificates",
+    "marksheet": "qualification_certificates",
+    "marksheets": "qualification_certificates",
+    "bank_proof": "bank_account_proof",
+    "bank_passbook": "bank_account_proof",
+    "passbook": "bank_account_proof",
+    "cancelled_cheque": "bank_account_proof",
+    "pan": "pan_card",
+    "photo": "passport_size_photo",
+    "passport_photo": "passport_size_photo",
+    "internship_certificate": "internship_proof",
+    "payslip": "last_3_months_pay_slips",
+    "payslips": "last_3_months_pay_slips",
+    "pay_slips": "last_3_months_pay_slips",
+    "salary_slips": "last_3_months_pay_slips",
+    "hike": "hike_letter",
+    "increment_letter": "hike_letter",
+    "experience_certificate": "experience_letter",
+    "relieving_certificate": "relieving_letter",
+}
+
+_NON_ALNUM_RE = re.compile(r"[^a-z0-9]+")
+
+
+def _document_bit(document_type):
+    key = _NON_ALNUM_RE.sub("_", (document_type or "").lower()).strip("_")
+    item = key if key in ITEM_BITS else DOCUMENT_TYPE_ALIASES.get(key)
+    return ITEM_BITS[item] if item else 0
+
+
+def _completion(mask, experience_type):
+    required = EXPERIENCED_MASK if (experience_type or "").lower() == "experienced" else FRESHER_MASK
+    return round(100 * bin(mask & required).count("1") / bin(required).count("1"))
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('onboarding', sa.Column('checklist_mask', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('onboarding', sa.Column('checklist_completion', sa.Integer(), server_default='0', nullable=False))
+    op.create_index(op.f('ix_onboarding_checklist_completion'), 'onboarding', ['checklist_completion'], unique=False)
+
+    # Backfill from existing checklists and documents
+    bind = op.get_bind()
+    onboarding = sa.table(
+        'onboarding',
+        sa.column('id', sa.Integer),
+        sa.column('experience_type', sa.String),
+        sa.column('checklist_mask', sa.Integer),
+        sa.column('checklist_completion', sa.Integer),
+    )
+    checklist = sa.table('onboarding_checklist', sa.column('onboarding_id', sa.Integer), *[sa.column(item, sa.Boolean) for item in ITEM_BITS])
+    documents = sa.table('onboarding_documents', sa.column('onboarding_id', sa.Integer), sa.column('document_type', sa.String))
+
+    masks = {}
+    for row in bind.execute(sa.select(checklist)):
+        mask = 0
+        for item, bit in ITEM_BITS.items():
+            if getattr(row, item):
+                mask |= bit
+        masks[row.onboarding_id] = masks.get(row.onboarding_id, 0) | mask
+    for row in bind.execute(sa.select(documents)):
+        masks[row.onboarding_id] = masks.get(row.onboarding_id, 0) | _document_bit(row.document_type)
+
+    for row in bind.execute(sa.select(onboarding.c.id, onboarding.c.experience_type)):
+        mask = masks.get(row.id, 0)
+        if mask:
+            bind.execute(
+                onboarding.update()
+                .where(onboarding.c.id == row.id)
+                .values(checklist_mask=mask, checklist_completion=_completion(mask, row.experience_type))
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_onboarding_checklist_completion'), table_name='onboarding')
+    op.drop_column('onboarding', 'checklist_completion')
+    op.drop_column('onboarding', 'checklist_mask')
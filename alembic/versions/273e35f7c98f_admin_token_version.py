@@ -0,0 +1,28 @@
+"""admin token version
+
+Revision ID: 273e35f7c98f
+Revises: 6466e82a0b02
+Create Date: 2026-10-19 15:21:37.514290
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '273e35f7c98f'
+down_revision: Union[str, Sequence[str], None] = '6466e82a0b02'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('admins', sa.Column('token_version', sa.Integer(), server_default='0', nullable=False))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('admins', 'token_version')
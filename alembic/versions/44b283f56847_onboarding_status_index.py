@@ -0,0 +1,30 @@
+"""onboarding status index
+
+Revision ID: 44b283f56847
+Revises: f73ce6d637ec
+Create Date: 2026-10-19 12:20:36.914472
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '44b283f56847'
+down_revision: Union[str, Sequence[str], None] = 'f73ce6d637ec'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_onboarding_status_id', 'onboarding', ['status', 'id'], unique=False)
+    op.drop_index(op.f('ix_onboarding_status'), table_name='onboarding')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(op.f('ix_onboarding_status'), 'onboarding', ['status'], unique=False)
+    op.drop_index('ix_onboarding_status_id', table_name='onboarding')
@@ -0,0 +1,28 @@
+"""csr image variants
+
+Revision ID: 6466e82a0b02
+Revises: 7371bbd9c42d
+Create Date: 2026-10-19 14:02:11.384105
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6466e82a0b02'
+down_revision: Union[str, Sequence[str], None] = '7371bbd9c42d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('csr_sections', sa.Column('variants', sa.JSON(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('csr_sections', 'variants')
@@ -0,0 +1,30 @@
+"""onboarding application link
+
+Revision ID: 7371bbd9c42d
+Revises: 44b283f56847
+Create Date: 2026-10-19 13:05:48.671220
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7371bbd9c42d'
+down_revision: Union[str, Sequence[str], None] = '44b283f56847'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('onboarding', sa.Column('application_id', sa.Integer(), nullable=True))
+    op.create_unique_constraint('uq_onboarding_application_id', 'onboarding', ['application_id'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint('uq_onboarding_application_id', 'onboarding', type_='unique')
+    op.drop_column('onboarding', 'application_id')
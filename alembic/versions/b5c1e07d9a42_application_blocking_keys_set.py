@@ -0,0 +1,34 @@
+"""application blocking keys set
+
+Revision ID: b5c1e07d9a42
+Revises: 273e35f7c98f
+Create Date: 2026-10-19 17:04:12.906331
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b5c1e07d9a42'
+down_revision: Union[str, Sequence[str], None] = '273e35f7c98f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('applications', sa.Column('blocking_keys_set', sa.Boolean(), server_default=sa.false(), nullable=False))
+    # Rows that already have keys were normalized at submit time; the rest
+    # are picked up once by scripts/dedup_applicants.py.
+    op.execute(
+        "UPDATE applications SET blocking_keys_set = TRUE "
+        "WHERE email_key IS NOT NULL OR phone_key IS NOT NULL OR pan_key IS NOT NULL"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('applications', 'blocking_keys_set')
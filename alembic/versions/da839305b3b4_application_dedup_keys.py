@@ -0,0 +1,42 @@
+"""application dedup keys
+
+Revision ID: da839305b3b4
+Revises: 0531530a4287
+Create Date: 2026-10-19 10:12:41.318204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'da839305b3b4'
+down_revision: Union[str, Sequence[str], None] = '0531530a4287'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('applications', sa.Column('email_key', sa.String(length=150), nullable=True))
+    op.add_column('applications', sa.Column('phone_key', sa.String(length=20), nullable=True))
+    op.add_column('applications', sa.Column('pan_key', sa.String(length=20), nullable=True))
+    op.add_column('applications', sa.Column('duplicate_of', sa.Integer(), nullable=True))
+    op.create_index(op.f('ix_applications_email_key'), 'applications', ['email_key'], unique=False)
+    op.create_index(op.f('ix_applications_phone_key'), 'applications', ['phone_key'], unique=False)
+    op.create_index(op.f('ix_applications_pan_key'), 'applications', ['pan_key'], unique=False)
+    op.create_index(op.f('ix_applications_duplicate_of'), 'applications', ['duplicate_of'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_applications_duplicate_of'), table_name='applications')
+    op.drop_index(op.f('ix_applications_pan_key'), table_name='applications')
+    op.drop_index(op.f('ix_applications_phone_key'), table_name='applications')
+    op.drop_index(op.f('ix_applications_email_key'), table_name='applications')
+    op.drop_column('applications', 'duplicate_of')
+    op.drop_column('applications', 'pan_key')
+    op.drop_column('applications', 'phone_key')
+    op.drop_column('applications', 'email_key')
@@ -0,0 +1,87 @@
+"""onboarding search indexes
+
+Revision ID: f73ce6d637ec
+Revises: 0ec623ddd7e0
+Create Date: 2026-10-19 11:41:53.208716
+
+"""
+import hashlib
+import hmac
+import os
+import re
+from typing import Sequence, Union
+
+from alembic import op
+from dotenv import dotenv_values
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f73ce6d637ec'
+down_revision: Union[str, Sequence[str], None] = '0ec623ddd7e0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Snapshot of app/utils/aadhar.py at this revision, so the backfill does not
+# change when the live module does.
+_NON_DIGIT_RE = re.compile(r"\D")
+
+
+def _secret_key() -> str:
+    # Same sources as app.config.Settings: the environment, then .env
+    key = os.environ.get("SECRET_KEY") or dotenv_values(".env").get("SECRET_KEY")
+    if not key:
+        raise RuntimeError("SECRET_KEY is required to backfill onboarding.aadhar_hash")
+    return key
+
+
+def _aadhar_keys(aadhar_number, secret_key):
+    """(last4, keyed hash) of the number's digits."""
+    digits = _NON_DIGIT_RE.sub("", aadhar_number or "")
+    if not digits:
+        return None, None
+    digest = hmac.new(secret_key.encode("utf-8"), digits.encode("utf-8"), hashlib.sha256).hexdigest()
+    return digits[-4:], digest
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('onboarding', sa.Column('aadhar_last4', sa.String(length=4), nullable=True))
+    op.add_column('onboarding', sa.Column('aadhar_hash', sa.String(length=64), nullable=True))
+    op.create_index(op.f('ix_onboarding_aadhar_last4'), 'onboarding', ['aadhar_last4'], unique=False)
+    op.create_index(op.f('ix_onboarding_aadhar_hash'), 'onboarding', ['aadhar_hash'], unique=False)
+    op.create_index(op.f('ix_onboarding_name'), 'onboarding', ['name'], unique=False)
+    op.create_index(op.f('ix_onboarding_mobile_number'), 'onboarding', ['mobile_number'], unique=False)
+    op.create_index(op.f('ix_onboarding_applied_role'), 'onboarding', ['applied_role'], unique=False)
+    op.create_index(op.f('ix_onboarding_status'), 'onboarding', ['status'], unique=False)
+
+    # Backfill lookup keys for existing candidates
+    bind = op.get_bind()
+    onboarding = sa.table(
+        'onboarding',
+        sa.column('id', sa.Integer),
+        sa.column('aadhar_number', sa.String),
+        sa.column('aadhar_last4', sa.String),
+        sa.column('aadhar_hash', sa.String),
+    )
+    rows = bind.execute(sa.select(onboarding.c.id, onboarding.c.aadhar_number)).all()
+    secret_key = _secret_key() if rows else None
+    for row in rows:
+        last4, digest = _aadhar_keys(row.aadhar_number, secret_key)
+        bind.execute(
+            onboarding.update()
+            .where(onboarding.c.id == row.id)
+            .values(aadhar_last4=last4, aadhar_hash=digest)
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_onboarding_status'), table_name='onboarding')
+    op.drop_index(op.f('ix_onboarding_applied_role'), table_name='onboarding')
+    op.drop_index(op.f('ix_onboarding_mobile_number'), table_name='onboarding')
+    op.drop_index(op.f('ix_onboarding_name'), table_name='onboarding')
+    op.drop_index(op.f('ix_onboarding_aadhar_hash'), table_name='onboarding')
+    op.drop_index(op.f('ix_onboarding_aadhar_last4'), table_name='onboarding')
+    op.drop_column('onboarding', 'aadhar_hash')
+    op.drop_column('onboarding', 'aadhar_last4')
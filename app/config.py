@@ -1,3 +1,5 @@
+from typing import List, Optional
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 class Settings(BaseSettings):
@@ -8,6 +10,28 @@ class Settings(BaseSettings):
     SECRET_KEY: str
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60
+    ADMIN_CACHE_TTL_SECONDS: int = 60
+
+    # Password hashing
+    BCRYPT_ROUNDS: int = 12
+    BCRYPT_WORKERS: int = 0  # 0 = one per CPU core
+    BCRYPT_MAX_QUEUE: int = 32
+    BCRYPT_RETRY_AFTER_SECONDS: int = 2
+
+    # Rate limiting (login / OTP): requests per window, per client IP and per email
+    # (login counts per IP + email, so a known address cannot be locked out by
+    # one client, plus a higher per-account cap against distributed guessing)
+    RATE_LIMIT_ENABLED: bool = True
+    RATE_LIMIT_BACKEND: str = "memory"  # memory | redis (shared across workers)
+    RATE_LIMIT_REDIS_URL: str = "redis://localhost:6379/0"
+    RATE_LIMIT_WINDOW_SECONDS: int = 300
+    RATE_LIMIT_LOGIN_PER_IP: int = 30
+    RATE_LIMIT_LOGIN_PER_EMAIL: int = 10
+    RATE_LIMIT_LOGIN_PER_ACCOUNT: int = 50
+    RATE_LIMIT_OTP_PER_IP: int = 10
+    RATE_LIMIT_OTP_PER_EMAIL: int = 5
+    RATE_LIMIT_UPLOAD_CREATE_PER_IP: int = 30
+    RATE_LIMIT_TRUST_FORWARDED: bool = False
 
     # SMTP
     SMTP_HOST: str
@@ -16,6 +40,40 @@ class Settings(BaseSettings):
     SMTP_PASSWORD: str
     SMTP_USE_TLS: bool = True
 
+    # Uploads
+    UPLOAD_MAX_BYTES: int = 10 * 1024 * 1024
+    UPLOAD_MAX_PARALLEL: int = 4
+    UPLOAD_GC_INTERVAL_HOURS: float = 0  # 0 disables the periodic sweep
+    UPLOAD_GC_GRACE_HOURS: float = 24
+    RESUMABLE_UPLOAD_DIR: str = "uploads_tmp/resumable"
+    RESUMABLE_UPLOAD_TTL_HOURS: float = 24
+    # Caps on unfinished uploads: count per client IP, and bytes reserved in total
+    RESUMABLE_UPLOAD_MAX_PER_CLIENT: int = 10
+    RESUMABLE_UPLOAD_MAX_TOTAL_BYTES: int = 2 * 1024 * 1024 * 1024
+
+    # Upload access: everything else needs a signed /uploads link
+    PUBLIC_UPLOAD_PREFIXES: List[str] = ["uploads/csr/"]
+    UPLOAD_URL_EXPIRE_SECONDS: int = 15 * 60
+    FILE_DELIVERY: str = "direct"  # direct | x-accel | x-sendfile
+    X_ACCEL_PREFIX: str = "/protected-uploads/"
+    UPLOAD_PRECOMPRESSED: bool = False  # serve "x.br"/"x.gz" siblings when present
+
+    # Storage: "local" (STORAGE_LOCAL_ROOT) or "s3" (any S3-compatible endpoint)
+    STORAGE_BACKEND: str = "local"
+    STORAGE_LOCAL_ROOT: str = "."
+    S3_BUCKET: str = ""
+    S3_ENDPOINT_URL: Optional[str] = None
+    S3_REGION: Optional[str] = None
+    S3_ACCESS_KEY_ID: Optional[str] = None
+    S3_SECRET_ACCESS_KEY: Optional[str] = None
+    S3_MULTIPART_THRESHOLD: int = 8 * 1024 * 1024
+    S3_PRESIGN_EXPIRE_SECONDS: int = 3600
+
+    # Image processing
+    IMAGE_WORKERS: int = 2
+    IMAGE_CACHE_DIR: str = "cache/img"
+    IMAGE_CACHE_MAX_BYTES: int = 512 * 1024 * 1024
+
     model_config = SettingsConfigDict(
         env_file=".env",
         env_file_encoding="utf-8"
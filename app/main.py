@@ -1,10 +1,12 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
 from dotenv import load_dotenv
+import asyncio
 import os
 
+from app.config import settings
 from app.database import engine, Base
+from app.utils import image_pipeline, password_pool, upload_gc
 from app.routes import (
     auth,
     admin_test,
@@ -15,6 +17,9 @@ from app.routes import (
     contact,
     csr,
     onboarding_admin,
+    images,
+    uploads,
+    resumable_uploads,
 )
 
 load_dotenv()  # Loads .env file
@@ -42,18 +47,28 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# -------------------------------------------------
-# Serve uploaded files (IMPORTANT 🔥)
-# -------------------------------------------------
-app.mount("/uploads", StaticFiles(directory="uploads"), name="uploads")
-
 # -------------------------------------------------
 # Create tables on startup
 # -------------------------------------------------
+background_tasks = set()
+
+
 @app.on_event("startup")
-def on_startup():
+async def on_startup():
     Base.metadata.create_all(bind=engine)
 
+    if settings.UPLOAD_GC_INTERVAL_HOURS > 0:
+        task = asyncio.create_task(upload_gc.run_periodically())
+        background_tasks.add(task)
+
+
+@app.on_event("shutdown")
+def on_shutdown():
+    for task in background_tasks:
+        task.cancel()
+    image_pipeline.shutdown_pool()
+    password_pool.shutdown_pool()
+
 # -------------------------------------------------
 # Routers
 # -------------------------------------------------
@@ -66,3 +81,6 @@ app.include_router(jobapplication.router)
 app.include_router(contact.router)
 app.include_router(csr.router)
 app.include_router(onboarding_admin.router)
+app.include_router(images.router)
+app.include_router(uploads.router)
+app.include_router(resumable_uploads.router)
@@ -14,6 +14,8 @@ class Admin(Base):
     reset_token = Column(String(255), nullable=True)
     reset_token_expiry = Column(DateTime, nullable=True)
     is_active = Column(Boolean, default=True)   
+    # Bumped on password change/reset and (de)activation; tokens carry it as "ver"
+    token_version = Column(Integer, nullable=False, default=0, server_default="0")
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
 
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, JSON
 from app.database import Base
 from datetime import datetime
 
@@ -17,5 +17,8 @@ class CSR(Base):
     image3 = Column(String(500), nullable=False)
     image4 = Column(String(500), nullable=False)
 
+    # Resized WebP/AVIF copies: {"image1": {"webp": {"320": path, ...}}, ...}
+    variants = Column(JSON, nullable=True)
+
     is_active = Column(Boolean, default=True)
     created_at = Column(DateTime, default=datetime.utcnow)
\ No newline at end of file
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Date, DateTime, ForeignKey, Text
+from sqlalchemy import Boolean, Column, Integer, String, Date, DateTime, ForeignKey, Text
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from app.database import Base
@@ -40,6 +40,14 @@ class Application(Base):
     status = Column(String(50), default="Pending")
     created_at = Column(DateTime, default=datetime.utcnow)
 
+    # Normalized blocking keys for duplicate detection (see app/utils/dedup.py)
+    email_key = Column(String(150), index=True)
+    phone_key = Column(String(20), index=True)
+    pan_key = Column(String(20), index=True)
+    # Set once the keys above are computed, even when all of them are None
+    blocking_keys_set = Column(Boolean, default=False, nullable=False)
+    duplicate_of = Column(Integer, index=True)
+
     educations = relationship(
         "ApplicationEducation",
         back_populates="application",
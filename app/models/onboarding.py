@@ -1,25 +1,32 @@
-from sqlalchemy import Column, Integer, String, Date, Text
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, String, Date, Text, Index
+from sqlalchemy.orm import relationship, validates
 from app.database import Base
+from app.utils.aadhar import aadhar_hash, aadhar_last4
 
 class Onboarding(Base):
     __tablename__ = "onboarding"
+    __table_args__ = (
+        # Status listings/transitions filter on status and page by id
+        Index("ix_onboarding_status_id", "status", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
 
     # Personal Information
-    name = Column(String(255), nullable=False)
+    name = Column(String(255), nullable=False, index=True)
     dob = Column(Date, nullable=False)
     marital_status = Column(String(255))
     gender = Column(String(20), nullable=False)
     aadhar_number = Column(String(20), nullable=False, unique=True)
+    aadhar_last4 = Column(String(4), index=True)
+    aadhar_hash = Column(String(64), index=True)
     father_name = Column(String(255))
     mother_name = Column(String(255))
     spouse_name = Column(String(255))
     communication_address = Column(Text, nullable=False)
     permanent_address = Column(Text, nullable=False)
     landline_number = Column(String(20))
-    mobile_number = Column(String(15), nullable=False)
+    mobile_number = Column(String(15), nullable=False, index=True)
     email = Column(String(255), nullable=False, unique=True)
     blood_group = Column(String(10))
     emergency_contact1 = Column(String(15), nullable=False)
@@ -27,11 +34,18 @@ class Onboarding(Base):
     education_qualification = Column(String(255))
     driving_license = Column(String(50))
     vehicle_number = Column(String(50))
-    applied_role = Column(String(255), nullable=False)
+    applied_role = Column(String(255), nullable=False, index=True)
     experience_type = Column(String(50), nullable=False)
 
     status = Column(String(20), default="pending")
 
+    # Set when the record was converted from a job application
+    application_id = Column(Integer, unique=True)
+
+    # Derived from checklist + uploaded documents (app/utils/onboarding_checklist.py)
+    checklist_mask = Column(Integer, nullable=False, default=0, server_default="0")
+    checklist_completion = Column(Integer, nullable=False, default=0, server_default="0", index=True)
+
     # Relationships
     documents = relationship("OnboardingDocument", back_populates="onboarding", cascade="all, delete-orphan")
     nominees = relationship("OnboardingNominee", back_populates="onboarding", cascade="all, delete-orphan")
@@ -39,4 +53,10 @@ class Onboarding(Base):
     bank = relationship("OnboardingBank", back_populates="onboarding", uselist=False, cascade="all, delete-orphan")
     references = relationship("OnboardingReference", back_populates="onboarding", cascade="all, delete-orphan")
     checklist = relationship("OnboardingChecklist", back_populates="onboarding", uselist=False, cascade="all, delete-orphan")
-    experience_details = relationship("OnboardingExperienceDetails", back_populates="onboarding", uselist=False, cascade="all, delete-orphan")
\ No newline at end of file
+    experience_details = relationship("OnboardingExperienceDetails", back_populates="onboarding", uselist=False, cascade="all, delete-orphan")
+
+    @validates("aadhar_number")
+    def _set_aadhar_lookup_keys(self, key, value):
+        self.aadhar_last4 = aadhar_last4(value)
+        self.aadhar_hash = aadhar_hash(value)
+        return value
@@ -1,33 +1,80 @@
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.concurrency import run_in_threadpool
 #from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.orm import Session
 from datetime import datetime, timedelta
 import uuid
 
+from app.config import settings
 from app.database import get_db
 from app.models.admin import Admin
 from app.schemas.admin import AdminLoginRequest, TokenResponse, ChangePasswordRequest
 from app.utils.auth import (
-    verify_password,
-    hash_password,
+    needs_rehash,
     create_access_token
 )
+from app.utils.password_pool import hash_password_async, verify_password_async
+from app.utils import password_pool
 from app.utils.jwt_dependency import get_current_admin
+from app.utils.admin_principal import AdminPrincipal, invalidate_admin
 from app.utils.email import send_otp_email
 from app.utils.otp import generate_otp, otp_expiry
+from app.utils.rate_limit import rate_limit
 
 router = APIRouter(prefix="/admin", tags=["Admin Auth"])
 
 
+def _access_token(admin: Admin) -> str:
+    return create_access_token({
+        "sub": admin.email,
+        "role": "admin",
+        "ver": admin.token_version or 0,
+    })
+
+
+def _revoke_tokens(db: Session, admin: Admin):
+    """Commit pending changes with a new token_version; older tokens stop working."""
+    admin.token_version = (admin.token_version or 0) + 1
+    db.commit()
+    invalidate_admin(admin.email)
+
+
+# The handlers below are async so bcrypt waits hold no threadpool slot;
+# their queries and commits go through run_in_threadpool instead.
+def _find_admin(db: Session, *criteria):
+    return db.query(Admin).filter(*criteria).first()
+
+
+def _store_password(db: Session, admin: Admin, password_hash: str) -> str:
+    """Save the new hash, revoke older tokens and return a fresh one."""
+    admin.password_hash = password_hash
+    _revoke_tokens(db, admin)
+    return _access_token(admin)
+
+
+# Checked before the handler runs, so throttled requests never reach the DB, bcrypt or SMTP
+login_rate_limit = rate_limit(
+    "login", settings.RATE_LIMIT_LOGIN_PER_IP, settings.RATE_LIMIT_LOGIN_PER_EMAIL,
+    email_per_ip=True, per_account=settings.RATE_LIMIT_LOGIN_PER_ACCOUNT,
+)
+otp_rate_limit = rate_limit(
+    "otp", settings.RATE_LIMIT_OTP_PER_IP, settings.RATE_LIMIT_OTP_PER_EMAIL
+)
+
+
 # -------------------- LOGIN --------------------
-@router.post("/login", response_model=TokenResponse)
-def admin_login(
+@router.post(
+    "/login",
+    response_model=TokenResponse,
+    dependencies=[Depends(login_rate_limit)],
+)
+async def admin_login(
     data: AdminLoginRequest,
     db: Session = Depends(get_db)
 ):
-    admin = db.query(Admin).filter(Admin.email == data.email).first()
+    admin = await run_in_threadpool(_find_admin, db, Admin.email == data.email)
 
-    if not admin or not verify_password(
+    if not admin or not await verify_password_async(
         data.password,
         admin.password_hash
     ):
@@ -36,25 +83,35 @@ def admin_login(
             detail="Invalid credentials"
         )
 
-    token = create_access_token({
-        "sub": admin.email,
-        "role": "admin"
-    })
+    # Built before the commit below expires the row's attributes
+    token = _access_token(admin)
+
+    # Upgrade hashes made with a different BCRYPT_ROUNDS while we have the password
+    if needs_rehash(admin.password_hash):
+        admin.password_hash = await hash_password_async(data.password)
+        await run_in_threadpool(db.commit)
 
     return {"access_token": token, "token_type": "bearer"}
 
 
 # -------------------- CHANGE PASSWORD --------------------
 @router.post("/change-password")
-def change_password(
+async def change_password(
     data: ChangePasswordRequest,
     db: Session = Depends(get_db),
-    current_admin: Admin = Depends(get_current_admin)
+    current_admin: AdminPrincipal = Depends(get_current_admin)
 ):
+    # The principal is a cached snapshot; the password lives on the row
+    admin = await run_in_threadpool(db.get, Admin, current_admin.id)
+    if not admin:
+        # Deleted while its principal was still cached
+        invalidate_admin(current_admin.email)
+        raise HTTPException(status_code=401, detail="Invalid or expired token")
+
     # 1️⃣ Check current password
-    if not verify_password(
+    if not await verify_password_async(
         data.current_password,
-        current_admin.password_hash
+        admin.password_hash
     ):
         raise HTTPException(
             status_code=400,
@@ -68,15 +125,20 @@ def change_password(
             detail="New password and confirm password do not match"
         )
 
-    # 4️⃣ Update password
-    current_admin.password_hash = hash_password(data.new_password)
-    db.commit()
+    # 4️⃣ Update password; tokens issued before now stop working, so the
+    # caller gets a fresh one to stay signed in
+    password_hash = await hash_password_async(data.new_password)
+    token = await run_in_threadpool(_store_password, db, admin, password_hash)
 
-    return {"message": "Password changed successfully"}
+    return {
+        "message": "Password changed successfully",
+        "access_token": token,
+        "token_type": "bearer",
+    }
 
 
 # -------------------- FORGOT PASSWORD --------------------
-@router.post("/forgot-password")
+@router.post("/forgot-password", dependencies=[Depends(otp_rate_limit)])
 def forgot_password(email: str, db: Session = Depends(get_db)):
     admin = db.query(Admin).filter(Admin.email == email).first()
     if not admin:
@@ -92,7 +154,7 @@ def forgot_password(email: str, db: Session = Depends(get_db)):
 
 
 # -------------------- VERIFY OTP --------------------
-@router.post("/verify-otp")
+@router.post("/verify-otp", dependencies=[Depends(otp_rate_limit)])
 def verify_otp(email: str, otp: str, db: Session = Depends(get_db)):
     admin = db.query(Admin).filter(Admin.email == email).first()
     if not admin or admin.otp != otp:
@@ -111,18 +173,49 @@ def verify_otp(email: str, otp: str, db: Session = Depends(get_db)):
 
 # -------------------- RESET PASSWORD --------------------
 @router.post("/reset-password")
-def reset_password(token: str, new_password: str, db: Session = Depends(get_db)):
-    admin = db.query(Admin).filter(Admin.reset_token == token).first()
+async def reset_password(token: str, new_password: str, db: Session = Depends(get_db)):
+    admin = await run_in_threadpool(_find_admin, db, Admin.reset_token == token)
     if not admin:
         raise HTTPException(status_code=400, detail="Invalid token")
 
     if admin.reset_token_expiry < datetime.utcnow():
         raise HTTPException(status_code=400, detail="Token expired")
 
-    admin.password_hash = hash_password(new_password)
+    password_hash = await hash_password_async(new_password)
     admin.otp = None
     admin.reset_token = None
     admin.reset_token_expiry = None
-    db.commit()
+    await run_in_threadpool(_store_password, db, admin, password_hash)
+
+    return {"message": "Password reset successful"}
+
+
+# -------------------- ACTIVATE / DEACTIVATE --------------------
+@router.patch("/admins/{admin_id}/active")
+def set_admin_active(
+    admin_id: int,
+    is_active: bool,
+    db: Session = Depends(get_db),
+    current_admin: AdminPrincipal = Depends(get_current_admin)
+):
+    if admin_id == current_admin.id and not is_active:
+        raise HTTPException(status_code=400, detail="You cannot deactivate your own account")
+
+    admin = db.get(Admin, admin_id)
+    if not admin:
+        raise HTTPException(status_code=404, detail="Admin not found")
+
+    if bool(admin.is_active) != is_active:
+        admin.is_active = is_active
+        # Tokens issued before a deactivation stay dead after reactivation.
+        # Other workers see the change once their cached principal expires
+        # (ADMIN_CACHE_TTL_SECONDS).
+        _revoke_tokens(db, admin)
+
+    return {"id": admin.id, "email": admin.email, "is_active": admin.is_active}
+
 
-    return {"message": "Password reset successful"}
\ No newline at end of file
+# -------------------- PASSWORD HASHING METRICS --------------------
+@router.get("/metrics/password-hashing")
+def password_hashing_metrics(current_admin: AdminPrincipal = Depends(get_current_admin)):
+    return password_pool.metrics()
\ No newline at end of file
@@ -1,16 +1,24 @@
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form, Request
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, UploadFile, File, Form, Request
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 from datetime import datetime, timedelta
 from typing import List
+import os
 
 from app.database import get_db
 from app.models.csr import CSR
 from app.schemas.csr import CSRCreate, CSRUpdate, CSRResponse
 from app.utils.jwt_dependency import get_current_admin
-from app.utils.csr_file_upload import save_image
+from app.utils.csr_file_upload import UPLOAD_DIR
+from app.utils.image_pipeline import generate_variants, variant_paths
+from app.utils.file_cleanup import existing_files, keys_under, remove_files
+from app.utils.storage import get_storage
+from app.utils.staged_upload import IMAGE_SIGNATURES, stage_uploads, promote, discard
 
 router = APIRouter(prefix="/csr", tags=["CSR"])
 
+IMAGE_FIELDS = ["image1", "image2", "image3", "image4"]
+
 
 # =========================================================
 # HELPER — Parse
@@ -28,6 +36,36 @@ def parse_date(date_str: str):
         raise HTTPException(400, "Date must be DD-MM-YYYY or DD/MM/YYYY")
 
 
+# =========================================================
+# HELPER — Delete rows + queue their files
+# =========================================================
+def delete_sections(db: Session, background_tasks: BackgroundTasks, *criteria) -> dict:
+    """
+    Delete matching sections in one statement and remove their images
+    (originals and variants) after the response is sent. Only files under
+    UPLOAD_DIR are removed, whatever the stored paths say.
+    """
+    rows = db.query(
+        CSR.image1, CSR.image2, CSR.image3, CSR.image4, CSR.variants
+    ).filter(*criteria).all()
+
+    if not rows:
+        return {"deleted": 0, "files": 0, "bytes_reclaimed": 0}
+
+    paths = []
+    for *images, variants in rows:
+        paths.extend(images)
+        paths.extend(variant_paths(variants))
+
+    deleted = db.query(CSR).filter(*criteria).delete(synchronize_session=False)
+    db.commit()
+
+    files, total = existing_files(keys_under(paths, UPLOAD_DIR))
+    background_tasks.add_task(remove_files, files)
+
+    return {"deleted": deleted, "files": len(files), "bytes_reclaimed": total}
+
+
 # =========================================================
 # CREATE — JSON with image paths
 # =========================================================
@@ -62,39 +100,66 @@ async def create_sections(
             detail=f"Each section needs 4 images (expected {expected_images})"
         )
 
+    # 🔥 Validate image type
+    for file in files:
+        if not (file.content_type or "").startswith("image/"):
+            raise HTTPException(
+                status_code=400,
+                detail=f"{file.filename} is not a valid image"
+            )
+
+    # 🔥 Magic-byte check + parallel write, off the event loop
+    staged = await run_in_threadpool(
+        stage_uploads, files, UPLOAD_DIR, signatures=IMAGE_SIGNATURES, keep_name=False
+    )
+    paths = [item.final_path for item in staged]
+    storage = get_storage()
+    variant_files = []
     created_records = []
-    file_index = 0
-
-    for title in titles:
-        uploaded_paths = []
-
-        for _ in range(4):
-            file = files[file_index]
-
-            # 🔥 Validate image type
-            if not file.content_type.startswith("image/"):
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"{file.filename} is not a valid image"
-                )
-
-            path = save_image(file)
-            uploaded_paths.append(path)
-            file_index += 1
-
-        record = CSR(
-            posted_at=post_time,
-            title=title,
-            image1=uploaded_paths[0],
-            image2=uploaded_paths[1],
-            image3=uploaded_paths[2],
-            image4=uploaded_paths[3],
-        )
 
-        db.add(record)
-        created_records.append(record)
-
-    db.commit()
+    # Everything after staging is undone on failure, including a
+    # cancelled request while the variants are being generated
+    try:
+        # 🔥 Resized WebP variants, generated in the image process pool from
+        # the local staged copies, named after the final paths
+        all_variants = await generate_variants(
+            [item.tmp_path for item in staged],
+            [os.path.splitext(path)[0] for path in paths],
+        )
+        variant_files = [p for variants in all_variants for p in variant_paths({"image": variants})]
+
+        await run_in_threadpool(promote, staged)
+        for path in variant_files:
+            await run_in_threadpool(storage.put_file, path, path)
+
+        for index, title in enumerate(titles):
+            uploaded_paths = paths[index * 4:index * 4 + 4]
+            image_variants = all_variants[index * 4:index * 4 + 4]
+
+            record = CSR(
+                posted_at=post_time,
+                title=title,
+                image1=uploaded_paths[0],
+                image2=uploaded_paths[1],
+                image3=uploaded_paths[2],
+                image4=uploaded_paths[3],
+                variants={
+                    IMAGE_FIELDS[i]: v for i, v in enumerate(image_variants) if v
+                },
+            )
+
+            db.add(record)
+            created_records.append(record)
+
+        db.commit()
+    except BaseException:
+        db.rollback()
+        discard(staged)
+        for path in variant_files:
+            if os.path.exists(path):
+                os.remove(path)
+            storage.delete(path)
+        raise
 
     for record in created_records:
         db.refresh(record)
@@ -155,30 +220,51 @@ def update(
     if not record:
         raise HTTPException(404, "Activity not found")
 
-    for field, value in data.dict(exclude_unset=True).items():
+    update_data = data.dict(exclude_unset=True)
+
+    for field, value in update_data.items():
         setattr(record, field, value)
 
+    # Variants of a replaced image no longer match it
+    if record.variants and any(field in update_data for field in IMAGE_FIELDS):
+        record.variants = {
+            image: formats for image, formats in record.variants.items()
+            if image not in update_data
+        }
+
     db.commit()
     db.refresh(record)
     return record
 
 
+# =========================================================
+# DELETE — ALL (Admin)
+# =========================================================
+@router.delete("/admin/all")
+def delete_all(
+    background_tasks: BackgroundTasks,
+    db: Session = Depends(get_db),
+    admin=Depends(get_current_admin)
+):
+    summary = delete_sections(db, background_tasks)
+    return {"message": f"Deleted {summary['deleted']} activities", **summary}
+
+
 # =========================================================
 # DELETE — BY ID
 # =========================================================
 @router.delete("/admin/{section_id}")
 def delete(
     section_id: int,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     admin=Depends(get_current_admin)
 ):
-    record = db.query(CSR).filter(CSR.id == section_id).first()
-    if not record:
+    summary = delete_sections(db, background_tasks, CSR.id == section_id)
+    if not summary["deleted"]:
         raise HTTPException(404, "Activity not found")
 
-    db.delete(record)
-    db.commit()
-    return {"message": "Activity deleted"}
+    return {"message": "Activity deleted", **summary}
 
 
 # =========================================================
@@ -187,29 +273,14 @@ def delete(
 @router.delete("/admin/date/{date}")
 def delete_by_date(
     date: str,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     admin=Depends(get_current_admin)
 ):
     start, end = parse_date(date)
 
-    records = db.query(CSR).filter(CSR.posted_at >= start, CSR.posted_at < end).all()
-    if not records:
+    summary = delete_sections(db, background_tasks, CSR.posted_at >= start, CSR.posted_at < end)
+    if not summary["deleted"]:
         raise HTTPException(404, "No activities found")
 
-    count = len(records)
-
-    for record in records:
-        db.delete(record)
-
-    db.commit()
-    return {"message": f"Deleted {count} activities from {date}"}
-
-
-# =========================================================
-# DELETE — ALL (Admin)
-# =========================================================
-@router.delete("/admin/all")
-def delete_all(db: Session = Depends(get_db), admin=Depends(get_current_admin)):
-    count = db.query(CSR).delete()
-    db.commit()
-    return {"message": f"Deleted {count} activities"}
\ No newline at end of file
+    return {"message": f"Deleted {summary['deleted']} activities from {date}", **summary}
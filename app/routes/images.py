@@ -0,0 +1,83 @@
+import asyncio
+import os
+import posixpath
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import FileResponse
+
+from app.utils.file_access import authorized_upload, cache_control
+from app.utils.image_cache import cache_key, image_cache
+from app.utils.image_pipeline import get_pool, resize_to, variant_formats
+from app.utils.storage import get_storage
+
+router = APIRouter(prefix="/img", tags=["Images"])
+
+SOURCE_EXTENSIONS = {".jpg", ".jpeg", ".png", ".webp", ".gif", ".bmp", ".tiff"}
+
+MEDIA_TYPES = {
+    "webp": "image/webp",
+    "jpeg": "image/jpeg",
+    "png": "image/png",
+    "avif": "image/avif",
+}
+
+MAX_DIMENSION = 2000
+
+
+# =========================================================
+# GET — RESIZED IMAGE
+# =========================================================
+@router.get("/{path:path}")
+async def resized_image(
+    key: str = Depends(authorized_upload),
+    w: Optional[int] = Query(None, ge=1, le=MAX_DIMENSION),
+    h: Optional[int] = Query(None, ge=1, le=MAX_DIMENSION),
+    fmt: str = Query("webp"),
+    exp: Optional[int] = Query(None),
+):
+    fmt = fmt.lower().replace("jpg", "jpeg")
+    if fmt not in MEDIA_TYPES:
+        raise HTTPException(400, f"fmt must be one of: {', '.join(MEDIA_TYPES)}")
+    if fmt == "avif" and "avif" not in variant_formats():
+        raise HTTPException(400, "AVIF output is not supported on this server")
+
+    if posixpath.splitext(key)[1].lower() not in SOURCE_EXTENSIONS:
+        raise HTTPException(400, "Not an image")
+
+    storage = get_storage()
+    info = await run_in_threadpool(storage.info, key)
+    if info is None:
+        raise HTTPException(404, "Image not found")
+
+    # Source mtime/size are part of the key, so a replaced file gets a fresh entry
+    name = f"{cache_key(key, info.mtime, info.size, w, h, fmt)}.{fmt}"
+
+    async def build(out: str):
+        source = storage.local_path(key)
+        download = None
+
+        try:
+            if source is None:
+                # Remote backend: resize from a temporary local copy
+                download = source = f"{out}.src.part"
+                await run_in_threadpool(storage.download, key, download)
+
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(get_pool(), resize_to, source, out, w, h, fmt)
+        finally:
+            if download and os.path.exists(download):
+                os.remove(download)
+
+    try:
+        cached = await image_cache.get_or_build(name, build)
+    except (OSError, ValueError, KeyError):
+        raise HTTPException(422, "Image could not be processed")
+
+    return FileResponse(
+        cached,
+        media_type=MEDIA_TYPES[fmt],
+        # Private sources stay out of shared caches and expire with the link
+        headers={"Cache-Control": cache_control(key, exp)},
+    )
@@ -5,6 +5,8 @@ from app.database import get_db
 from app.utils.jwt_dependency import get_current_admin
 from app.models.job import Job
 from app.schemas.job import JobCreate, JobResponse, JobUpdate
+from app.utils.skill_match import skill_index
+from app.utils.job_similarity import job_similarity_index
 
 router = APIRouter(prefix="/jobs", tags=["Jobs"])
 
@@ -23,6 +25,8 @@ def create_job(
     db.add(new_job)
     db.commit()
     db.refresh(new_job)
+    skill_index.refresh_job(new_job)
+    job_similarity_index.upsert(new_job)
     return new_job
 
 
@@ -50,6 +54,8 @@ def bulk_delete_jobs(
     )
 
     db.commit()
+    skill_index.remove_jobs(job_ids)
+    job_similarity_index.remove_jobs(job_ids)
 
     if deleted_count == 0:
         raise HTTPException(
@@ -68,6 +74,8 @@ def delete_all_jobs(
 ):
     deleted = db.query(Job).delete()
     db.commit()
+    skill_index.clear()
+    job_similarity_index.clear()
     return {"message": f"Deleted {deleted} jobs"}
 
 
@@ -103,6 +111,8 @@ def update_job(
 
     db.commit()
     db.refresh(job)
+    skill_index.refresh_job(job)
+    job_similarity_index.upsert(job)
     return job
 
 
@@ -119,4 +129,6 @@ def delete_job(
 
     db.delete(job)
     db.commit()
+    skill_index.remove_jobs([job_id])
+    job_similarity_index.remove_jobs([job_id])
     return {"message": "Job deleted successfully"}
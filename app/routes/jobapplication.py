@@ -2,23 +2,125 @@ from fastapi import (
     APIRouter, Depends, HTTPException,
     UploadFile, File, Form, Query, Body
 )
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session, selectinload
 from sqlalchemy import func
-from typing import Optional, List
+from typing import Dict, List, Optional
 from datetime import date, datetime
 import os
 import json
 
-from app.database import get_db
+from app.database import get_db, SessionLocal
 from app.models.jobapplication import Application, ApplicationExperience, ApplicationEducation
-from app.schemas.jobapplication import ApplicationResponse
+from app.models.job import Job
+from app.models.onboarding_documents import OnboardingDocument
+from app.schemas.jobapplication import ApplicationResponse, DuplicateClusterResponse
+from app.schemas.job import SimilarJobResponse
 from app.utils.jwt_dependency import get_current_admin
 from app.utils.file_upload import save_upload_file
-from app.models.admin import Admin as User
+from app.utils.skill_match import skill_index
+from app.utils.job_similarity import job_similarity_index, load_similar_jobs
+from app.utils.zip_stream import stream_zip, safe_name
+from app.utils.storage import get_storage
+from app.utils.staged_upload import discard, promote
+from app.utils.resumable_upload import claim_uploads
+from app.utils.bulk_insert import insert_children
+from app.utils.dedup import set_blocking_keys, find_exact_duplicate, cluster_duplicates, DEFAULT_NAME_THRESHOLD
+from app.utils.admin_principal import AdminPrincipal
 
 router = APIRouter(prefix="/admin/applications", tags=["Job Applications"])
 
 UPLOAD_DIR = "uploads/job_applications"
+DOCUMENT_FIELDS = {
+    "pan_card_file": "pan_card",
+    "resume_file": "resume",
+    "photo_file": "photo",
+}
+
+
+def _document_entries(*criteria):
+    # Runs while the response streams, after the request session is closed,
+    # so it reads the paths through its own session.
+    db = SessionLocal()
+    try:
+        rows = (
+            db.query(
+                Application.id,
+                Application.full_name,
+                Application.pan_card_file,
+                Application.resume_file,
+                Application.photo_file,
+            )
+            .filter(*criteria)
+            .order_by(Application.id)
+            .yield_per(500)
+        )
+        for row in rows:
+            folder = f"{row.id}_{safe_name(row.full_name)}"
+            for field, label in DOCUMENT_FIELDS.items():
+                path = getattr(row, field)
+                if path:
+                    yield f"{folder}/{label}{os.path.splitext(path)[1]}", path
+    finally:
+        db.close()
+
+
+def _unlinked_document_paths(db: Session, application: Application) -> List[str]:
+    # Files of converted applications are shared with their onboarding
+    # documents and must outlive the application.
+    paths = [getattr(application, field) for field in DOCUMENT_FIELDS]
+    paths = [path for path in paths if path]
+    if not paths:
+        return []
+
+    linked = {
+        row.file_path
+        for row in db.query(OnboardingDocument.file_path).filter(OnboardingDocument.file_path.in_(paths))
+    }
+    return [path for path in paths if path not in linked]
+
+
+def _documents_zip_response(db: Session, filename: str, *criteria):
+    if not db.query(Application.id).filter(*criteria).first():
+        raise HTTPException(404, "No applications found")
+
+    return StreamingResponse(
+        stream_zip(_document_entries(*criteria)),
+        media_type="application/zip",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
+def _store_documents(documents: dict) -> Dict[str, str]:
+    """
+    Move claimed resumable uploads into place and write direct uploads.
+    Returns the stored path (storage key) per document; nothing is left
+    behind if any of them fails.
+    """
+    claimed = [name for name, (_, upload_id) in documents.items() if upload_id]
+    staged = dict(zip(claimed, claim_uploads([documents[name][1] for name in claimed], UPLOAD_DIR)))
+
+    paths = {name: item.final_path for name, item in staged.items()}
+    saved = []
+    try:
+        promote(list(staged.values()))
+        for name, (file, _) in documents.items():
+            if name not in paths:
+                paths[name] = save_upload_file(UPLOAD_DIR, file)
+                saved.append(paths[name])
+    except BaseException:
+        discard(list(staged.values()))
+        _remove_documents(saved)
+        raise
+
+    return paths
+
+
+def _remove_documents(paths):
+    storage = get_storage()
+    for path in paths:
+        storage.delete(path)
 
 
 # =========================================================
@@ -48,43 +150,30 @@ async def apply_job(
     experience_level: str = Form(...),
     experience: Optional[str] = Form(None),
 
-    pan_card: UploadFile = File(...),
-    resume: UploadFile = File(...),
-    photo: UploadFile = File(...),
+    # Each document is either a file or the id of a finalized resumable upload
+    pan_card: Optional[UploadFile] = File(None),
+    resume: Optional[UploadFile] = File(None),
+    photo: Optional[UploadFile] = File(None),
+    pan_card_upload_id: Optional[str] = Form(None),
+    resume_upload_id: Optional[str] = Form(None),
+    photo_upload_id: Optional[str] = Form(None),
 
     db: Session = Depends(get_db),
 ):
 
     full_name = f"{first_name.strip()} {last_name.strip()}"
 
-    pan_card_path = save_upload_file(UPLOAD_DIR, pan_card)
-    resume_path = save_upload_file(UPLOAD_DIR, resume)
-    photo_path = save_upload_file(UPLOAD_DIR, photo)
-
-    db_application = Application(
-        job_id=job_id,
-        first_name=first_name,
-        last_name=last_name,
-        full_name=full_name,
-        phone=phone,
-        email=email,
-        date_of_birth=date_of_birth,
-        gender=gender,
-        location=location,
-        pan_number=pan_number,
-        linkedin_url=linkedin_url,
-        position_applied=position_applied,
-        preferred_work_mode=preferred_work_mode,
-        key_skills=key_skills,
-        expected_salary=expected_salary,
-        why_hire_me=why_hire_me,
-        experience_level=experience_level,
-        pan_card_file=pan_card_path,
-        resume_file=resume_path,
-        photo_file=photo_path,
-    )
+    documents = {
+        "pan_card": (pan_card, pan_card_upload_id),
+        "resume": (resume, resume_upload_id),
+        "photo": (photo, photo_upload_id),
+    }
+    for name, (file, upload_id) in documents.items():
+        if (file is None) == (upload_id is None):
+            raise HTTPException(422, f"Provide either {name} or {name}_upload_id")
 
     # ---------------- EDUCATION ----------------
+    edu_rows = []
     try:
         edu_list = json.loads(educations)
         if len(edu_list) == 0:
@@ -103,12 +192,19 @@ async def apply_job(
                 continue
             seen_edu.add(key)
 
-            db_application.educations.append(ApplicationEducation(**edu))
+            edu_rows.append({
+                "highest_qualification": edu["highest_qualification"],
+                "specialization": edu["specialization"],
+                "university": edu["university"],
+                "college": edu["college"],
+                "year_of_passing": int(edu["year_of_passing"]),
+            })
 
     except Exception as e:
         raise HTTPException(400, f"Invalid education format: {str(e)}")
 
     # ---------------- EXPERIENCE ----------------
+    exp_rows = []
     if experience:
         try:
             exp_list = json.loads(experience)
@@ -130,14 +226,12 @@ async def apply_job(
                     continue
                 seen_exp.add(key)
 
-                db_application.experiences.append(
-                    ApplicationExperience(
-                        previous_company=exp["previous_company"],
-                        previous_role=exp["previous_role"],
-                        date_of_joining=doj,
-                        relieving_date=rd,
-                    )
-                )
+                exp_rows.append({
+                    "previous_company": exp["previous_company"],
+                    "previous_role": exp["previous_role"],
+                    "date_of_joining": doj,
+                    "relieving_date": rd,
+                })
 
         except Exception as e:
             raise HTTPException(400, f"Invalid experience format: {str(e)}")
@@ -145,10 +239,67 @@ async def apply_job(
     elif experience_level.lower() == "experienced":
         raise HTTPException(422, "Experience required for experienced candidate")
 
+    db_application = Application(
+        job_id=job_id,
+        first_name=first_name,
+        last_name=last_name,
+        full_name=full_name,
+        phone=phone,
+        email=email,
+        date_of_birth=date_of_birth,
+        gender=gender,
+        location=location,
+        pan_number=pan_number,
+        linkedin_url=linkedin_url,
+        position_applied=position_applied,
+        preferred_work_mode=preferred_work_mode,
+        key_skills=key_skills,
+        expected_salary=expected_salary,
+        why_hire_me=why_hire_me,
+        experience_level=experience_level,
+    )
+
+    # ---------------- DUPLICATES ----------------
+    set_blocking_keys(db_application)
+    db_application.duplicate_of = find_exact_duplicate(db, db_application)
+
+    # ---------------- DOCUMENTS ----------------
+    # Only after everything above is valid: claiming uses up the upload ids
+    paths = await run_in_threadpool(_store_documents, documents)
+    db_application.pan_card_file = paths["pan_card"]
+    db_application.resume_file = paths["resume"]
+    db_application.photo_file = paths["photo"]
+
+    try:
+        return persist_application(db, db_application, edu_rows, exp_rows)
+    except Exception:
+        db.rollback()
+        await run_in_threadpool(_remove_documents, paths.values())
+        raise
+
+
+def persist_application(
+    db: Session,
+    db_application: Application,
+    edu_rows: List[dict],
+    exp_rows: List[dict],
+) -> ApplicationResponse:
+    # One INSERT for the application and one multi-row INSERT per child table.
+    # The response is built from the inserted rows, so no refresh/lazy loads.
     db.add(db_application)
+    db.flush()
+
+    educations = insert_children(db, ApplicationEducation, "application_id", db_application.id, edu_rows)
+    experiences = insert_children(db, ApplicationExperience, "application_id", db_application.id, exp_rows)
+
+    response = ApplicationResponse.model_validate({
+        **{c.key: getattr(db_application, c.key) for c in Application.__table__.columns},
+        "educations": educations,
+        "experiences": experiences,
+    })
+
     db.commit()
-    db.refresh(db_application)
-    return db_application
+    return response
 
 
 # =========================================================
@@ -159,7 +310,7 @@ async def get_all_applications(
     skip: int = 0,
     limit: int = Query(default=100, le=100),
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_admin),
+    current_user: AdminPrincipal = Depends(get_current_admin),
 ):
     return (
         db.query(Application)
@@ -173,6 +324,47 @@ async def get_all_applications(
     )
     return applications
 
+
+# =========================================================
+# NEAR-DUPLICATE CLUSTERS
+# =========================================================
+@router.get("/duplicates", response_model=List[DuplicateClusterResponse])
+def get_duplicate_clusters(
+    threshold: float = Query(default=DEFAULT_NAME_THRESHOLD, ge=0.5, le=1.0),
+    db: Session = Depends(get_db),
+    current_user: AdminPrincipal = Depends(get_current_admin),
+):
+    return [
+        {"application_ids": ids, "size": len(ids)}
+        for ids in cluster_duplicates(db, threshold)
+    ]
+
+
+# =========================================================
+# DOCUMENTS ZIP — SELECTED APPLICATIONS / WHOLE JOB
+# =========================================================
+@router.get("/documents.zip")
+def download_documents_zip(
+    application_ids: List[int] = Query(...),
+    db: Session = Depends(get_db),
+    current_user: AdminPrincipal = Depends(get_current_admin),
+):
+    return _documents_zip_response(
+        db, "application_documents.zip", Application.id.in_(application_ids)
+    )
+
+
+@router.get("/job/{job_id}/documents.zip")
+def download_job_documents_zip(
+    job_id: int,
+    db: Session = Depends(get_db),
+    current_user: AdminPrincipal = Depends(get_current_admin),
+):
+    return _documents_zip_response(
+        db, f"job_{job_id}_documents.zip", Application.job_id == job_id
+    )
+
+
 # =========================================================
 # LIST APPLICATIONS + STATS
 # =========================================================
@@ -180,9 +372,14 @@ async def get_all_applications(
 async def list_applications(
     job_id: Optional[int] = Query(None),
     status: Optional[str] = Query(None),
+    sort: Optional[str] = Query(None, description="Use 'match' to rank by skill match against the job"),
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_admin),
+    current_user: AdminPrincipal = Depends(get_current_admin),
 ):
+    if sort not in (None, "match"):
+        raise HTTPException(400, "sort must be 'match'")
+    if sort == "match" and not job_id:
+        raise HTTPException(400, "job_id is required to sort by match")
 
     query = db.query(Application).options(selectinload(Application.experiences))
 
@@ -193,6 +390,20 @@ async def list_applications(
 
     applications = query.all()
 
+    if sort == "match":
+        job = db.get(Job, job_id)
+        if not job:
+            raise HTTPException(404, "Job not found")
+
+        scores = skill_index.score_applications(db, job, applications)
+        responses = []
+        for i in (-scores).argsort(kind="stable"):
+            response = ApplicationResponse.model_validate(applications[i])
+            response.match_score = round(float(scores[i]), 4)
+            responses.append(response)
+    else:
+        responses = [ApplicationResponse.model_validate(a) for a in applications]
+
     stats_query = db.query(Application.status, func.count(Application.id))
     if job_id:
         stats_query = stats_query.filter(Application.job_id == job_id)
@@ -201,7 +412,7 @@ async def list_applications(
     status_counts = dict(stats_query.all())
 
     return {
-        "applications": [ApplicationResponse.model_validate(a) for a in applications],
+        "applications": responses,
         "stats": {
             "total": len(applications),
             "pending": status_counts.get("Pending", 0),
@@ -220,17 +431,15 @@ async def list_applications(
 async def delete_applications_bulk(
     application_ids: List[int] = Body(...),
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_admin),
+    current_user: AdminPrincipal = Depends(get_current_admin),
 ):
     deleted = 0
 
     for app_id in application_ids:
         app = db.query(Application).filter(Application.id == app_id).first()
         if app:
-            for field in ["pan_card_file", "resume_file", "photo_file"]:
-                file_path = getattr(app, field)
-                if file_path and os.path.exists(file_path):
-                    os.remove(file_path)
+            for file_path in _unlinked_document_paths(db, app):
+                get_storage().delete(file_path)
 
             db.delete(app)
             deleted += 1
@@ -246,7 +455,7 @@ async def delete_applications_bulk(
 async def get_application(
     application_id: int,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_admin),
+    current_user: AdminPrincipal = Depends(get_current_admin),
 ):
     application = (
         db.query(Application)
@@ -264,6 +473,38 @@ async def get_application(
     return application
 
 
+# =========================================================
+# DOCUMENTS ZIP — SINGLE APPLICATION
+# =========================================================
+@router.get("/{application_id}/documents.zip")
+def download_application_documents_zip(
+    application_id: int,
+    db: Session = Depends(get_db),
+    current_user: AdminPrincipal = Depends(get_current_admin),
+):
+    return _documents_zip_response(
+        db, f"application_{application_id}_documents.zip", Application.id == application_id
+    )
+
+
+# =========================================================
+# SIMILAR OPEN JOBS FOR AN APPLICANT
+# =========================================================
+@router.get("/{application_id}/similar-jobs", response_model=List[SimilarJobResponse])
+async def get_similar_jobs(
+    application_id: int,
+    k: int = Query(default=5, ge=1, le=20),
+    db: Session = Depends(get_db),
+    current_user: AdminPrincipal = Depends(get_current_admin),
+):
+    application = db.query(Application).filter(Application.id == application_id).first()
+    if not application:
+        raise HTTPException(404, "Application not found")
+
+    results = job_similarity_index.similar_to_application(db, application, k)
+    return load_similar_jobs(db, results)
+
+
 # =========================================================
 # UPDATE STATUS
 # =========================================================
@@ -272,7 +513,7 @@ async def update_status(
     application_id: int,
     status: str,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_admin),
+    current_user: AdminPrincipal = Depends(get_current_admin),
 ):
     application = db.query(Application).filter(Application.id == application_id).first()
     if not application:
@@ -298,16 +539,14 @@ async def update_status(
 async def delete_application(
     application_id: int,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_admin),
+    current_user: AdminPrincipal = Depends(get_current_admin),
 ):
     application = db.query(Application).filter(Application.id == application_id).first()
     if not application:
         raise HTTPException(404, "Application not found")
 
-    for field in ["pan_card_file", "resume_file", "photo_file"]:
-        path = getattr(application, field)
-        if path and os.path.exists(path):
-            os.remove(path)
+    for path in _unlinked_document_paths(db, application):
+        get_storage().delete(path)
 
     db.delete(application)
     db.commit()
@@ -1,9 +1,12 @@
 from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form, Query
-from sqlalchemy.orm import Session, joinedload
-from typing import List
+from fastapi.responses import StreamingResponse
+from pydantic import ValidationError
+from sqlalchemy import func, insert, or_, select, update
+from sqlalchemy.orm import Session, selectinload
+from typing import List, Optional
 import os
-import shutil
-import uuid
+import re
+import json
 from app.utils.jwt_dependency import get_current_admin
 
 from app.database import get_db
@@ -17,8 +20,10 @@ from app.models.onboarding_nominee import (
     OnboardingExperienceDetails
 )
 from app.models.onboarding_checklist import OnboardingChecklist
+from app.models.jobapplication import Application
 from app.schemas.onboarding import (
     OnboardingPersonalCreate,
+    OnboardingCreate,
     OnboardingResponse,
     NomineeCreate,
     FamilyCreate,
@@ -26,13 +31,49 @@ from app.schemas.onboarding import (
     ReferenceCreate,
     ChecklistCreate,
     ExperienceDetailsCreate,
+    PaginatedOnboardingSummary,
+    OnboardingSearchResponse,
+    StatusUpdate,
+    BulkStatusUpdate,
+    BulkStatusResponse,
+    ApplicationConversionCreate,
+    BulkApplicationConversionItem,
+    BulkApplicationConversion,
+    BulkConversionResponse,
 )
+from app.utils.onboarding_checklist import (
+    ITEM_BITS,
+    apply_completion,
+    checklist_mask,
+    documents_mask,
+    missing_items,
+)
+from app.utils.bulk_insert import insert_children
+from app.utils.aadhar import aadhar_hash
+from app.utils.onboarding_status import JOINED, STATUSES, TRANSITIONS, allowed_from
+from app.utils.payroll_export import stream_csv, stream_jsonl
+from app.utils.staged_upload import stage_uploads, promote, discard
+from app.utils.storage import get_storage
+from app.utils.resumable_upload import claim_uploads, parse_upload_ids
 
 router = APIRouter(prefix="/admin/onboarding", tags=["Onboarding"])
 
 UPLOAD_DIR = "uploads/onboarding"
 os.makedirs(UPLOAD_DIR, exist_ok=True)
 
+CHILD_FIELDS = {"nominees", "family", "bank", "references", "checklist", "experience_details"}
+
+
+def _split_document_types(document_types: List[str]) -> List[str]:
+    # Swagger sends a single comma separated value
+    if len(document_types) == 1 and "," in document_types[0]:
+        return [doc.strip() for doc in document_types[0].split(",")]
+    return document_types
+
+
+def _document_type_at(document_types: List[str], index: int) -> str:
+    return document_types[index] if index < len(document_types) else document_types[-1]
+
 
 # ==========================================================
 # PERSONAL DETAILS ONLY
@@ -50,6 +91,244 @@ def create_personal(data: OnboardingPersonalCreate, db: Session = Depends(get_db
     db.refresh(onboarding)
     return onboarding
 
+# ==========================================================
+# FULL SUBMISSION (ONE REQUEST, ONE TRANSACTION)
+# ==========================================================
+@router.post("/submit", response_model=OnboardingResponse, status_code=201)
+def submit_onboarding(
+    payload: str = Form(..., description="OnboardingCreate as JSON"),
+    document_types: List[str] = Form(default=[]),
+    files: List[UploadFile] = File(default=[]),
+    db: Session = Depends(get_db),
+):
+    # ---------------- VALIDATE EVERYTHING FIRST ----------------
+    try:
+        data = OnboardingCreate.model_validate_json(payload)
+    except ValidationError as e:
+        raise HTTPException(422, json.loads(e.json()))
+
+    if data.experience_details and data.experience_type.lower() != "experienced":
+        raise HTTPException(400, "Candidate is not experienced")
+
+    document_types = _split_document_types(document_types)
+    if files and not document_types:
+        raise HTTPException(400, "document_types required for uploaded files")
+
+    existing = (
+        db.query(Onboarding.email, Onboarding.aadhar_number)
+        .filter(or_(Onboarding.email == data.email, Onboarding.aadhar_number == data.aadhar_number))
+        .first()
+    )
+    if existing:
+        if existing.email == data.email:
+            raise HTTPException(409, "Email already exists")
+        raise HTTPException(409, "Aadhar already exists")
+
+    staged = stage_uploads(files, UPLOAD_DIR)
+
+    # ---------------- PERSIST ----------------
+    try:
+        onboarding = Onboarding(**data.dict(exclude=CHILD_FIELDS), status="pending")
+        apply_completion(
+            onboarding,
+            checklist_mask(data.checklist)
+            | documents_mask(_document_type_at(document_types, i) for i in range(len(files))),
+        )
+        db.add(onboarding)
+        db.flush()
+
+        def children(model, rows):
+            return insert_children(db, model, "onboarding_id", onboarding.id, rows)
+
+        def single(model, item):
+            return children(model, [item.dict()])[0] if item else None
+
+        document_rows = [
+            {
+                "document_type": _document_type_at(document_types, index),
+                "file_path": item.final_path,
+                "file_name": item.file_name,
+            }
+            for index, item in enumerate(staged)
+        ]
+
+        response = OnboardingResponse.model_validate({
+            **{c.key: getattr(onboarding, c.key) for c in Onboarding.__table__.columns},
+            "documents": children(OnboardingDocument, document_rows),
+            "nominees": children(OnboardingNominee, [n.dict() for n in data.nominees]),
+            "family": children(OnboardingFamily, [f.dict() for f in data.family]),
+            "references": children(OnboardingReference, [r.dict() for r in data.references]),
+            "bank": single(OnboardingBank, data.bank),
+            "checklist": single(OnboardingChecklist, data.checklist),
+            "experience_details": single(OnboardingExperienceDetails, data.experience_details),
+        })
+
+        promote(staged)
+        db.commit()
+    except Exception:
+        db.rollback()
+        discard(staged)
+        raise
+
+    return response
+
+
+# ==========================================================
+# CONVERT JOB APPLICATIONS
+# ==========================================================
+# Application file column -> onboarding document type. Files are linked by
+# path, not copied.
+APPLICATION_DOCUMENTS = {
+    "pan_card_file": "pan_card",
+    "photo_file": "passport_size_photo",
+    "resume_file": "resume",
+}
+
+
+MOBILE_NUMBER_MAX = Onboarding.__table__.c.mobile_number.type.length
+_PHONE_FORMATTING_RE = re.compile(r"[\s().-]")
+
+
+def _mobile_number(application: Application) -> str:
+    # Application.phone is free text and longer than Onboarding.mobile_number
+    number = _PHONE_FORMATTING_RE.sub("", application.phone or "")
+    if not number or len(number) > MOBILE_NUMBER_MAX:
+        raise HTTPException(
+            422, f"Application {application.id}: phone is missing or longer than {MOBILE_NUMBER_MAX} digits"
+        )
+    return number
+
+
+def _convert_applications(db: Session, items: List[BulkApplicationConversionItem]) -> List[dict]:
+    application_ids = [item.application_id for item in items]
+    if len(set(application_ids)) != len(application_ids):
+        raise HTTPException(400, "Duplicate application_id in request")
+
+    applications = {
+        a.id: a
+        for a in db.query(Application).filter(Application.id.in_(application_ids))
+    }
+    missing = [i for i in application_ids if i not in applications]
+    if missing:
+        raise HTTPException(404, f"Applications not found: {missing}")
+
+    mobile_numbers = {i: _mobile_number(applications[i]) for i in application_ids}
+
+    emails = [applications[i].email for i in application_ids]
+    hashes = [aadhar_hash(item.aadhar_number) for item in items]
+    if len(set(emails)) != len(emails) or len(set(hashes)) != len(hashes):
+        raise HTTPException(409, "Duplicate email or Aadhar in request")
+
+    # One query for every kind of conflict with existing onboarding records
+    conflicts = (
+        db.query(Onboarding.application_id, Onboarding.email, Onboarding.aadhar_hash)
+        .filter(or_(
+            Onboarding.application_id.in_(application_ids),
+            Onboarding.email.in_(emails),
+            Onboarding.aadhar_hash.in_(hashes),
+        ))
+        .all()
+    )
+    if conflicts:
+        converted = sorted(c.application_id for c in conflicts if c.application_id in applications)
+        if converted:
+            raise HTTPException(409, f"Applications already converted: {converted}")
+        raise HTTPException(409, "Email or Aadhar already exists")
+
+    onboardings = []
+    for item in items:
+        application = applications[item.application_id]
+        fields = item.dict(exclude={"application_id", "applied_role"})
+
+        onboarding = Onboarding(
+            **fields,
+            application_id=application.id,
+            name=application.full_name,
+            dob=application.date_of_birth,
+            gender=application.gender,
+            mobile_number=mobile_numbers[application.id],
+            email=application.email,
+            applied_role=item.applied_role or application.position_applied,
+            experience_type=(
+                "experienced"
+                if (application.experience_level or "").lower() == "experienced"
+                else "fresher"
+            ),
+            status="pending",
+        )
+        apply_completion(onboarding, documents_mask(
+            doc_type for field, doc_type in APPLICATION_DOCUMENTS.items()
+            if getattr(application, field)
+        ))
+        onboardings.append(onboarding)
+
+    try:
+        db.add_all(onboardings)
+        db.flush()
+
+        document_rows = [
+            {
+                "onboarding_id": onboarding.id,
+                "document_type": doc_type,
+                "file_path": path,
+                "file_name": os.path.basename(path),
+            }
+            for onboarding in onboardings
+            for field, doc_type in APPLICATION_DOCUMENTS.items()
+            if (path := getattr(applications[onboarding.application_id], field))
+        ]
+        if document_rows:
+            db.execute(insert(OnboardingDocument), document_rows)
+
+        created = [
+            {"application_id": onboarding.application_id, "onboarding_id": onboarding.id}
+            for onboarding in onboardings
+        ]
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+
+    return created
+
+
+def _unshared_document_paths(db: Session, onboarding: Onboarding) -> List[str]:
+    # Documents linked from a job application still belong to it.
+    paths = [doc.file_path for doc in onboarding.documents]
+    if not paths:
+        return []
+
+    shared = set()
+    for field in APPLICATION_DOCUMENTS:
+        column = getattr(Application, field)
+        shared.update(path for (path,) in db.query(column).filter(column.in_(paths)))
+
+    return [path for path in paths if path not in shared]
+
+
+@router.post("/from-application/{application_id}", response_model=OnboardingResponse, status_code=201)
+def convert_application(
+    application_id: int,
+    data: ApplicationConversionCreate,
+    db: Session = Depends(get_db),
+    admin=Depends(get_current_admin),
+):
+    item = BulkApplicationConversionItem(**data.dict(), application_id=application_id)
+    created = _convert_applications(db, [item])
+
+    return get_by_id(created[0]["onboarding_id"], db=db, admin=admin)
+
+
+@router.post("/from-applications", response_model=BulkConversionResponse, status_code=201)
+def convert_applications_bulk(
+    data: BulkApplicationConversion,
+    db: Session = Depends(get_db),
+    admin=Depends(get_current_admin),
+):
+    created = _convert_applications(db, data.items)
+    return {"created": len(created), "onboardings": created}
+
+
 # ==========================================================
 #  NOMINEE
 # ==========================================================
@@ -149,6 +428,7 @@ def add_checklist(
         raise HTTPException(status_code=400, detail="Checklist already exists")
 
     onboarding.checklist = OnboardingChecklist(**checklist.dict())
+    apply_completion(onboarding, checklist_mask(onboarding.checklist))
     db.commit()
 
     return {"message": "Checklist added successfully"}
@@ -183,42 +463,57 @@ def add_experience(
 def upload_documents(
     onboarding_id: int,
     document_types: List[str] = Form(...),
-    files: List[UploadFile] = File(...),
+    files: Optional[List[UploadFile]] = File(None),
+    upload_ids: Optional[List[str]] = Form(None),
     db: Session = Depends(get_db),
 ):
     onboarding = db.get(Onboarding, onboarding_id)
     if not onboarding:
         raise HTTPException(status_code=404, detail="Onboarding not found")
 
-    if len(document_types) == 1 and "," in document_types[0]:
-        document_types = [doc.strip() for doc in document_types[0].split(",")]
+    document_types = _split_document_types(document_types)
+    upload_ids = parse_upload_ids(upload_ids)
+    if not files and not upload_ids:
+        raise HTTPException(status_code=400, detail="files or upload_ids required")
+
+    # Validated and written to temp files in parallel; nothing lands in
+    # its final place until the rows are ready to commit. Finalized
+    # resumable uploads follow the files, matching document_types in order.
+    staged = stage_uploads(files or [], UPLOAD_DIR)
+    try:
+        staged += claim_uploads(upload_ids, UPLOAD_DIR)
+    except Exception:
+        discard(staged)
+        raise
 
     uploaded_documents = []
 
-    for index, file in enumerate(files):
-
-        doc_type = document_types[index] if index < len(document_types) else document_types[-1]
+    try:
+        for index, item in enumerate(staged):
 
-        filename = f"{uuid.uuid4()}_{file.filename}"
-        path = os.path.join(UPLOAD_DIR, filename)
+            doc_type = _document_type_at(document_types, index)
 
-        with open(path, "wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
+            document = OnboardingDocument(
+                document_type=doc_type,
+                file_path=item.final_path,
+                file_name=item.file_name
+            )
 
-        document = OnboardingDocument(
-            document_type=doc_type,
-            file_path=path,
-            file_name=file.filename
-        )
+            onboarding.documents.append(document)
 
-        onboarding.documents.append(document)
-
-        uploaded_documents.append({
-            "document_type": doc_type,
-            "file_name": file.filename
-        })
+            uploaded_documents.append({
+                "document_type": doc_type,
+                "file_name": item.file_name
+            })
 
-    db.commit()
+        apply_completion(onboarding, documents_mask(d["document_type"] for d in uploaded_documents))
+        db.flush()
+        promote(staged)
+        db.commit()
+    except Exception:
+        db.rollback()
+        discard(staged)
+        raise
 
     return {
         "message": "All documents uploaded successfully",
@@ -227,19 +522,234 @@ def upload_documents(
     }
 
 # ==========================================================
-# GET ALL
+# STATUS WORKFLOW
+# ==========================================================
+def _transition(db: Session, onboarding_ids: List[int], to_status: str) -> dict:
+    if to_status not in TRANSITIONS:
+        raise HTTPException(400, f"status must be one of {', '.join(STATUSES)}")
+
+    # One guarded UPDATE: rows not in an allowed source status are left alone.
+    result = db.execute(
+        update(Onboarding)
+        .where(
+            Onboarding.id.in_(onboarding_ids),
+            Onboarding.status.in_(allowed_from(to_status)),
+        )
+        .values(status=to_status)
+        .execution_options(synchronize_session=False)
+    )
+    db.commit()
+
+    current = dict(
+        db.query(Onboarding.id, Onboarding.status)
+        .filter(Onboarding.id.in_(onboarding_ids))
+        .all()
+    )
+
+    return {
+        "status": to_status,
+        "updated": result.rowcount,
+        "skipped": [
+            {"id": onboarding_id, "status": status}
+            for onboarding_id, status in current.items()
+            if status != to_status
+        ],
+        "not_found": [i for i in onboarding_ids if i not in current],
+    }
+
+
+@router.post("/status/bulk", response_model=BulkStatusResponse)
+def bulk_update_status(
+    data: BulkStatusUpdate,
+    db: Session = Depends(get_db),
+    admin=Depends(get_current_admin),
+):
+    return _transition(db, list(dict.fromkeys(data.onboarding_ids)), data.status)
+
+
+@router.patch("/{onboarding_id}/status", response_model=BulkStatusResponse)
+def update_status(
+    onboarding_id: int,
+    data: StatusUpdate,
+    db: Session = Depends(get_db),
+    admin=Depends(get_current_admin),
+):
+    result = _transition(db, [onboarding_id], data.status)
+
+    if result["not_found"]:
+        raise HTTPException(404, "Onboarding not found")
+    if not result["updated"]:
+        current = result["skipped"][0]["status"] if result["skipped"] else data.status
+        raise HTTPException(409, f"Cannot move from {current} to {data.status}")
+
+    return result
+
+
+# ==========================================================
+# GET ALL (SUMMARY, PAGINATED)
+# ==========================================================
+def _summary_query(db: Session):
+    document_count = (
+        select(func.count(OnboardingDocument.id))
+        .where(OnboardingDocument.onboarding_id == Onboarding.id)
+        .correlate(Onboarding)
+        .scalar_subquery()
+    )
+
+    return db.query(
+        Onboarding.id,
+        Onboarding.name,
+        Onboarding.email,
+        Onboarding.mobile_number,
+        Onboarding.applied_role,
+        Onboarding.experience_type,
+        Onboarding.status,
+        Onboarding.checklist_mask,
+        Onboarding.checklist_completion,
+        document_count.label("document_count"),
+    )
+
+
+def _summary(row) -> dict:
+    return {
+        "id": row.id,
+        "name": row.name,
+        "email": row.email,
+        "mobile_number": row.mobile_number,
+        "applied_role": row.applied_role,
+        "experience_type": row.experience_type,
+        "status": row.status,
+        "checklist_completion": row.checklist_completion,
+        "missing_items": missing_items(row.checklist_mask, row.experience_type),
+        "document_count": row.document_count,
+    }
+
+
+SUMMARY_SORTS = {
+    "id": Onboarding.id.desc(),
+    "completion": Onboarding.checklist_completion.asc(),
+    "-completion": Onboarding.checklist_completion.desc(),
+}
+
+
+@router.get("/", response_model=PaginatedOnboardingSummary)
+def get_all(
+    page: int = Query(default=1, ge=1),
+    limit: int = Query(default=20, ge=1, le=100),
+    min_completion: Optional[int] = Query(default=None, ge=0, le=100),
+    max_completion: Optional[int] = Query(default=None, ge=0, le=100),
+    missing: Optional[str] = Query(default=None, description="Checklist item that is still missing"),
+    status: Optional[str] = Query(default=None),
+    sort: str = Query(default="id", description="id, completion or -completion"),
+    db: Session = Depends(get_db),
+    admin=Depends(get_current_admin),
+):
+    if sort not in SUMMARY_SORTS:
+        raise HTTPException(400, f"sort must be one of {', '.join(SUMMARY_SORTS)}")
+    if missing is not None and missing not in ITEM_BITS:
+        raise HTTPException(400, f"Unknown checklist item: {missing}")
+
+    # Completion is stored on the onboarding row itself, so filtering and
+    # sorting never touch the child tables.
+    filters = []
+    if status:
+        filters.append(Onboarding.status == status)
+    if min_completion is not None:
+        filters.append(Onboarding.checklist_completion >= min_completion)
+    if max_completion is not None:
+        filters.append(Onboarding.checklist_completion <= max_completion)
+    if missing is not None:
+        filters.append(Onboarding.checklist_mask.op("&")(ITEM_BITS[missing]) == 0)
+
+    rows = (
+        _summary_query(db)
+        .filter(*filters)
+        .order_by(SUMMARY_SORTS[sort], Onboarding.id.desc())
+        .offset((page - 1) * limit)
+        .limit(limit)
+        .all()
+    )
+    data = [_summary(row) for row in rows]
+
+    total = db.query(func.count(Onboarding.id)).filter(*filters).scalar()
+
+    return {"total": total, "page": page, "limit": limit, "data": data}
+
+
+# ==========================================================
+# SEARCH (KEYSET PAGINATED)
 # ==========================================================
-@router.get("/", response_model=List[OnboardingResponse])
-def get_all(db: Session = Depends(get_db),admin=Depends(get_current_admin)):
-    return db.query(Onboarding).options(
-        joinedload(Onboarding.documents),
-        joinedload(Onboarding.nominees),
-        joinedload(Onboarding.family),
-        joinedload(Onboarding.bank),
-        joinedload(Onboarding.references),
-        joinedload(Onboarding.checklist),
-        joinedload(Onboarding.experience_details),
-    ).all()
+@router.get("/search", response_model=OnboardingSearchResponse)
+def search(
+    q: Optional[str] = Query(default=None, min_length=2, description="Name, email or mobile number prefix"),
+    status: Optional[str] = Query(default=None),
+    applied_role: Optional[str] = Query(default=None),
+    aadhar_number: Optional[str] = Query(default=None, description="Full Aadhaar number (exact match)"),
+    aadhar_last4: Optional[str] = Query(default=None, min_length=4, max_length=4),
+    after_id: Optional[int] = Query(default=None, description="Last id of the previous page"),
+    limit: int = Query(default=20, ge=1, le=100),
+    db: Session = Depends(get_db),
+    admin=Depends(get_current_admin),
+):
+    # Every filter is an equality or prefix match on an indexed column.
+    filters = []
+    if q:
+        q = q.strip()
+        if "@" in q:
+            filters.append(Onboarding.email.startswith(q, autoescape=True))
+        elif q.lstrip("+").isdigit():
+            filters.append(Onboarding.mobile_number.startswith(q, autoescape=True))
+        else:
+            filters.append(Onboarding.name.startswith(q, autoescape=True))
+    if status:
+        filters.append(Onboarding.status == status)
+    if applied_role:
+        filters.append(Onboarding.applied_role == applied_role)
+    if aadhar_number:
+        filters.append(Onboarding.aadhar_hash == aadhar_hash(aadhar_number))
+    if aadhar_last4:
+        filters.append(Onboarding.aadhar_last4 == aadhar_last4)
+    if after_id is not None:
+        filters.append(Onboarding.id < after_id)
+
+    rows = (
+        _summary_query(db)
+        .filter(*filters)
+        .order_by(Onboarding.id.desc())
+        .limit(limit)
+        .all()
+    )
+
+    return {
+        "data": [_summary(row) for row in rows],
+        "next_after_id": rows[-1].id if len(rows) == limit else None,
+    }
+
+
+# ==========================================================
+# PAYROLL EXPORT (STREAMING)
+# ==========================================================
+@router.get("/export/payroll")
+def export_payroll(
+    export_format: str = Query(default="csv", alias="format", description="csv or jsonl"),
+    status: str = Query(default=JOINED),
+    admin=Depends(get_current_admin),
+):
+    if status not in STATUSES:
+        raise HTTPException(400, f"status must be one of {', '.join(STATUSES)}")
+
+    if export_format == "csv":
+        body, media_type = stream_csv(status), "text/csv"
+    elif export_format == "jsonl":
+        body, media_type = stream_jsonl(status), "application/x-ndjson"
+    else:
+        raise HTTPException(400, "format must be csv or jsonl")
+
+    return StreamingResponse(
+        body,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="payroll_{status}.{export_format}"'},
+    )
 
 
 # ==========================================================
@@ -248,13 +758,13 @@ def get_all(db: Session = Depends(get_db),admin=Depends(get_current_admin)):
 @router.get("/{onboarding_id}", response_model=OnboardingResponse)
 def get_by_id(onboarding_id: int, db: Session = Depends(get_db),admin=Depends(get_current_admin)):
     onboarding = db.query(Onboarding).options(
-        joinedload(Onboarding.documents),
-        joinedload(Onboarding.nominees),
-        joinedload(Onboarding.family),
-        joinedload(Onboarding.bank),
-        joinedload(Onboarding.references),
-        joinedload(Onboarding.checklist),
-        joinedload(Onboarding.experience_details),
+        selectinload(Onboarding.documents),
+        selectinload(Onboarding.nominees),
+        selectinload(Onboarding.family),
+        selectinload(Onboarding.bank),
+        selectinload(Onboarding.references),
+        selectinload(Onboarding.checklist),
+        selectinload(Onboarding.experience_details),
     ).filter(Onboarding.id == onboarding_id).first()
 
     if not onboarding:
@@ -272,9 +782,8 @@ def delete(onboarding_id: int, db: Session = Depends(get_db),admin=Depends(get_c
     if not onboarding:
         raise HTTPException(status_code=404, detail="Not found")
 
-    for doc in onboarding.documents:
-        if os.path.exists(doc.file_path):
-            os.remove(doc.file_path)
+    for path in _unshared_document_paths(db, onboarding):
+        get_storage().delete(path)
 
     db.delete(onboarding)
     db.commit()
@@ -291,9 +800,8 @@ def delete_by_id(onboarding_id: int, db: Session = Depends(get_db),admin=Depends
     if not onboarding:
         raise HTTPException(status_code=404, detail="Not found")
 
-    for doc in onboarding.documents:
-        if os.path.exists(doc.file_path):
-            os.remove(doc.file_path)
+    for path in _unshared_document_paths(db, onboarding):
+        get_storage().delete(path)
 
     db.delete(onboarding)
     db.commit()
\ No newline at end of file
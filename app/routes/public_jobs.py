@@ -1,9 +1,10 @@
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 from sqlalchemy import or_
 from app.database import get_db
 from app.models.job import Job
-from app.schemas.job import JobResponse, PaginatedJobResponse
+from app.schemas.job import JobResponse, PaginatedJobResponse, SimilarJobResponse
+from app.utils.job_similarity import job_similarity_index, load_similar_jobs
 
 router = APIRouter(prefix="/jobs", tags=["Public Jobs"])
 
@@ -31,6 +32,19 @@ def list_jobs(
     return {"total": total, "page": page, "limit": limit, "data": jobs}
 
 
+@router.get("/{job_id}/similar", response_model=list[SimilarJobResponse])
+def similar_jobs(
+    job_id: int,
+    k: int = Query(default=5, ge=1, le=20),
+    db: Session = Depends(get_db)
+):
+    results = job_similarity_index.similar_to_job(db, job_id, k)
+    if results is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+
+    return load_similar_jobs(db, results)
+
+
 @router.get("/{job_id}", response_model=JobResponse)
 def job_detail(job_id: int, db: Session = Depends(get_db)):
     return db.query(Job).filter(Job.id == job_id, Job.is_active == True).first()
@@ -0,0 +1,155 @@
+import base64
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from starlette.requests import ClientDisconnect
+
+from app.config import settings
+from app.utils.rate_limit import client_ip, rate_limit
+from app.utils.resumable_upload import (
+    append_chunk,
+    create_upload,
+    delete_upload,
+    finalize_upload,
+    get_upload,
+)
+
+router = APIRouter(prefix="/resumable-uploads", tags=["Resumable Uploads"])
+
+TUS_HEADERS = {"Tus-Resumable": "1.0.0"}
+CHUNK_CONTENT_TYPE = "application/offset+octet-stream"
+FLUSH_BYTES = 1024 * 1024
+
+create_rate_limit = rate_limit("resumable-upload", settings.RATE_LIMIT_UPLOAD_CREATE_PER_IP)
+
+
+# =========================================================
+# HELPER — Upload-Metadata ("filename <base64>,...")
+# =========================================================
+def parse_metadata(header: Optional[str]) -> dict:
+    metadata = {}
+    for pair in (header or "").split(","):
+        parts = pair.strip().split(" ", 1)
+        if not parts[0]:
+            continue
+        try:
+            metadata[parts[0]] = base64.b64decode(parts[1]).decode() if len(parts) > 1 else ""
+        except ValueError:
+            raise HTTPException(400, "Invalid Upload-Metadata")
+    return metadata
+
+
+def upload_body(upload) -> dict:
+    return {
+        "upload_id": upload.id,
+        "filename": upload.filename,
+        "length": upload.length,
+        "offset": upload.offset,
+        "finalized": upload.finalized,
+        "expires_at": int(upload.expires_at),
+    }
+
+
+# =========================================================
+# CREATE
+# =========================================================
+@router.post("", status_code=201, dependencies=[Depends(create_rate_limit)])
+def create(
+    request: Request,
+    response: Response,
+    upload_length: int = Header(...),
+    upload_metadata: Optional[str] = Header(None),
+):
+    filename = parse_metadata(upload_metadata).get("filename")
+    if not filename:
+        raise HTTPException(400, "Upload-Metadata must include filename")
+
+    upload = create_upload(filename, upload_length, client_ip(request))
+
+    response.headers.update({
+        **TUS_HEADERS,
+        "Location": f"{router.prefix}/{upload.id}",
+        "Upload-Offset": "0",
+    })
+    return upload_body(upload)
+
+
+# =========================================================
+# OFFSET — HEAD
+# =========================================================
+@router.head("/{upload_id}")
+def offset(upload_id: str):
+    upload = get_upload(upload_id)
+    return Response(headers={
+        **TUS_HEADERS,
+        "Upload-Offset": str(upload.offset),
+        "Upload-Length": str(upload.length),
+        "Cache-Control": "no-store",
+    })
+
+
+# =========================================================
+# STATUS
+# =========================================================
+@router.get("/{upload_id}")
+def status(upload_id: str):
+    return upload_body(get_upload(upload_id))
+
+
+# =========================================================
+# APPEND — PATCH
+# =========================================================
+@router.patch("/{upload_id}")
+async def append(
+    upload_id: str,
+    request: Request,
+    upload_offset: int = Header(...),
+    content_type: Optional[str] = Header(None),
+):
+    if content_type != CHUNK_CONTENT_TYPE:
+        raise HTTPException(415, f"Content-Type must be {CHUNK_CONTENT_TYPE}")
+
+    # Appended as it arrives, so bytes received before a dropped
+    # connection are kept and the client resumes from there.
+    new_offset = upload_offset
+    buffer = bytearray()
+
+    async def flush():
+        nonlocal new_offset
+        if buffer:
+            new_offset = await run_in_threadpool(append_chunk, upload_id, new_offset, bytes(buffer))
+            buffer.clear()
+
+    try:
+        async for chunk in request.stream():
+            buffer.extend(chunk)
+            if len(buffer) >= FLUSH_BYTES:
+                await flush()
+    except ClientDisconnect:
+        await flush()
+        raise
+
+    await flush()
+    if new_offset == upload_offset:
+        # Empty PATCH: still validates the offset
+        new_offset = await run_in_threadpool(append_chunk, upload_id, upload_offset, b"")
+
+    return Response(status_code=204, headers={**TUS_HEADERS, "Upload-Offset": str(new_offset)})
+
+
+# =========================================================
+# FINALIZE
+# =========================================================
+@router.post("/{upload_id}/finalize")
+def finalize(upload_id: str):
+    return upload_body(finalize_upload(upload_id))
+
+
+# =========================================================
+# TERMINATE
+# =========================================================
+@router.delete("/{upload_id}", status_code=204)
+def terminate(upload_id: str):
+    delete_upload(upload_id)
+    return Response(status_code=204, headers=TUS_HEADERS)
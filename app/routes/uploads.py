@@ -0,0 +1,88 @@
+import mimetypes
+import os
+import re
+from typing import Optional
+from urllib.parse import quote
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import RedirectResponse
+
+from app.config import settings
+from app.schemas.files import SignFilesRequest, SignedFile
+from app.utils.file_access import authorized_upload, cache_control, signed_url, upload_key
+from app.utils.file_server import serve_file
+from app.utils.jwt_dependency import get_current_admin
+from app.utils.storage import get_storage
+
+router = APIRouter(tags=["Uploads"])
+
+# Keys with control characters are refused rather than handed to the proxy
+_CONTROL_RE = re.compile(r"[\x00-\x1f\x7f]")
+
+
+def header_location(path: str) -> str:
+    """
+    Percent-quoted path for X-Accel-Redirect / X-Sendfile. Upload names are
+    user-supplied, so spaces, "%", "?" and non-latin-1 characters all occur;
+    nginx and mod_xsendfile (XSendFileUnescape, on by default) decode it.
+    """
+    return quote(path, safe="/")
+
+
+# =========================================================
+# GET — UPLOADED FILE (signed link or public prefix)
+# =========================================================
+@router.get("/uploads/{path:path}", include_in_schema=False)
+async def uploaded_file(
+    request: Request,
+    key: str = Depends(authorized_upload),
+    exp: Optional[int] = Query(None),
+):
+    """
+    FILE_DELIVERY picks who sends the bytes:
+
+    - "direct": the app streams the file (or redirects to object storage)
+    - "x-accel": nginx, via an internal location such as
+          location /protected-uploads/ { internal; alias /srv/app/uploads/; }
+    - "x-sendfile": Apache/lighttpd, via the file's absolute path
+    """
+    if _CONTROL_RE.search(key):
+        raise HTTPException(404, "File not found")
+
+    storage = get_storage()
+    local_path = storage.local_path(key)
+
+    if local_path is None:
+        # Object storage serves the bytes itself
+        return RedirectResponse(storage.url(key))
+
+    media_type = mimetypes.guess_type(key)[0] or "application/octet-stream"
+    headers = {"Cache-Control": cache_control(key, exp)}
+
+    if settings.FILE_DELIVERY == "x-accel":
+        location = settings.X_ACCEL_PREFIX.rstrip("/") + "/" + key[len("uploads/"):]
+        return Response(headers={**headers, "X-Accel-Redirect": header_location(location)}, media_type=media_type)
+
+    if not await run_in_threadpool(os.path.isfile, local_path):
+        raise HTTPException(404, "File not found")
+
+    if settings.FILE_DELIVERY == "x-sendfile":
+        return Response(headers={**headers, "X-Sendfile": header_location(local_path)}, media_type=media_type)
+
+    return await serve_file(
+        request, local_path, headers["Cache-Control"], precompressed=settings.UPLOAD_PRECOMPRESSED
+    )
+
+
+# =========================================================
+# SIGN — ADMIN
+# =========================================================
+@router.post("/admin/files/sign", response_model=list[SignedFile])
+def sign_files(data: SignFilesRequest, admin=Depends(get_current_admin)):
+    signed = []
+    for path in data.paths:
+        key = upload_key(path)
+        url, exp = signed_url(key, data.expires_in)
+        signed.append({"path": key, "url": url, "expires_at": exp})
+    return signed
@@ -1,6 +1,6 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, computed_field
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 
 class CSRBase(BaseModel):
@@ -26,6 +26,22 @@ class CSRUpdate(BaseModel):
 class CSRResponse(CSRBase):
     id: int
     posted_at: datetime
+    variants: Optional[Dict[str, Dict[str, Dict[str, str]]]] = None
+
+    @computed_field
+    @property
+    def srcset(self) -> Dict[str, Dict[str, str]]:
+        # {"image1": {"webp": "a_320w.webp 320w, a_768w.webp 768w"}, ...}
+        return {
+            image: {
+                fmt: ", ".join(
+                    f"{path} {width}w"
+                    for width, path in sorted(widths.items(), key=lambda item: int(item[0]))
+                )
+                for fmt, widths in formats.items()
+            }
+            for image, formats in (self.variants or {}).items()
+        }
 
     class Config:
         from_attributes = True
\ No newline at end of file
@@ -0,0 +1,13 @@
+from typing import List, Optional
+from pydantic import BaseModel, Field
+
+
+class SignFilesRequest(BaseModel):
+    paths: List[str] = Field(..., min_length=1, max_length=500)
+    expires_in: Optional[int] = Field(default=None, ge=60, le=7 * 24 * 3600)
+
+
+class SignedFile(BaseModel):
+    path: str
+    url: str
+    expires_at: int
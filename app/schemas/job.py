@@ -61,3 +61,8 @@ class PaginatedJobResponse(BaseModel):
     page: int
     limit: int
     data: List[JobResponse]
+
+
+class SimilarJobResponse(BaseModel):
+    score: float
+    job: JobResponse
@@ -58,7 +58,17 @@ class ApplicationResponse(BaseModel):
 
     status: str
     created_at: datetime
+    duplicate_of: Optional[int] = None
 
     # ONLY DB RELATIONSHIPS
     educations: List[EducationResponse] = []
     experiences: List[ExperienceResponse] = []
+
+    # Only set when listing with sort=match
+    match_score: Optional[float] = None
+
+
+# ---------- DUPLICATES ----------
+class DuplicateClusterResponse(BaseModel):
+    application_ids: List[int]
+    size: int
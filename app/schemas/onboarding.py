@@ -1,4 +1,4 @@
-from pydantic import BaseModel, EmailStr, field_validator, model_validator
+from pydantic import BaseModel, EmailStr, Field, field_validator, model_validator
 from datetime import date, datetime
 from typing import List, Optional
 
@@ -163,14 +163,20 @@ class OnboardingCreate(BaseModel):
     applied_role: str
     experience_type: str
     
-
-    documents: Optional[List[DocumentCreate]] = []
+    # Documents are uploaded as files alongside the payload, not listed here
     nominees: List[NomineeCreate]
     family: List[FamilyCreate]
     bank: BankCreate
     references: List[ReferenceCreate]
     checklist: ChecklistCreate
     experience_details: Optional[ExperienceDetailsCreate] = None
+
+    @model_validator(mode="before")
+    @classmethod
+    def reject_documents(cls, data):
+        if isinstance(data, dict) and data.get("documents"):
+            raise ValueError("documents must be uploaded as files with document_types")
+        return data
     
     @model_validator(mode="after")
     def validate_experienced_fields(self):
@@ -203,6 +209,7 @@ class OnboardingResponse(BaseModel):
     applied_role: str
     experience_type: str
     status: str
+    checklist_completion: int = 0
     
     documents: Optional[List[DocumentResponse]] = []
     nominees: List[NomineeResponse] = []
@@ -213,4 +220,80 @@ class OnboardingResponse(BaseModel):
     experience_details: Optional[ExperienceDetailsResponse] = None
     
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+# -------- Listing Summary --------
+class OnboardingSummary(BaseModel):
+    id: int
+    name: str
+    email: str
+    mobile_number: str
+    applied_role: str
+    experience_type: str
+    status: str
+    checklist_completion: int  # percent of required checklist items
+    missing_items: List[str] = []
+    document_count: int
+
+class PaginatedOnboardingSummary(BaseModel):
+    total: int
+    page: int
+    limit: int
+    data: List[OnboardingSummary]
+
+class OnboardingSearchResponse(BaseModel):
+    data: List[OnboardingSummary]
+    next_after_id: Optional[int] = None
+
+
+# -------- Status Workflow --------
+class StatusUpdate(BaseModel):
+    status: str
+
+class BulkStatusUpdate(BaseModel):
+    onboarding_ids: List[int] = Field(..., min_length=1, max_length=5000)
+    status: str
+
+class SkippedTransition(BaseModel):
+    id: int
+    status: str
+
+class BulkStatusResponse(BaseModel):
+    status: str
+    updated: int
+    skipped: List[SkippedTransition] = []
+    not_found: List[int] = []
+
+
+# -------- Conversion From Job Application --------
+# Fields a job application does not collect; the rest is copied from it.
+class ApplicationConversionCreate(BaseModel):
+    aadhar_number: str
+    communication_address: str
+    permanent_address: str
+    emergency_contact1: str
+    emergency_contact2: Optional[str] = None
+    marital_status: Optional[str] = None
+    father_name: Optional[str] = None
+    mother_name: Optional[str] = None
+    spouse_name: Optional[str] = None
+    landline_number: Optional[str] = None
+    blood_group: Optional[str] = None
+    education_qualification: Optional[str] = None
+    driving_license: Optional[str] = None
+    vehicle_number: Optional[str] = None
+    applied_role: Optional[str] = None  # defaults to the position applied for
+
+class BulkApplicationConversionItem(ApplicationConversionCreate):
+    application_id: int
+
+class BulkApplicationConversion(BaseModel):
+    items: List[BulkApplicationConversionItem] = Field(..., min_length=1, max_length=500)
+
+class ConvertedApplication(BaseModel):
+    application_id: int
+    onboarding_id: int
+
+class BulkConversionResponse(BaseModel):
+    created: int
+    onboardings: List[ConvertedApplication]
@@ -0,0 +1,25 @@
+import hashlib
+import hmac
+import re
+from typing import Optional
+
+from app.config import settings
+
+_NON_DIGIT_RE = re.compile(r"\D")
+
+
+def normalize_aadhar(aadhar_number: Optional[str]) -> str:
+    return _NON_DIGIT_RE.sub("", aadhar_number or "")
+
+
+def aadhar_hash(aadhar_number: Optional[str]) -> Optional[str]:
+    """Keyed hash for exact-match lookups without indexing the raw number."""
+    digits = normalize_aadhar(aadhar_number)
+    if not digits:
+        return None
+    return hmac.new(settings.SECRET_KEY.encode("utf-8"), digits.encode("utf-8"), hashlib.sha256).hexdigest()
+
+
+def aadhar_last4(aadhar_number: Optional[str]) -> Optional[str]:
+    digits = normalize_aadhar(aadhar_number)
+    return digits[-4:] or None
@@ -0,0 +1,107 @@
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional
+
+from jose import jwt
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.models.admin import Admin
+
+TOKEN_CACHE_SIZE = 10_000
+PRINCIPAL_CACHE_SIZE = 1_000
+
+
+@dataclass(frozen=True)
+class AdminPrincipal:
+    """What authenticated routes get from get_current_admin; not an ORM object."""
+    id: int
+    email: str
+    is_active: bool
+    token_version: int
+
+
+class _ExpiringLRU:
+    """Thread-safe LRU whose entries each carry their own expiry timestamp."""
+
+    def __init__(self, size: int):
+        self.size = size
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at <= time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value, expires_at: float):
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.size:
+                self._entries.popitem(last=False)
+
+    def discard_where(self, predicate):
+        with self._lock:
+            for key in [k for k, (v, _) in self._entries.items() if predicate(k, v)]:
+                del self._entries[key]
+
+
+# token -> verified claims, until the token's own exp
+_tokens = _ExpiringLRU(TOKEN_CACHE_SIZE)
+# email -> AdminPrincipal, for ADMIN_CACHE_TTL_SECONDS
+_principals = _ExpiringLRU(PRINCIPAL_CACHE_SIZE)
+
+
+def verify_token(token: str) -> dict:
+    """Decode and verify a JWT once; repeat requests with the same token skip the HMAC."""
+    claims = _tokens.get(token)
+    if claims is not None:
+        return claims
+
+    # Raises JWTError (including expiry) for bad tokens, which are not cached
+    claims = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+    _tokens.set(token, claims, float(claims.get("exp", 0)))
+    return claims
+
+
+def load_principal(db: Session, email: str) -> Optional[AdminPrincipal]:
+    principal = _principals.get(email)
+    if principal is not None:
+        return principal
+
+    row = (
+        db.query(Admin.id, Admin.email, Admin.is_active, Admin.token_version)
+        .filter(Admin.email == email)
+        .first()
+    )
+    if not row:
+        return None
+
+    principal = AdminPrincipal(
+        id=row.id,
+        email=row.email,
+        is_active=bool(row.is_active),
+        token_version=row.token_version or 0,
+    )
+    _principals.set(email, principal, time.time() + settings.ADMIN_CACHE_TTL_SECONDS)
+    return principal
+
+
+def invalidate_admin(email: str):
+    """
+    Forget cached state for an admin after a password change, reset or
+    deactivation. Other worker processes notice within ADMIN_CACHE_TTL_SECONDS,
+    when their principal entry expires and the new token_version is read.
+    """
+    _principals.discard_where(lambda key, _: key == email)
+    _tokens.discard_where(lambda _, claims: claims.get("sub") == email)
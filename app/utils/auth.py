@@ -6,7 +6,7 @@ from app.config import settings
 
 def hash_password(password: str) -> str:
     pw_bytes = password.encode("utf-8")[:72]
-    return bcrypt.hashpw(pw_bytes, bcrypt.gensalt()).decode("utf-8")
+    return bcrypt.hashpw(pw_bytes, bcrypt.gensalt(rounds=settings.BCRYPT_ROUNDS)).decode("utf-8")
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -14,6 +14,14 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return bcrypt.checkpw(pw_bytes, hashed_password.encode("utf-8"))
 
 
+def needs_rehash(hashed_password: str) -> bool:
+    """True when a stored hash ("$2b$<cost>$...") uses a cost other than BCRYPT_ROUNDS."""
+    try:
+        return int(hashed_password.split("$")[2]) != settings.BCRYPT_ROUNDS
+    except (IndexError, ValueError):
+        return True
+
+
 def create_access_token(data: dict):
     to_encode = data.copy()
     expire = datetime.utcnow() + timedelta(
@@ -0,0 +1,36 @@
+from typing import List
+
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+
+def insert_children(db: Session, model, parent_key: str, parent_id: int, rows: List[dict]) -> List[dict]:
+    """
+    Insert child rows of one parent in a single statement and return them with ids.
+
+    Dialects with RETURNING for executemany (PostgreSQL, MariaDB, SQLite) get
+    the ids back from the INSERT itself via insertmanyvalues; MySQL gets one
+    multi-row INSERT followed by one SELECT of the parent's children. Rows
+    come back in no guaranteed order.
+    """
+    if not rows:
+        return []
+
+    values = [{**row, parent_key: parent_id} for row in rows]
+    table = model.__table__
+    dialect = db.get_bind().dialect
+
+    # No sort_by_parameter_order: without a sentinel column SQLAlchemy would
+    # fall back to one INSERT per row to guarantee the order, and callers
+    # do not depend on it.
+    if getattr(dialect, "insert_executemany_returning", False):
+        result = db.execute(insert(model).returning(*table.c), values)
+        return [dict(row._mapping) for row in result]
+
+    db.execute(insert(model), values)
+    result = db.execute(
+        table.select()
+        .where(table.c[parent_key] == parent_id)
+        .order_by(table.c.id)
+    )
+    return [dict(row._mapping) for row in result]
@@ -1,18 +1,19 @@
-import os
 from uuid import uuid4
-from fastapi import UploadFile
+from fastapi import HTTPException, UploadFile
+
+from app.utils.storage import get_storage
 
 UPLOAD_DIR = "uploads/csr"
+ALLOWED_EXTENSIONS = {"jpg", "jpeg", "png", "gif", "webp"}
 
 
 def save_image(file: UploadFile) -> str:
-    os.makedirs(UPLOAD_DIR, exist_ok=True)
-
-    ext = file.filename.split(".")[-1]
+    ext = (file.filename or "").rsplit(".", 1)[-1].lower()
+    if ext not in ALLOWED_EXTENSIONS:
+        raise HTTPException(status_code=400, detail="Invalid image format")
     filename = f"{uuid4().hex}.{ext}"
-    path = os.path.join(UPLOAD_DIR, filename)
+    key = f"{UPLOAD_DIR}/{filename}"
 
-    with open(path, "wb") as buffer:
-        buffer.write(file.file.read())
+    get_storage().save(key, file.file)
 
-    return path.replace("\\", "/")
\ No newline at end of file
+    return key
\ No newline at end of file
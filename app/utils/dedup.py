@@ -0,0 +1,207 @@
+import re
+from difflib import SequenceMatcher
+from typing import Dict, List, Optional
+
+from sqlalchemy import func, or_, update
+from sqlalchemy.orm import Session
+
+from app.models.jobapplication import Application
+
+# Names within a block are compared after sorting by name, each against the
+# next few neighbours only (sorted-neighbourhood), so large blocks stay linear.
+NEIGHBOUR_WINDOW = 10
+DEFAULT_NAME_THRESHOLD = 0.85
+BACKFILL_BATCH_SIZE = 1000
+
+_NON_DIGIT_RE = re.compile(r"\D")
+_NON_ALNUM_RE = re.compile(r"[^A-Z0-9]")
+_NON_ALPHA_RE = re.compile(r"[^a-z ]")
+_GMAIL_DOMAINS = {"gmail.com", "googlemail.com"}
+
+
+# =========================================================
+# NORMALIZATION
+# =========================================================
+def normalize_email(email: Optional[str]) -> Optional[str]:
+    if not email or "@" not in email:
+        return None
+
+    local, _, domain = email.strip().lower().rpartition("@")
+    local = local.split("+", 1)[0]
+    if domain in _GMAIL_DOMAINS:
+        local = local.replace(".", "")
+        domain = "gmail.com"
+
+    return f"{local}@{domain}" if local else None
+
+
+def normalize_phone(phone: Optional[str]) -> Optional[str]:
+    digits = _NON_DIGIT_RE.sub("", phone or "")
+    # Drop +91 / 0 prefixes; Indian mobile numbers are the last 10 digits.
+    digits = digits[-10:]
+    return digits if len(digits) >= 7 else None
+
+
+def normalize_pan(pan: Optional[str]) -> Optional[str]:
+    pan = _NON_ALNUM_RE.sub("", (pan or "").upper())
+    return pan or None
+
+
+def normalize_name(name: Optional[str]) -> str:
+    tokens = _NON_ALPHA_RE.sub(" ", (name or "").lower()).split()
+    return " ".join(sorted(tokens))
+
+
+def name_similarity(a: str, b: str) -> float:
+    return SequenceMatcher(None, a, b).ratio()
+
+
+def set_blocking_keys(application: Application):
+    application.email_key = normalize_email(application.email)
+    application.phone_key = normalize_phone(application.phone)
+    application.pan_key = normalize_pan(application.pan_number)
+    application.blocking_keys_set = True
+
+
+# =========================================================
+# SUBMIT-TIME EXACT MATCH
+# =========================================================
+def find_exact_duplicate(db: Session, application: Application) -> Optional[int]:
+    """Earliest application sharing a normalized email, phone or PAN (index lookups only)."""
+    conditions = []
+    if application.email_key:
+        conditions.append(Application.email_key == application.email_key)
+    if application.phone_key:
+        conditions.append(Application.phone_key == application.phone_key)
+    if application.pan_key:
+        conditions.append(Application.pan_key == application.pan_key)
+
+    if not conditions:
+        return None
+
+    row = (
+        db.query(Application.id, Application.duplicate_of)
+        .filter(or_(*conditions))
+        .order_by(Application.id)
+        .first()
+    )
+    if not row:
+        return None
+
+    return row.duplicate_of or row.id
+
+
+# =========================================================
+# BATCH NEAR-DUPLICATE CLUSTERING
+# =========================================================
+def backfill_blocking_keys(db: Session) -> int:
+    """
+    Populate keys for rows submitted before the columns existed. Rows are
+    flagged as done even when every key normalizes to None, so each row is
+    scanned once. Run from scripts/dedup_applicants.py, not per request.
+    """
+    updated = 0
+    last_id = 0
+
+    while True:
+        rows = (
+            db.query(Application.id, Application.email, Application.phone, Application.pan_number)
+            .filter(Application.id > last_id, Application.blocking_keys_set.is_(False))
+            .order_by(Application.id)
+            .limit(BACKFILL_BATCH_SIZE)
+            .all()
+        )
+        if not rows:
+            break
+
+        db.execute(
+            update(Application),
+            [
+                {
+                    "id": row.id,
+                    "email_key": normalize_email(row.email),
+                    "phone_key": normalize_phone(row.phone),
+                    "pan_key": normalize_pan(row.pan_number),
+                    "blocking_keys_set": True,
+                }
+                for row in rows
+            ],
+        )
+        db.commit()
+
+        updated += len(rows)
+        last_id = rows[-1].id
+
+    return updated
+
+
+class _UnionFind:
+    def __init__(self):
+        self.parent: Dict[int, int] = {}
+
+    def find(self, x: int) -> int:
+        self.parent.setdefault(x, x)
+        while self.parent[x] != x:
+            self.parent[x] = self.parent[self.parent[x]]
+            x = self.parent[x]
+        return x
+
+    def union(self, a: int, b: int):
+        ra, rb = self.find(a), self.find(b)
+        if ra != rb:
+            self.parent[max(ra, rb)] = min(ra, rb)
+
+
+def _blocks(db: Session, column) -> Dict[object, List[tuple]]:
+    """Rows grouped by a blocking column, only for keys shared by 2+ applications."""
+    shared = (
+        db.query(column)
+        .filter(column.isnot(None))
+        .group_by(column)
+        .having(func.count(Application.id) > 1)
+        .subquery()
+    )
+    rows = (
+        db.query(column, Application.id, Application.full_name)
+        .join(shared, column == shared.c[0])
+        .order_by(column)
+        .yield_per(BACKFILL_BATCH_SIZE)
+    )
+
+    blocks: Dict[object, List[tuple]] = {}
+    for key, app_id, full_name in rows:
+        blocks.setdefault(key, []).append((app_id, normalize_name(full_name)))
+    return blocks
+
+
+def cluster_duplicates(db: Session, threshold: float = DEFAULT_NAME_THRESHOLD) -> List[List[int]]:
+    """
+    Cluster likely duplicate applications.
+
+    Same PAN always links two applications; same email, phone or date of
+    birth links them only when the names are similar enough. Read-only:
+    rows from before the key columns need backfill_blocking_keys() first.
+    """
+    uf = _UnionFind()
+
+    for members in _blocks(db, Application.pan_key).values():
+        first = members[0][0]
+        for app_id, _ in members[1:]:
+            uf.union(first, app_id)
+
+    for column in (Application.email_key, Application.phone_key, Application.date_of_birth):
+        for members in _blocks(db, column).values():
+            members.sort(key=lambda m: m[1])
+            for i, (app_id, name) in enumerate(members):
+                for other_id, other_name in members[i + 1:i + 1 + NEIGHBOUR_WINDOW]:
+                    if name_similarity(name, other_name) >= threshold:
+                        uf.union(app_id, other_id)
+
+    clusters: Dict[int, List[int]] = {}
+    for app_id in list(uf.parent):
+        clusters.setdefault(uf.find(app_id), []).append(app_id)
+
+    return sorted(
+        (sorted(ids) for ids in clusters.values() if len(ids) > 1),
+        key=lambda ids: ids[0],
+    )
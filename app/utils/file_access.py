@@ -0,0 +1,90 @@
+import base64
+import hashlib
+import hmac
+import posixpath
+import time
+from typing import Optional, Tuple
+from urllib.parse import quote
+
+from fastapi import HTTPException, Query
+
+from app.config import settings
+from app.utils.file_server import IMMUTABLE_MAX_AGE, is_content_named
+
+
+def upload_key(path: str) -> str:
+    """Normalize a requested path to an "uploads/..." storage key."""
+    if path.startswith("uploads/"):
+        path = path[len("uploads/"):]
+
+    path = posixpath.normpath("/" + path).lstrip("/")
+    if not path or path == ".":
+        raise HTTPException(404, "File not found")
+
+    return f"uploads/{path}"
+
+
+def is_public(key: str) -> bool:
+    return any(key.startswith(prefix) for prefix in settings.PUBLIC_UPLOAD_PREFIXES)
+
+
+def cache_control(key: str, exp: Optional[int]) -> str:
+    # Signed links are cached by the browser only, and no longer than they are valid
+    if is_public(key):
+        scope, max_age = "public", IMMUTABLE_MAX_AGE
+    else:
+        scope, max_age = "private", max(0, min(IMMUTABLE_MAX_AGE, (exp or 0) - int(time.time())))
+
+    if is_content_named(key):
+        return f"{scope}, max-age={max_age}, immutable"
+    return f"{scope}, no-cache"
+
+
+def _signature(key: str, exp: int) -> str:
+    digest = hmac.new(settings.SECRET_KEY.encode(), f"{key}:{exp}".encode(), hashlib.sha256).digest()
+    return base64.urlsafe_b64encode(digest).rstrip(b"=").decode()
+
+
+def sign(key: str, expires_in: Optional[int] = None) -> Tuple[int, str]:
+    """
+    Expiry rounded up to the next multiple of UPLOAD_URL_EXPIRE_SECONDS, so
+    every link to a file signed within one window is the same URL and
+    browser/CDN caches keyed on it get hits. A link stays valid for at
+    least expires_in and at most one window longer.
+    """
+    bucket = settings.UPLOAD_URL_EXPIRE_SECONDS
+    exp = int(time.time()) + (expires_in or bucket)
+    exp = -(-exp // bucket) * bucket
+    return exp, _signature(key, exp)
+
+
+def signed_url(key: str, expires_in: Optional[int] = None) -> Tuple[str, int]:
+    """Relative "/uploads/...?exp=&sig=" URL for a stored path, and its expiry."""
+    exp, sig = sign(key, expires_in)
+    return f"/{quote(key)}?exp={exp}&sig={sig}", exp
+
+
+def verify(key: str, exp: int, sig: str) -> bool:
+    if exp < time.time():
+        return False
+    return hmac.compare_digest(_signature(key, exp), sig)
+
+
+def authorized_upload(
+    path: str,
+    exp: Optional[int] = Query(None),
+    sig: Optional[str] = Query(None),
+) -> str:
+    """
+    Dependency for routes with a {path:path} parameter: returns the storage
+    key if it is public or the link carries a valid, unexpired signature.
+    No database or storage access.
+    """
+    key = upload_key(path)
+    if is_public(key):
+        return key
+
+    if exp is None or sig is None or not verify(key, exp, sig):
+        raise HTTPException(403, "Invalid or expired link")
+
+    return key
@@ -0,0 +1,60 @@
+import logging
+import posixpath
+from typing import Iterable, List, Tuple
+
+from app.utils.storage import get_storage
+
+logger = logging.getLogger(__name__)
+
+
+def keys_under(paths: Iterable[str], prefix: str) -> List[str]:
+    """
+    Normalized keys that lie inside prefix. Stored paths can be edited by
+    admins, so anything absolute, escaping with "..", or elsewhere is dropped.
+    """
+    prefix = posixpath.normpath(prefix).rstrip("/") + "/"
+    keys = []
+    for path in paths:
+        if not path:
+            continue
+        # normpath folds every inner ".."; a leading one fails the prefix test
+        key = posixpath.normpath(path)
+        if key.startswith(prefix) and "\\" not in key:
+            keys.append(key)
+        else:
+            logger.warning("Not removing %r: outside %s", path, prefix)
+    return keys
+
+
+def existing_files(paths: Iterable[str]) -> Tuple[list, int]:
+    """Deduplicated paths that exist in storage, and their total size in bytes."""
+    storage = get_storage()
+    files, total = [], 0
+    for path in dict.fromkeys(p for p in paths if p):
+        info = storage.info(path)
+        if info is None:
+            continue
+        files.append(path)
+        total += info.size
+    return files, total
+
+
+def remove_files(paths: Iterable[str]) -> Tuple[int, int]:
+    """Delete files, ignoring ones already gone. Returns (files removed, bytes freed)."""
+    storage = get_storage()
+    removed, freed = 0, 0
+    for path in paths:
+        try:
+            info = storage.info(path)
+            if info is None:
+                continue
+            storage.delete(path)
+        except Exception as e:
+            # OSError locally, botocore ClientError on S3: skip the file, keep going
+            logger.warning("Could not remove %s: %s", path, e)
+            continue
+        removed += 1
+        freed += info.size
+
+    logger.info("Removed %d files (%d bytes)", removed, freed)
+    return removed, freed
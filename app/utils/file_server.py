@@ -0,0 +1,177 @@
+import hashlib
+import mimetypes
+import os
+import re
+import threading
+from collections import OrderedDict
+from email.utils import formatdate
+from typing import Iterator, Optional, Tuple
+
+from fastapi import Request, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+
+CHUNK_SIZE = 64 * 1024
+ETAG_CACHE_SIZE = 4096
+IMMUTABLE_MAX_AGE = 365 * 24 * 3600
+
+# Names produced by the upload helpers: uuid4() / uuid4().hex prefixes
+_CONTENT_NAMED_RE = re.compile(r"^[0-9a-f]{8}-?[0-9a-f]{4}-?[0-9a-f]{4}-?[0-9a-f]{4}-?[0-9a-f]{12}")
+_RANGE_RE = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+# Precompressed siblings ("x.svg.br"), in order of preference
+ENCODINGS = [("br", ".br"), ("gzip", ".gz")]
+
+
+class _ETagCache:
+    """Content hashes keyed by (path, mtime, size), least recently used evicted."""
+
+    def __init__(self, size: int):
+        self.size = size
+        self._entries: "OrderedDict[tuple, str]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, path: str, stat: os.stat_result) -> str:
+        key = (path, stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            etag = self._entries.get(key)
+            if etag is not None:
+                self._entries.move_to_end(key)
+                return etag
+
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+                digest.update(chunk)
+        etag = f'"{digest.hexdigest()[:32]}"'
+
+        with self._lock:
+            self._entries[key] = etag
+            if len(self._entries) > self.size:
+                self._entries.popitem(last=False)
+        return etag
+
+
+etag_cache = _ETagCache(ETAG_CACHE_SIZE)
+
+
+def is_content_named(path: str) -> bool:
+    """UUID-named uploads are never rewritten in place, so they can be cached forever."""
+    return bool(_CONTENT_NAMED_RE.match(os.path.basename(path)))
+
+
+def _etag_matches(header: str, etag: str) -> bool:
+    if header.strip() == "*":
+        return True
+    # If-None-Match uses weak comparison
+    return any(tag.strip().removeprefix("W/") == etag for tag in header.split(","))
+
+
+def parse_range(header: str, size: int) -> Optional[Tuple[int, int]]:
+    """
+    Inclusive (start, end) for a single "bytes=" range; None to ignore the
+    header (multiple or malformed ranges get the full file). Raises
+    ValueError when the range cannot be satisfied.
+    """
+    match = _RANGE_RE.match(header.strip())
+    if not match:
+        return None
+
+    first, last = match.groups()
+    if not first and not last:
+        return None
+
+    if not first:
+        # Suffix range: the last N bytes
+        length = int(last)
+        if length == 0:
+            raise ValueError("empty suffix range")
+        return max(0, size - length), size - 1
+
+    start = int(first)
+    if last and int(last) < start:
+        return None
+    if start >= size:
+        raise ValueError("range not satisfiable")
+    return start, min(int(last), size - 1) if last else size - 1
+
+
+def _read(path: str, start: int, length: int) -> Iterator[bytes]:
+    with open(path, "rb") as f:
+        f.seek(start)
+        while length > 0:
+            chunk = f.read(min(CHUNK_SIZE, length))
+            if not chunk:
+                break
+            length -= len(chunk)
+            yield chunk
+
+
+def _pick_encoding(request: Request, path: str) -> Tuple[str, Optional[str]]:
+    accepted = request.headers.get("accept-encoding", "")
+    for encoding, suffix in ENCODINGS:
+        if encoding in accepted and os.path.isfile(path + suffix):
+            return path + suffix, encoding
+    return path, None
+
+
+async def serve_file(
+    request: Request,
+    path: str,
+    cache_control: str,
+    precompressed: bool = False,
+) -> Response:
+    """
+    Send a local file with a strong content-hash ETag, conditional GET
+    (If-None-Match -> 304) and single byte-range support (Range/If-Range ->
+    206/416). With precompressed, a ".br"/".gz" sibling is preferred when the
+    client accepts it.
+    """
+    media_type = mimetypes.guess_type(path)[0] or "application/octet-stream"
+
+    encoding = None
+    if precompressed:
+        path, encoding = await run_in_threadpool(_pick_encoding, request, path)
+
+    stat = await run_in_threadpool(os.stat, path)
+    etag = await run_in_threadpool(etag_cache.get, path, stat)
+
+    headers = {
+        "ETag": etag,
+        "Cache-Control": cache_control,
+        "Last-Modified": formatdate(stat.st_mtime, usegmt=True),
+        "Accept-Ranges": "bytes",
+    }
+    if precompressed:
+        headers["Vary"] = "Accept-Encoding"
+    if encoding:
+        headers["Content-Encoding"] = encoding
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and _etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+
+    size = stat.st_size
+    byte_range = None
+    range_header = request.headers.get("range")
+    if_range = request.headers.get("if-range")
+
+    # If-Range with a stale validator means "send the whole new file"
+    if range_header and (not if_range or if_range.strip() == etag):
+        try:
+            byte_range = parse_range(range_header, size)
+        except ValueError:
+            headers["Content-Range"] = f"bytes */{size}"
+            return Response(status_code=416, headers=headers)
+
+    if byte_range is None:
+        headers["Content-Length"] = str(size)
+        return StreamingResponse(_read(path, 0, size), media_type=media_type, headers=headers)
+
+    start, end = byte_range
+    length = end - start + 1
+    headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+    headers["Content-Length"] = str(length)
+    return StreamingResponse(
+        _read(path, start, length), status_code=206, media_type=media_type, headers=headers
+    )
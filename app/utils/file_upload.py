@@ -1,15 +1,32 @@
 import os
+import re
 import uuid
 from fastapi import UploadFile
 
-def save_upload_file(upload_dir: str, file: UploadFile) -> str:
-    os.makedirs(upload_dir, exist_ok=True)
+from app.utils.storage import get_storage
+
+MAX_NAME_LENGTH = 100
+_UNSAFE_NAME_RE = re.compile(r"[^A-Za-z0-9._-]+")
+
+
+def safe_filename(filename: str) -> str:
+    """
+    Client filename reduced to a single path component of letters, digits,
+    ".", "_" and "-", fit to appear in a storage key.
+    """
+    name = (filename or "").replace("\\", "/").rsplit("/", 1)[-1]
+    name = _UNSAFE_NAME_RE.sub("_", name).lstrip(".")
 
-    filename = f"{uuid.uuid4()}_{file.filename}"
-    path = os.path.join(upload_dir, filename)
+    stem, ext = os.path.splitext(name)
+    name = stem[:MAX_NAME_LENGTH - len(ext)] + ext[:MAX_NAME_LENGTH]
+    return name or "file"
+
+
+def save_upload_file(upload_dir: str, file: UploadFile) -> str:
+    filename = f"{uuid.uuid4()}_{safe_filename(file.filename)}"
+    key = f"{upload_dir}/{filename}"
 
-    with open(path, "wb") as f:
-        f.write(file.file.read())
+    get_storage().save(key, file.file)
 
-    # return URL-safe path
-    return path.replace("\\", "/")
+    # stored path doubles as the storage key
+    return key
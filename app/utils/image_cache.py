@@ -0,0 +1,127 @@
+import asyncio
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, Optional
+
+from app.config import settings
+
+
+class DiskLRUCache:
+    """
+    Size-bounded directory of generated files, evicted least recently used.
+
+    Recency is tracked in memory and seeded from file mtimes when the cache
+    is first touched, so a restart keeps the warm set. Concurrent misses for
+    the same key share one build (single-flight).
+    """
+
+    def __init__(self, directory: str, max_bytes: int):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, int]" = OrderedDict()
+        self._total = 0
+        self._loaded = False
+        self._lock = threading.Lock()
+        self._inflight: Dict[str, asyncio.Future] = {}
+
+    def _load(self):
+        os.makedirs(self.directory, exist_ok=True)
+        files = []
+        with os.scandir(self.directory) as it:
+            for entry in it:
+                if not entry.is_file():
+                    continue
+                if entry.name.endswith(".part"):
+                    os.remove(entry.path)
+                    continue
+                stat = entry.stat()
+                files.append((stat.st_mtime, entry.name, stat.st_size))
+
+        for _, name, size in sorted(files):
+            self._entries[name] = size
+            self._total += size
+        self._loaded = True
+
+    def path_for(self, name: str) -> str:
+        return os.path.join(self.directory, name)
+
+    def get(self, name: str) -> Optional[str]:
+        with self._lock:
+            if not self._loaded:
+                self._load()
+            if name not in self._entries:
+                return None
+            self._entries.move_to_end(name)
+
+        path = self.path_for(name)
+        if not os.path.isfile(path):
+            self._forget(name)
+            return None
+        return path
+
+    def _forget(self, name: str):
+        with self._lock:
+            size = self._entries.pop(name, None)
+            if size is not None:
+                self._total -= size
+
+    def add(self, name: str):
+        path = self.path_for(name)
+        size = os.path.getsize(path)
+
+        evicted = []
+        with self._lock:
+            self._total -= self._entries.pop(name, 0)
+            self._entries[name] = size
+            self._total += size
+
+            while self._total > self.max_bytes and len(self._entries) > 1:
+                old, old_size = self._entries.popitem(last=False)
+                self._total -= old_size
+                evicted.append(old)
+
+        for old in evicted:
+            try:
+                os.remove(self.path_for(old))
+            except FileNotFoundError:
+                pass
+
+    async def get_or_build(self, name: str, build: Callable[[str], Awaitable[None]]) -> str:
+        """
+        Return the cached file for name, running build(path) once on a miss.
+
+        Callers that miss while a build is running await the same result
+        instead of starting another one.
+        """
+        path = self.get(name)
+        if path:
+            return path
+
+        pending = self._inflight.get(name)
+        if pending is not None:
+            return await asyncio.shield(pending)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[name] = future
+        try:
+            path = self.path_for(name)
+            await build(path)
+            self.add(name)
+            future.set_result(path)
+            return path
+        except BaseException as exc:
+            future.set_exception(exc)
+            # Retrieved here so a miss with no waiters does not log "never retrieved"
+            future.exception()
+            raise
+        finally:
+            del self._inflight[name]
+
+
+def cache_key(*parts) -> str:
+    return hashlib.sha256(":".join(str(p) for p in parts).encode()).hexdigest()
+
+
+image_cache = DiskLRUCache(settings.IMAGE_CACHE_DIR, settings.IMAGE_CACHE_MAX_BYTES)
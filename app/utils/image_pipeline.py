@@ -0,0 +1,141 @@
+import asyncio
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional
+
+from PIL import Image, ImageOps
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Widths of the responsive variants generated for every uploaded image
+VARIANT_WIDTHS = [320, 768, 1280]
+
+QUALITY = {"webp": 80, "avif": 60}
+
+_pool: Optional[ProcessPoolExecutor] = None
+
+
+def get_pool() -> ProcessPoolExecutor:
+    """Shared process pool for CPU-bound image work, created on first use."""
+    global _pool
+    if _pool is None:
+        _pool = ProcessPoolExecutor(max_workers=settings.IMAGE_WORKERS)
+    return _pool
+
+
+def shutdown_pool():
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
+
+
+def variant_formats() -> List[str]:
+    # AVIF needs a Pillow build with the AVIF plugin; WebP is always produced.
+    formats = ["webp"]
+    if ".avif" in Image.registered_extensions():
+        formats.append("avif")
+    return formats
+
+
+def open_image(path: str) -> Image.Image:
+    """Load an image upright (EXIF orientation applied) in RGB/RGBA."""
+    with Image.open(path) as source:
+        image = ImageOps.exif_transpose(source)
+        if image.mode not in ("RGB", "RGBA"):
+            image = image.convert("RGBA" if "transparency" in image.info else "RGB")
+        image.load()
+    return image
+
+
+def save_image_as(image: Image.Image, out: str, fmt: str):
+    options = {"quality": QUALITY[fmt]}
+    if fmt == "webp":
+        options["method"] = 4
+    image.save(out, fmt.upper(), **options)
+
+
+def make_variants(path: str, stem: Optional[str] = None) -> Dict[str, Dict[str, str]]:
+    """
+    Write resized copies of an image as {format: {width: path}}, named
+    after stem (default: the image path without its extension).
+
+    Runs in a worker process. Widths larger than the original are not
+    upscaled; the original width is used instead.
+    """
+    stem = stem or os.path.splitext(path)[0]
+    image = open_image(path)
+    variants: Dict[str, Dict[str, str]] = {}
+
+    for width in sorted({min(width, image.width) for width in VARIANT_WIDTHS}):
+        height = max(1, round(image.height * width / image.width))
+        resized = image if width == image.width else image.resize((width, height), Image.LANCZOS)
+
+        for fmt in variant_formats():
+            out = f"{stem}_{width}w.{fmt}"
+            save_image_as(resized, out, fmt)
+            variants.setdefault(fmt, {})[str(width)] = out.replace("\\", "/")
+
+    return variants
+
+
+def resize_to(path: str, out: str, width: Optional[int], height: Optional[int], fmt: str):
+    """
+    Fit an image inside width x height (either may be None) and write it as fmt.
+
+    Runs in a worker process. Never upscales; writes to a temp name and
+    renames so readers never see a partial file.
+    """
+    image = open_image(path)
+    image.thumbnail((width or image.width, height or image.height), Image.LANCZOS)
+
+    if fmt == "jpeg" and image.mode == "RGBA":
+        image = image.convert("RGB")
+
+    tmp = f"{out}.{os.getpid()}.part"
+    if fmt in QUALITY:
+        save_image_as(image, tmp, fmt)
+    elif fmt == "jpeg":
+        image.save(tmp, "JPEG", quality=85, optimize=True)
+    else:
+        image.save(tmp, fmt.upper(), optimize=True)
+    os.replace(tmp, out)
+
+
+async def generate_variants(
+    paths: List[str], stems: Optional[List[str]] = None
+) -> List[Dict[str, Dict[str, str]]]:
+    """Generate variants for many images concurrently in the process pool.
+
+    An image Pillow cannot decode gets no variants; the original is still served.
+    """
+    loop = asyncio.get_running_loop()
+    pool = get_pool()
+
+    results = await asyncio.gather(
+        *[
+            loop.run_in_executor(pool, make_variants, path, stem)
+            for path, stem in zip(paths, stems or [None] * len(paths))
+        ],
+        return_exceptions=True,
+    )
+
+    variants = []
+    for path, result in zip(paths, results):
+        if isinstance(result, Exception):
+            logger.warning("Could not create variants for %s: %s", path, result)
+            result = {}
+        variants.append(result)
+    return variants
+
+
+def variant_paths(variants: Optional[dict]) -> List[str]:
+    """Every file path referenced by a CSR `variants` value."""
+    paths = []
+    for formats in (variants or {}).values():
+        for widths in formats.values():
+            paths.extend(widths.values())
+    return paths
@@ -0,0 +1,253 @@
+import threading
+import time
+from datetime import date
+from typing import Iterable, List, Optional, Tuple
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from app.models.job import Job
+from app.utils.skill_match import tokenize_skills
+
+# Share of each feature block in the final cosine score.
+WEIGHTS = {
+    "skills": 0.6,
+    "department": 0.2,
+    "location": 0.1,
+    "experience": 0.1,
+}
+
+# Experience ranges are encoded as a multi-hot over these year buckets,
+# so overlapping ranges score higher than disjoint ones.
+EXPERIENCE_BUCKETS = [(0, 1), (1, 3), (3, 5), (5, 8), (8, 12), (12, 100)]
+
+# Writes on other workers are only picked up by a periodic full reload.
+RELOAD_INTERVAL_SECONDS = 300
+
+
+def _norm(value) -> str:
+    return (value or "").strip().lower()
+
+
+def _experience_buckets(exp_min, exp_max) -> List[int]:
+    if exp_min is None and exp_max is None:
+        return []
+    low = exp_min or 0
+    high = exp_max if exp_max is not None else low
+    return [
+        i for i, (b_low, b_high) in enumerate(EXPERIENCE_BUCKETS)
+        if low < b_high and high >= b_low
+    ]
+
+
+def job_features(job) -> dict:
+    return {
+        "skills": tokenize_skills(job.selected_skills, job.required_skills),
+        "department": _norm(job.department),
+        "location": _norm(job.job_location),
+        "experience": _experience_buckets(job.experience_min, job.experience_max),
+        "deadline": job.application_deadline,
+    }
+
+
+class JobSimilarityIndex:
+    """
+    In-memory cosine similarity index over job features.
+
+    Raw features are kept per job and updated in place on job writes; the
+    feature matrix is reassembled from them on the next query and top-k
+    results are memoized until the following write.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._features: dict = {}
+        self._loaded_at: Optional[float] = None
+        self._ids: Optional[np.ndarray] = None
+        self._matrix: Optional[np.ndarray] = None
+        self._deadlines: Optional[np.ndarray] = None
+        self._columns: Optional[dict] = None
+        self._idf: Optional[np.ndarray] = None
+        self._topk_cache: dict = {}
+
+    # ------------------------------------------------------------------
+    # Maintenance (called from job write paths)
+    # ------------------------------------------------------------------
+    def load(self, db: Session):
+        jobs = db.query(Job).all()
+        with self._lock:
+            self._features = {job.id: job_features(job) for job in jobs}
+            self._loaded_at = time.monotonic()
+            self._invalidate()
+
+    def upsert(self, job):
+        with self._lock:
+            if self._loaded_at is None:
+                return
+            self._features[job.id] = job_features(job)
+            self._invalidate()
+
+    def remove_jobs(self, job_ids: Iterable[int]):
+        with self._lock:
+            for job_id in job_ids:
+                self._features.pop(job_id, None)
+            self._invalidate()
+
+    def clear(self):
+        with self._lock:
+            self._features = {}
+            self._invalidate()
+
+    def _invalidate(self):
+        self._matrix = None
+        self._topk_cache = {}
+
+    def _ensure(self, db: Session):
+        if (
+            self._loaded_at is None
+            or time.monotonic() - self._loaded_at > RELOAD_INTERVAL_SECONDS
+        ):
+            self.load(db)
+        if self._matrix is None:
+            self._build()
+
+    # ------------------------------------------------------------------
+    # Matrix
+    # ------------------------------------------------------------------
+    def _build(self):
+        features = self._features
+        columns = {}
+        for block in ("skills", "department", "location"):
+            values = set()
+            for f in features.values():
+                if block == "skills":
+                    values.update(f["skills"])
+                elif f[block]:
+                    values.add(f[block])
+            columns[block] = {value: i for i, value in enumerate(sorted(values))}
+
+        doc_freq = np.zeros(len(columns["skills"]), dtype=np.float32)
+        for f in features.values():
+            for token in f["skills"]:
+                doc_freq[columns["skills"][token]] += 1
+        self._idf = (np.log((1 + len(features)) / (1 + doc_freq)) + 1).astype(np.float32)
+        self._columns = columns
+
+        ids = list(features)
+        self._ids = np.asarray(ids, dtype=np.int64)
+        self._matrix = (
+            np.vstack([self._vector(features[job_id]) for job_id in ids])
+            if ids else np.zeros((0, self._width()), dtype=np.float32)
+        )
+        self._deadlines = np.asarray(
+            [
+                features[job_id]["deadline"].toordinal()
+                if features[job_id]["deadline"] else np.iinfo(np.int64).max
+                for job_id in ids
+            ],
+            dtype=np.int64,
+        )
+
+    def _width(self) -> int:
+        return sum(len(c) for c in self._columns.values()) + len(EXPERIENCE_BUCKETS)
+
+    def _vector(self, features: dict) -> np.ndarray:
+        """Concatenate per-block unit vectors scaled so the dot product is the weighted cosine."""
+        columns = self._columns
+        blocks = []
+
+        skills = np.zeros(len(columns["skills"]), dtype=np.float32)
+        cols = [columns["skills"][t] for t in features["skills"] if t in columns["skills"]]
+        skills[cols] = self._idf[cols]
+        blocks.append(("skills", skills))
+
+        for block in ("department", "location"):
+            vec = np.zeros(len(columns[block]), dtype=np.float32)
+            col = columns[block].get(features[block])
+            if col is not None:
+                vec[col] = 1.0
+            blocks.append((block, vec))
+
+        experience = np.zeros(len(EXPERIENCE_BUCKETS), dtype=np.float32)
+        experience[features["experience"]] = 1.0
+        blocks.append(("experience", experience))
+
+        parts = []
+        for block, vec in blocks:
+            norm = np.linalg.norm(vec)
+            if norm > 0:
+                vec *= np.sqrt(WEIGHTS[block]) / norm
+            parts.append(vec)
+        return np.concatenate(parts)
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+    def _top_k(self, query: np.ndarray, k: int, exclude_id: Optional[int]) -> List[Tuple[int, float]]:
+        scores = self._matrix @ query
+
+        # Only jobs still open for applications are recommended.
+        active = self._deadlines >= date.today().toordinal()
+        if exclude_id is not None:
+            active &= self._ids != exclude_id
+        candidates = np.flatnonzero(active & (scores > 0))
+
+        if len(candidates) > k:
+            top = np.argpartition(-scores[candidates], k - 1)[:k]
+            candidates = candidates[top]
+        ordered = candidates[np.argsort(-scores[candidates], kind="stable")]
+
+        return [(int(self._ids[i]), round(float(scores[i]), 4)) for i in ordered]
+
+    def similar_to_job(self, db: Session, job_id: int, k: int) -> Optional[List[Tuple[int, float]]]:
+        with self._lock:
+            self._ensure(db)
+
+            cache_key = (job_id, k, date.today())
+            cached = self._topk_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+            features = self._features.get(job_id)
+            if features is None:
+                return None
+
+            result = self._top_k(self._vector(features), k, exclude_id=job_id)
+            self._topk_cache[cache_key] = result
+            return result
+
+    def similar_to_application(self, db: Session, application, k: int) -> List[Tuple[int, float]]:
+        """Blend the applicant's own skills with the department/location/experience of the applied job."""
+        with self._lock:
+            self._ensure(db)
+
+            applied = self._features.get(application.job_id) or {
+                "department": "",
+                "location": _norm(application.location),
+                "experience": [],
+            }
+            features = {
+                "skills": tokenize_skills(application.key_skills),
+                "department": applied["department"],
+                "location": applied["location"],
+                "experience": applied["experience"],
+            }
+            return self._top_k(self._vector(features), k, exclude_id=application.job_id)
+
+
+job_similarity_index = JobSimilarityIndex()
+
+
+def load_similar_jobs(db: Session, results: List[Tuple[int, float]]) -> List[dict]:
+    """Fetch the ranked jobs in one query, keeping the ranking order."""
+    if not results:
+        return []
+    jobs = {
+        job.id: job
+        for job in db.query(Job).filter(Job.id.in_([job_id for job_id, _ in results]))
+    }
+    return [
+        {"score": score, "job": jobs[job_id]}
+        for job_id, score in results
+        if job_id in jobs
+    ]
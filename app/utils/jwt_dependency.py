@@ -1,11 +1,10 @@
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from jose import jwt, JWTError
+from jose import JWTError
 from sqlalchemy.orm import Session
 
 from app.database import get_db
-from app.config import settings
-from app.models.admin import Admin
+from app.utils.admin_principal import AdminPrincipal, load_principal, verify_token
 
 
 # Use HTTP Bearer instead of OAuth2PasswordBearer
@@ -15,7 +14,7 @@ security = HTTPBearer()
 def get_current_admin(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: Session = Depends(get_db)
-):
+) -> AdminPrincipal:
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Invalid or expired token",
@@ -26,11 +25,8 @@ def get_current_admin(
     token = credentials.credentials
 
     try:
-        payload = jwt.decode(
-            token,
-            settings.SECRET_KEY,
-            algorithms=[settings.ALGORITHM]
-        )
+        # Cached per token until it expires
+        payload = verify_token(token)
 
         email = payload.get("sub")
         role = payload.get("role")
@@ -41,16 +37,14 @@ def get_current_admin(
     except JWTError:
         raise credentials_exception
 
-    admin = (
-        db.query(Admin)
-        .filter(
-            Admin.email == email,
-            Admin.is_active == True
-        )
-        .first()
-    )
+    # Cached per email for ADMIN_CACHE_TTL_SECONDS
+    admin = load_principal(db, email)
+
+    if not admin or not admin.is_active:
+        raise credentials_exception
 
-    if not admin:
+    # Tokens issued before the last password change/reset are revoked
+    if payload.get("ver", 0) != admin.token_version:
         raise credentials_exception
 
     return admin
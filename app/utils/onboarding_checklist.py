@@ -0,0 +1,136 @@
+import re
+from typing import Iterable, List, Optional
+
+COMMON_ITEMS = [
+    "aadhar_card",
+    "qualification_certificates",
+    "bank_account_proof",
+    "pan_card",
+    "passport_size_photo",
+    "employee_reference",
+]
+
+FRESHER_ITEMS = COMMON_ITEMS + [
+    "internship_proof",
+]
+
+EXPERIENCED_ITEMS = COMMON_ITEMS + [
+    "last_3_months_pay_slips",
+    "offer_letter",
+    "hike_letter",
+    "experience_letter",
+    "relieving_letter",
+]
+
+# Bit positions are persisted in Onboarding.checklist_mask: never reuse or
+# renumber one, give new items the next free bit.
+ITEM_BITS = {
+    "aadhar_card": 1 << 0,
+    "qualification_certificates": 1 << 1,
+    "bank_account_proof": 1 << 2,
+    "pan_card": 1 << 3,
+    "passport_size_photo": 1 << 4,
+    "employee_reference": 1 << 5,
+    "last_3_months_pay_slips": 1 << 6,
+    "offer_letter": 1 << 7,
+    "hike_letter": 1 << 8,
+    "experience_letter": 1 << 9,
+    "relieving_letter": 1 << 10,
+    "internship_proof": 1 << 11,
+}
+
+ALL_ITEMS = list(ITEM_BITS)
+_unnumbered = set(FRESHER_ITEMS + EXPERIENCED_ITEMS) - set(ITEM_BITS)
+if _unnumbered:
+    raise RuntimeError(f"Checklist items without a bit in ITEM_BITS: {sorted(_unnumbered)}")
+
+# Free-text OnboardingDocument.document_type values that satisfy an item,
+# after normalization (lower case, non-alphanumerics collapsed to "_").
+DOCUMENT_TYPE_ALIASES = {
+    "aadhar": "aadhar_card",
+    "aadhaar": "aadhar_card",
+    "aadhaar_card": "aadhar_card",
+    "qualification_certificate": "qualification_certificates",
+    "educational_certificates": "qualification_certificates",
+    "degree_certificate": "qualification_certificates",
+    "marksheet": "qualification_certificates",
+    "marksheets": "qualification_certificates",
+    "bank_proof": "bank_account_proof",
+    "bank_passbook": "bank_account_proof",
+    "passbook": "bank_account_proof",
+    "cancelled_cheque": "bank_account_proof",
+    "pan": "pan_card",
+    "photo": "passport_size_photo",
+    "passport_photo": "passport_size_photo",
+    "internship_certificate": "internship_proof",
+    "payslip": "last_3_months_pay_slips",
+    "payslips": "last_3_months_pay_slips",
+    "pay_slips": "last_3_months_pay_slips",
+    "salary_slips": "last_3_months_pay_slips",
+    "hike": "hike_letter",
+    "increment_letter": "hike_letter",
+    "experience_certificate": "experience_letter",
+    "relieving_certificate": "relieving_letter",
+}
+
+_NON_ALNUM_RE = re.compile(r"[^a-z0-9]+")
+
+
+def required_items(experience_type: str):
+    if (experience_type or "").lower() == "experienced":
+        return EXPERIENCED_ITEMS
+    return FRESHER_ITEMS
+
+
+def required_mask(experience_type: str) -> int:
+    mask = 0
+    for item in required_items(experience_type):
+        mask |= ITEM_BITS[item]
+    return mask
+
+
+def item_for_document_type(document_type: str) -> Optional[str]:
+    key = _NON_ALNUM_RE.sub("_", (document_type or "").lower()).strip("_")
+    if key in ITEM_BITS:
+        return key
+    return DOCUMENT_TYPE_ALIASES.get(key)
+
+
+def checklist_mask(checklist) -> int:
+    if checklist is None:
+        return 0
+    mask = 0
+    for item, bit in ITEM_BITS.items():
+        if getattr(checklist, item, False):
+            mask |= bit
+    return mask
+
+
+def documents_mask(document_types: Iterable[str]) -> int:
+    mask = 0
+    for document_type in document_types:
+        item = item_for_document_type(document_type)
+        if item:
+            mask |= ITEM_BITS[item]
+    return mask
+
+
+def completion_percent(mask: int, experience_type: str) -> int:
+    required = required_mask(experience_type)
+    done = bin((mask or 0) & required).count("1")
+    return round(100 * done / bin(required).count("1"))
+
+
+def missing_items(mask: int, experience_type: str) -> List[str]:
+    return [
+        item for item in required_items(experience_type)
+        if not (mask or 0) & ITEM_BITS[item]
+    ]
+
+
+def apply_completion(onboarding, bits: int):
+    """Merge newly satisfied items into the stored mask and refresh the percentage."""
+    onboarding.checklist_mask = (onboarding.checklist_mask or 0) | bits
+    onboarding.checklist_completion = completion_percent(
+        onboarding.checklist_mask, onboarding.experience_type
+    )
@@ -0,0 +1,21 @@
+from typing import List
+
+PENDING = "pending"
+VERIFIED = "verified"
+APPROVED = "approved"
+JOINED = "joined"
+
+STATUSES = [PENDING, VERIFIED, APPROVED, JOINED]
+
+# current status -> statuses it may move to
+TRANSITIONS = {
+    PENDING: {VERIFIED},
+    VERIFIED: {APPROVED},
+    APPROVED: {JOINED},
+    JOINED: set(),
+}
+
+
+def allowed_from(to_status: str) -> List[str]:
+    """Statuses a candidate must currently be in to move to `to_status`."""
+    return [status for status, targets in TRANSITIONS.items() if to_status in targets]
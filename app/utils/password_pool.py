@@ -0,0 +1,111 @@
+import asyncio
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+from fastapi import HTTPException
+
+from app.config import settings
+from app.utils.auth import hash_password, verify_password
+
+# bcrypt releases the GIL, so a thread per core gives real parallelism
+# without touching the request threadpool.
+_pool: Optional[ThreadPoolExecutor] = None
+_lock = threading.Lock()
+
+_stats = {
+    "in_flight": 0,
+    "peak_in_flight": 0,
+    "completed": 0,
+    "rejected": 0,
+    "busy_seconds": 0.0,
+    "wait_seconds": 0.0,
+}
+
+
+def workers() -> int:
+    return settings.BCRYPT_WORKERS or os.cpu_count() or 1
+
+
+def get_pool() -> ThreadPoolExecutor:
+    global _pool
+    if _pool is None:
+        with _lock:
+            if _pool is None:
+                _pool = ThreadPoolExecutor(max_workers=workers(), thread_name_prefix="bcrypt")
+    return _pool
+
+
+def shutdown_pool():
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
+
+
+def _timed(fn, submitted_at: float, *args):
+    started = time.monotonic()
+    try:
+        return fn(*args)
+    finally:
+        finished = time.monotonic()
+        with _lock:
+            _stats["wait_seconds"] += started - submitted_at
+            _stats["busy_seconds"] += finished - started
+
+
+async def _run(fn, *args):
+    """
+    Run fn on the bcrypt pool and await it from the event loop. Waiting
+    logins hold no request-threadpool slot, so a login burst cannot starve
+    other sync endpoints; the pool bounds how many hashes run at once.
+    """
+    limit = workers() + settings.BCRYPT_MAX_QUEUE
+
+    with _lock:
+        if _stats["in_flight"] >= limit:
+            _stats["rejected"] += 1
+            raise HTTPException(
+                status_code=503,
+                detail="Server busy, please retry",
+                headers={"Retry-After": str(settings.BCRYPT_RETRY_AFTER_SECONDS)},
+            )
+        _stats["in_flight"] += 1
+        _stats["peak_in_flight"] = max(_stats["peak_in_flight"], _stats["in_flight"])
+
+    try:
+        return await asyncio.wrap_future(get_pool().submit(_timed, fn, time.monotonic(), *args))
+    finally:
+        with _lock:
+            _stats["in_flight"] -= 1
+            _stats["completed"] += 1
+
+
+async def hash_password_async(password: str) -> str:
+    return await _run(hash_password, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    return await _run(verify_password, plain_password, hashed_password)
+
+
+def metrics() -> dict:
+    with _lock:
+        stats = dict(_stats)
+
+    size = workers()
+    completed = stats["completed"] or 1
+    return {
+        "workers": size,
+        "max_queue": settings.BCRYPT_MAX_QUEUE,
+        "rounds": settings.BCRYPT_ROUNDS,
+        "in_flight": stats["in_flight"],
+        "queue_depth": max(0, stats["in_flight"] - size),
+        "peak_in_flight": stats["peak_in_flight"],
+        "completed": stats["completed"],
+        "rejected": stats["rejected"],
+        "avg_wait_ms": round(1000 * stats["wait_seconds"] / completed, 2),
+        "avg_run_ms": round(1000 * stats["busy_seconds"] / completed, 2),
+    }
@@ -0,0 +1,148 @@
+import csv
+import io
+import json
+from typing import Iterator
+
+from sqlalchemy.orm import selectinload
+
+from app.database import SessionLocal
+from app.models.onboarding import Onboarding
+
+CHUNK_SIZE = 500
+
+CSV_COLUMNS = [
+    "onboarding_id",
+    "name",
+    "dob",
+    "gender",
+    "email",
+    "mobile_number",
+    "aadhar_number",
+    "applied_role",
+    "experience_type",
+    "status",
+    "bank_account_name",
+    "bank_account_number",
+    "bank_ifsc_code",
+    "bank_branch_name",
+    "uan_number",
+    "esi_number",
+    "previous_company",
+    "nominees",
+    "family",
+]
+
+
+def iter_onboardings(status: str, chunk_size: int = CHUNK_SIZE) -> Iterator[Onboarding]:
+    """
+    Walk candidates in keyset chunks with their payroll children batch-loaded.
+
+    Runs while the response streams, so it owns its session; each chunk is
+    expunged before the next so memory does not grow with headcount.
+    """
+    db = SessionLocal()
+    try:
+        last_id = 0
+        while True:
+            chunk = (
+                db.query(Onboarding)
+                .options(
+                    selectinload(Onboarding.bank),
+                    selectinload(Onboarding.nominees),
+                    selectinload(Onboarding.family),
+                    selectinload(Onboarding.experience_details),
+                )
+                .filter(Onboarding.status == status, Onboarding.id > last_id)
+                .order_by(Onboarding.id)
+                .limit(chunk_size)
+                .all()
+            )
+            if not chunk:
+                break
+
+            yield from chunk
+
+            last_id = chunk[-1].id
+            db.expunge_all()
+    finally:
+        db.close()
+
+
+def payroll_record(onboarding: Onboarding) -> dict:
+    bank = onboarding.bank
+    experience = onboarding.experience_details
+
+    return {
+        "onboarding_id": onboarding.id,
+        "name": onboarding.name,
+        "dob": onboarding.dob.isoformat() if onboarding.dob else None,
+        "gender": onboarding.gender,
+        "email": onboarding.email,
+        "mobile_number": onboarding.mobile_number,
+        "aadhar_number": onboarding.aadhar_number,
+        "applied_role": onboarding.applied_role,
+        "experience_type": onboarding.experience_type,
+        "status": onboarding.status,
+        "bank_account_name": bank.account_name if bank else None,
+        "bank_account_number": bank.account_number if bank else None,
+        "bank_ifsc_code": bank.ifsc_code if bank else None,
+        "bank_branch_name": bank.branch_name if bank else None,
+        "uan_number": experience.uan_number if experience else None,
+        "esi_number": experience.esi_number if experience else None,
+        "previous_company": experience.company_name if experience else None,
+        "nominees": [
+            {
+                "nominee_type": n.nominee_type,
+                "name": n.name,
+                "dob": n.dob.isoformat() if n.dob else None,
+                "relationship": n.relationship_type,
+            }
+            for n in onboarding.nominees
+        ],
+        "family": [
+            {
+                "name": f.name,
+                "dob": f.dob.isoformat() if f.dob else None,
+                "relationship": f.relationship_type,
+            }
+            for f in onboarding.family
+        ],
+    }
+
+
+def _flatten(record: dict) -> list:
+    row = dict(record)
+    row["nominees"] = "; ".join(
+        f"{n['name']} ({n['relationship']}, {n['nominee_type']})" for n in record["nominees"]
+    )
+    row["family"] = "; ".join(
+        f"{f['name']} ({f['relationship']})" for f in record["family"]
+    )
+    return [row[column] for column in CSV_COLUMNS]
+
+
+def stream_csv(status: str) -> Iterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(CSV_COLUMNS)
+
+    for i, onboarding in enumerate(iter_onboardings(status), start=1):
+        writer.writerow(_flatten(payroll_record(onboarding)))
+        if i % CHUNK_SIZE == 0:
+            yield buffer.getvalue().encode("utf-8")
+            buffer.seek(0)
+            buffer.truncate()
+
+    yield buffer.getvalue().encode("utf-8")
+
+
+def stream_jsonl(status: str) -> Iterator[bytes]:
+    lines = []
+    for onboarding in iter_onboardings(status):
+        lines.append(json.dumps(payroll_record(onboarding)))
+        if len(lines) == CHUNK_SIZE:
+            yield ("\n".join(lines) + "\n").encode("utf-8")
+            lines = []
+
+    if lines:
+        yield ("\n".join(lines) + "\n").encode("utf-8")
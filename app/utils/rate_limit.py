@@ -0,0 +1,187 @@
+import json
+import logging
+import math
+import threading
+import time
+from typing import Optional, Tuple
+
+from fastapi import HTTPException, Request
+
+from app.config import settings
+
+SWEEP_INTERVAL_SECONDS = 60
+REDIS_TIMEOUT_SECONDS = 0.5
+
+logger = logging.getLogger(__name__)
+
+
+class MemoryBackend:
+    """
+    Sliding-window counters kept per process.
+
+    Each key holds (window number, previous count, current count, window): O(1)
+    memory however many requests it sees. Keys idle for two windows are
+    swept out.
+    """
+
+    def __init__(self):
+        self._counters: dict = {}
+        self._lock = threading.Lock()
+        self._last_sweep = time.monotonic()
+
+    def _sweep(self, now: float):
+        self._counters = {
+            key: counter for key, counter in self._counters.items()
+            if counter[0] >= int(now // counter[3]) - 1
+        }
+        self._last_sweep = time.monotonic()
+
+    async def hit(self, key: str, window: int, now: float) -> Tuple[int, int]:
+        """Count one request; returns (previous window count, current window count)."""
+        index = int(now // window)
+
+        with self._lock:
+            if time.monotonic() - self._last_sweep > SWEEP_INTERVAL_SECONDS:
+                self._sweep(now)
+
+            counter = self._counters.get(key)
+            if counter is None or counter[0] < index - 1:
+                counter = [index, 0, 0, window]
+            elif counter[0] == index - 1:
+                counter = [index, counter[2], 0, window]
+
+            counter[2] += 1
+            self._counters[key] = counter
+            return counter[1], counter[2]
+
+
+class RedisBackend:
+    """Shared counters for several workers/nodes: one INCR'd key per window."""
+
+    def __init__(self, url: str):
+        # Only needed when RATE_LIMIT_BACKEND=redis
+        import redis.asyncio as redis
+
+        # Short timeouts: an unreachable Redis must not hold up logins
+        self.client = redis.from_url(
+            url,
+            socket_connect_timeout=REDIS_TIMEOUT_SECONDS,
+            socket_timeout=REDIS_TIMEOUT_SECONDS,
+        )
+
+    async def hit(self, key: str, window: int, now: float) -> Tuple[int, int]:
+        index = int(now // window)
+        current_key = f"rl:{key}:{index}"
+
+        async with self.client.pipeline(transaction=False) as pipe:
+            pipe.get(f"rl:{key}:{index - 1}")
+            pipe.incr(current_key)
+            pipe.expire(current_key, window * 2)
+            previous, current, _ = await pipe.execute()
+
+        return int(previous or 0), int(current)
+
+
+_backend = None
+
+
+def get_backend():
+    global _backend
+    if _backend is None:
+        if settings.RATE_LIMIT_BACKEND == "redis":
+            _backend = RedisBackend(settings.RATE_LIMIT_REDIS_URL)
+        else:
+            _backend = MemoryBackend()
+    return _backend
+
+
+async def check(key: str, limit: int, window: int) -> Optional[int]:
+    """
+    Count a request against key. Returns None when allowed, otherwise the
+    seconds to wait. The previous window's count is weighted by how much of
+    it still overlaps the sliding window.
+
+    Fails open: if the backend is unreachable the request is allowed and a
+    warning logged, so a Redis outage does not take login down with it.
+    """
+    now = time.time()
+    try:
+        previous, current = await get_backend().hit(key, window, now)
+    except Exception as e:
+        logger.warning("Rate limit backend unavailable, allowing %s: %s", key, e)
+        return None
+
+    elapsed = now % window
+    estimate = previous * (1 - elapsed / window) + current
+    if estimate <= limit:
+        return None
+    return max(1, math.ceil(window - elapsed))
+
+
+def client_ip(request: Request) -> str:
+    if settings.RATE_LIMIT_TRUST_FORWARDED:
+        forwarded = request.headers.get("x-forwarded-for")
+        if forwarded:
+            return forwarded.split(",")[0].strip()
+    return request.client.host if request.client else "unknown"
+
+
+async def request_email(request: Request) -> Optional[str]:
+    """Email from the query string or a JSON body, without validating either."""
+    email = request.query_params.get("email")
+    if not email and request.headers.get("content-type", "").startswith("application/json"):
+        try:
+            body = json.loads(await request.body() or b"{}")
+        except ValueError:
+            body = None
+        if isinstance(body, dict) and isinstance(body.get("email"), str):
+            email = body["email"]
+    return email.strip().lower() if email else None
+
+
+def rate_limit(
+    scope: str,
+    per_ip: int,
+    per_email: Optional[int] = None,
+    window: Optional[int] = None,
+    email_per_ip: bool = False,
+    per_account: Optional[int] = None,
+):
+    """
+    Dependency limiting a route per client IP and, unless per_email is
+    None, per submitted email.
+
+    Add it to the route's dependencies=[...] so it runs before the handler
+    touches the database or bcrypt. With email_per_ip the email counter is
+    kept per (IP, email), so nobody can lock an admin out of login by
+    spamming their address from elsewhere. per_account adds a counter per
+    email across all IPs, for attacks spread over many addresses; keep it
+    well above per_email so it only trips on those.
+    """
+
+    async def dependency(request: Request):
+        if not settings.RATE_LIMIT_ENABLED:
+            return
+
+        seconds = window or settings.RATE_LIMIT_WINDOW_SECONDS
+
+        ip = client_ip(request)
+        checks = [(f"{scope}:ip:{ip}", per_ip)]
+
+        email = await request_email(request) if per_email is not None else None
+        if email:
+            subject = f"{ip}:{email}" if email_per_ip else email
+            checks.append((f"{scope}:email:{subject}", per_email))
+            if per_account is not None:
+                checks.append((f"{scope}:account:{email}", per_account))
+
+        for key, limit in checks:
+            retry_after = await check(key, limit, seconds)
+            if retry_after is not None:
+                raise HTTPException(
+                    status_code=429,
+                    detail="Too many attempts, please try again later",
+                    headers={"Retry-After": str(retry_after)},
+                )
+
+    return dependency
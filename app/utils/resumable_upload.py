@@ -0,0 +1,268 @@
+import json
+import os
+import re
+import shutil
+import threading
+import time
+import uuid
+from dataclasses import asdict, dataclass
+from typing import List, Optional
+
+from fastapi import HTTPException
+
+from app.config import settings
+from app.utils.file_upload import safe_filename
+from app.utils.staged_upload import DOCUMENT_SIGNATURES, StagedFile, check_signature, discard
+
+HEADER_BYTES = 16
+PURGE_INTERVAL_SECONDS = 600
+
+_ID_RE = re.compile(r"^[0-9a-f]{32}$")
+_last_purge = 0.0
+
+# One writer per upload at a time, so the offset check and the append agree
+_locks: dict = {}
+_locks_guard = threading.Lock()
+_create_lock = threading.Lock()
+
+
+def _lock_for(upload_id: str) -> threading.Lock:
+    with _locks_guard:
+        return _locks.setdefault(upload_id, threading.Lock())
+
+
+@dataclass
+class ResumableUpload:
+    id: str
+    filename: str
+    length: int
+    offset: int
+    created_at: float
+    expires_at: float
+    finalized: bool = False
+    client: str = ""
+
+
+def _data_path(upload_id: str) -> str:
+    return os.path.join(settings.RESUMABLE_UPLOAD_DIR, upload_id)
+
+
+def _info_path(upload_id: str) -> str:
+    return os.path.join(settings.RESUMABLE_UPLOAD_DIR, f"{upload_id}.json")
+
+
+def _write_info(upload: ResumableUpload):
+    info = asdict(upload)
+    del info["offset"]  # the data file size is the offset
+    tmp = _info_path(upload.id) + ".tmp"
+    with open(tmp, "w") as f:
+        json.dump(info, f)
+    os.replace(tmp, _info_path(upload.id))
+
+
+def _remove(upload_id: str):
+    with _locks_guard:
+        _locks.pop(upload_id, None)
+    for path in (_data_path(upload_id), _info_path(upload_id)):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+
+def _open_uploads() -> List[dict]:
+    """Sidecar info of every unexpired upload."""
+    now = time.time()
+    uploads = []
+    try:
+        entries = list(os.scandir(settings.RESUMABLE_UPLOAD_DIR))
+    except FileNotFoundError:
+        return []
+
+    for entry in entries:
+        if not entry.name.endswith(".json"):
+            continue
+        try:
+            with open(entry.path) as f:
+                info = json.load(f)
+        except (OSError, ValueError):
+            continue
+        if info.get("expires_at", 0) >= now:
+            uploads.append(info)
+    return uploads
+
+
+def _check_quota(client: str, length: int):
+    """The endpoint is public: bound what one client, and everyone, can reserve."""
+    uploads = _open_uploads()
+
+    if sum(1 for info in uploads if info.get("client") == client) >= settings.RESUMABLE_UPLOAD_MAX_PER_CLIENT:
+        raise HTTPException(429, "Too many unfinished uploads; finish or delete one first")
+
+    reserved = sum(info.get("length", 0) for info in uploads)
+    if reserved + length > settings.RESUMABLE_UPLOAD_MAX_TOTAL_BYTES:
+        raise HTTPException(507, "Upload storage is full, please try again later")
+
+
+def create_upload(filename: str, length: int, client: str = "") -> ResumableUpload:
+    filename = safe_filename(filename)
+    ext = os.path.splitext(filename)[1].lstrip(".").lower()
+
+    if ext not in DOCUMENT_SIGNATURES:
+        raise HTTPException(400, f"{filename}: file type not allowed")
+    if length <= 0:
+        raise HTTPException(400, "Upload-Length must be positive")
+    if length > settings.UPLOAD_MAX_BYTES:
+        raise HTTPException(413, f"{filename}: larger than {settings.UPLOAD_MAX_BYTES // (1024 * 1024)} MB")
+
+    purge_expired()
+    os.makedirs(settings.RESUMABLE_UPLOAD_DIR, exist_ok=True)
+
+    # Check and reserve together, so concurrent creates cannot overshoot
+    with _create_lock:
+        _check_quota(client, length)
+
+        now = time.time()
+        upload = ResumableUpload(
+            id=uuid.uuid4().hex,
+            filename=filename,
+            length=length,
+            offset=0,
+            created_at=now,
+            expires_at=now + settings.RESUMABLE_UPLOAD_TTL_HOURS * 3600,
+            client=client,
+        )
+        open(_data_path(upload.id), "wb").close()
+        _write_info(upload)
+    return upload
+
+
+def get_upload(upload_id: str) -> ResumableUpload:
+    if not _ID_RE.match(upload_id or ""):
+        raise HTTPException(404, "Upload not found")
+
+    try:
+        with open(_info_path(upload_id)) as f:
+            info = json.load(f)
+        offset = os.path.getsize(_data_path(upload_id))
+    except FileNotFoundError:
+        raise HTTPException(404, "Upload not found")
+
+    upload = ResumableUpload(offset=offset, **info)
+    if upload.expires_at < time.time():
+        _remove(upload_id)
+        raise HTTPException(404, "Upload not found")
+    return upload
+
+
+def append_chunk(upload_id: str, offset: int, data: bytes) -> int:
+    """Append bytes at offset, which must equal the current size. Returns the new offset."""
+    with _lock_for(upload_id):
+        upload = get_upload(upload_id)
+
+        if upload.finalized:
+            raise HTTPException(409, "Upload already finalized")
+        if offset != upload.offset:
+            raise HTTPException(409, f"Upload-Offset mismatch: server has {upload.offset}")
+        if offset + len(data) > upload.length:
+            raise HTTPException(413, "Chunk exceeds Upload-Length")
+
+        with open(_data_path(upload_id), "ab") as f:
+            f.write(data)
+            return f.tell()
+
+
+def finalize_upload(upload_id: str) -> ResumableUpload:
+    upload = get_upload(upload_id)
+    if upload.finalized:
+        return upload
+
+    if upload.offset != upload.length:
+        raise HTTPException(409, f"Upload incomplete: {upload.offset} of {upload.length} bytes")
+
+    with open(_data_path(upload_id), "rb") as f:
+        header = f.read(HEADER_BYTES)
+
+    try:
+        check_signature(upload.filename, header)
+    except HTTPException:
+        _remove(upload_id)
+        raise
+
+    upload.finalized = True
+    _write_info(upload)
+    return upload
+
+
+def delete_upload(upload_id: str):
+    get_upload(upload_id)
+    _remove(upload_id)
+
+
+def claim_uploads(upload_ids: List[str], dest_dir: str) -> List[StagedFile]:
+    """
+    Turn finalized uploads into staged files under dest_dir, ready for
+    promote()/discard(). All ids are checked before any file is moved.
+    """
+    uploads = [get_upload(upload_id) for upload_id in upload_ids]
+    for upload in uploads:
+        if not upload.finalized:
+            raise HTTPException(409, f"Upload {upload.id} is not finalized")
+
+    os.makedirs(dest_dir, exist_ok=True)
+    staged = []
+    for upload in uploads:
+        final_path = f"{dest_dir}/{uuid.uuid4()}_{upload.filename}"
+        tmp_path = final_path + ".part"
+        with _lock_for(upload.id):
+            try:
+                shutil.move(_data_path(upload.id), tmp_path)
+            except FileNotFoundError:
+                discard(staged)
+                raise HTTPException(404, f"Upload {upload.id} not found")
+            _remove(upload.id)
+        staged.append(StagedFile(
+            file_name=upload.filename, tmp_path=tmp_path, final_path=final_path, size=upload.length
+        ))
+    return staged
+
+
+def purge_expired(force: bool = False) -> int:
+    """Remove expired uploads; without force, runs at most every PURGE_INTERVAL_SECONDS."""
+    global _last_purge
+    now = time.time()
+    if not force and now - _last_purge < PURGE_INTERVAL_SECONDS:
+        return 0
+    _last_purge = now
+
+    removed = 0
+    try:
+        entries = list(os.scandir(settings.RESUMABLE_UPLOAD_DIR))
+    except FileNotFoundError:
+        return 0
+
+    names = {entry.name for entry in entries}
+    stale_before = now - settings.RESUMABLE_UPLOAD_TTL_HOURS * 3600
+    for entry in entries:
+        if not entry.name.endswith(".json"):
+            # Data file whose sidecar was never written
+            if f"{entry.name}.json" not in names and entry.stat().st_mtime < stale_before:
+                _remove(entry.name)
+            continue
+        try:
+            with open(entry.path) as f:
+                expires_at = json.load(f)["expires_at"]
+        except (OSError, ValueError, KeyError):
+            expires_at = 0
+        if expires_at < now:
+            _remove(entry.name[:-len(".json")])
+            removed += 1
+    return removed
+
+
+def parse_upload_ids(values: Optional[List[str]]) -> List[str]:
+    """Accept repeated form fields or one comma-separated value."""
+    ids = []
+    for value in values or []:
+        ids.extend(v.strip() for v in value.split(",") if v.strip())
+    return ids
@@ -1,19 +1,20 @@
-import os
+import uuid
+
 from fastapi import UploadFile, HTTPException
 
+from app.utils.storage import get_storage
+
 ALLOWED_EXTENSIONS = {"pdf", "doc", "docx"}
 
 def save_resume(file: UploadFile) -> str:
-    ext = file.filename.split(".")[-1].lower()
+    ext = (file.filename or "").rsplit(".", 1)[-1].lower()
 
     if ext not in ALLOWED_EXTENSIONS:
         raise HTTPException(status_code=400, detail="Invalid resume format")
 
-    os.makedirs("uploads/resumes", exist_ok=True)
-
-    file_path = f"uploads/resumes/{file.filename}"
+    # Named by UUID: the client's filename never reaches the path
+    file_path = f"uploads/resumes/{uuid.uuid4().hex}.{ext}"
 
-    with open(file_path, "wb") as f:
-        f.write(file.file.read())
+    get_storage().save(file_path, file.file)
 
     return file_path
@@ -0,0 +1,168 @@
+import re
+import threading
+from typing import Iterable, List, Optional
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from app.models.job import Job
+
+# Skills arrive as chip lists (Job.selected_skills), comma separated text
+# (Job.required_skills, Application.key_skills) or a mix of both.
+_SPLIT_RE = re.compile(r"[,;|\n]+")
+_SPACE_RE = re.compile(r"\s+")
+
+
+def tokenize_skills(*values) -> List[str]:
+    """Normalize skills into unique lower-case tokens, keeping first-seen order."""
+    tokens = []
+    seen = set()
+
+    for value in values:
+        if not value:
+            continue
+
+        parts = value if isinstance(value, (list, tuple)) else _SPLIT_RE.split(str(value))
+
+        for part in parts:
+            token = _SPACE_RE.sub(" ", str(part)).strip(" .-").lower()
+            if token and token not in seen:
+                seen.add(token)
+                tokens.append(token)
+
+    return tokens
+
+
+def job_skill_tokens(job) -> List[str]:
+    return tokenize_skills(job.selected_skills, job.required_skills)
+
+
+class SkillIndex:
+    """
+    TF-IDF model over the skill vocabulary of all jobs.
+
+    The vocabulary and IDF weights are rebuilt lazily whenever a job's skills
+    change; normalized job vectors are cached per job id until then.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._loaded = False
+        self._job_tokens: dict = {}
+        self._vocab: Optional[dict] = None
+        self._idf: Optional[np.ndarray] = None
+        self._job_vectors: dict = {}
+
+    # ------------------------------------------------------------------
+    # Maintenance (called from job write paths)
+    # ------------------------------------------------------------------
+    def load(self, db: Session):
+        rows = db.query(Job.id, Job.selected_skills, Job.required_skills).all()
+
+        with self._lock:
+            self._job_tokens = {
+                row.id: tokenize_skills(row.selected_skills, row.required_skills)
+                for row in rows
+            }
+            self._invalidate()
+            self._loaded = True
+
+    def refresh_job(self, job):
+        with self._lock:
+            if not self._loaded:
+                return
+
+            tokens = job_skill_tokens(job)
+            if self._job_tokens.get(job.id) != tokens:
+                self._job_tokens[job.id] = tokens
+                self._invalidate()
+
+    def remove_jobs(self, job_ids: Iterable[int]):
+        with self._lock:
+            removed = [self._job_tokens.pop(job_id, None) for job_id in job_ids]
+            if any(tokens is not None for tokens in removed):
+                self._invalidate()
+
+    def clear(self):
+        with self._lock:
+            self._job_tokens = {}
+            self._invalidate()
+
+    def _invalidate(self):
+        self._vocab = None
+        self._idf = None
+        self._job_vectors = {}
+
+    # ------------------------------------------------------------------
+    # Model
+    # ------------------------------------------------------------------
+    def _ensure_model(self, db: Session):
+        if not self._loaded:
+            self.load(db)
+
+        if self._vocab is not None:
+            return
+
+        vocab = {}
+        doc_freq = []
+        for tokens in self._job_tokens.values():
+            for token in tokens:
+                col = vocab.get(token)
+                if col is None:
+                    vocab[token] = len(doc_freq)
+                    doc_freq.append(1)
+                else:
+                    doc_freq[col] += 1
+
+        n_docs = len(self._job_tokens)
+        df = np.asarray(doc_freq, dtype=np.float32)
+        # Smoothed IDF, so a skill every job asks for still carries weight.
+        self._idf = (np.log((1 + n_docs) / (1 + df)) + 1).astype(np.float32)
+        self._vocab = vocab
+
+    def _matrix(self, token_lists: List[List[str]]) -> np.ndarray:
+        """Row-normalized TF-IDF matrix (binary TF) over the shared vocabulary."""
+        vocab = self._vocab
+        matrix = np.zeros((len(token_lists), len(vocab)), dtype=np.float32)
+
+        rows, cols = [], []
+        for i, tokens in enumerate(token_lists):
+            for token in tokens:
+                col = vocab.get(token)
+                if col is not None:
+                    rows.append(i)
+                    cols.append(col)
+
+        if rows:
+            matrix[rows, cols] = 1.0
+            matrix *= self._idf
+            norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+            np.divide(matrix, norms, out=matrix, where=norms > 0)
+
+        return matrix
+
+    def job_vector(self, db: Session, job) -> np.ndarray:
+        with self._lock:
+            if not self._loaded:
+                self.load(db)
+
+            # Another worker may have edited the job; resync from the row we hold.
+            self.refresh_job(job)
+            self._ensure_model(db)
+
+            vector = self._job_vectors.get(job.id)
+            if vector is None:
+                vector = self._matrix([job_skill_tokens(job)])[0]
+                self._job_vectors[job.id] = vector
+            return vector
+
+    def score_applications(self, db: Session, job, applications) -> np.ndarray:
+        """Cosine match score of every application against the job, in one matmul."""
+        with self._lock:
+            job_vec = self.job_vector(db, job)
+            matrix = self._matrix([tokenize_skills(a.key_skills) for a in applications])
+
+        return matrix @ job_vec
+
+
+skill_index = SkillIndex()
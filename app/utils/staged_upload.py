@@ -0,0 +1,144 @@
+import os
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import List, Optional
+
+from fastapi import HTTPException, UploadFile
+
+from app.config import settings
+from app.utils.file_upload import safe_filename
+from app.utils.storage import get_storage
+
+CHUNK_SIZE = 1024 * 1024
+
+# extension -> accepted signatures: leading bytes, or a tuple of
+# (offset, bytes) parts that must all match
+DOCUMENT_SIGNATURES = {
+    "pdf": [b"%PDF"],
+    "jpg": [b"\xff\xd8\xff"],
+    "jpeg": [b"\xff\xd8\xff"],
+    "png": [b"\x89PNG\r\n\x1a\n"],
+    "doc": [b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1"],
+    "docx": [b"PK\x03\x04"],
+}
+
+IMAGE_SIGNATURES = {
+    "jpg": [b"\xff\xd8\xff"],
+    "jpeg": [b"\xff\xd8\xff"],
+    "png": [b"\x89PNG\r\n\x1a\n"],
+    "gif": [b"GIF87a", b"GIF89a"],
+    "webp": [((0, b"RIFF"), (8, b"WEBP"))],
+}
+
+
+@dataclass
+class StagedFile:
+    file_name: str
+    tmp_path: str
+    final_path: str
+    size: int
+
+
+def _matches(header: bytes, signature) -> bool:
+    if isinstance(signature, bytes):
+        return header.startswith(signature)
+    return all(header[offset:offset + len(part)] == part for offset, part in signature)
+
+
+def check_signature(filename: str, header: bytes, signatures=DOCUMENT_SIGNATURES):
+    ext = os.path.splitext(filename or "")[1].lstrip(".").lower()
+
+    if ext not in signatures:
+        raise HTTPException(400, f"{filename}: file type not allowed")
+    if not any(_matches(header, signature) for signature in signatures[ext]):
+        raise HTTPException(400, f"{filename}: content does not match .{ext}")
+
+
+def _stage_one(file: UploadFile, dest_dir: str, max_bytes: int, signatures, keep_name: bool) -> StagedFile:
+    file_name = safe_filename(file.filename)
+    if keep_name:
+        final_path = f"{dest_dir}/{uuid.uuid4()}_{file_name}"
+    else:
+        final_path = f"{dest_dir}/{uuid.uuid4().hex}{os.path.splitext(file_name)[1].lower()}"
+    tmp_path = final_path + ".part"
+
+    try:
+        file.file.seek(0)
+        chunk = file.file.read(CHUNK_SIZE)
+        check_signature(file_name, chunk, signatures)
+
+        size = 0
+        with open(tmp_path, "wb") as buffer:
+            while chunk:
+                size += len(chunk)
+                if size > max_bytes:
+                    raise HTTPException(413, f"{file_name}: larger than {max_bytes // (1024 * 1024)} MB")
+                buffer.write(chunk)
+                chunk = file.file.read(CHUNK_SIZE)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+    return StagedFile(file_name=file_name, tmp_path=tmp_path, final_path=final_path, size=size)
+
+
+def stage_uploads(
+    files: List[UploadFile],
+    dest_dir: str,
+    max_bytes: Optional[int] = None,
+    max_parallel: Optional[int] = None,
+    signatures=DOCUMENT_SIGNATURES,
+    keep_name: bool = True,
+) -> List[StagedFile]:
+    """
+    Validate and copy uploads to temp files next to their final paths,
+    several at a time. Either every file is staged or none is left behind.
+
+    keep_name=False names files by UUID and extension only.
+    """
+    if not files:
+        return []
+
+    os.makedirs(dest_dir, exist_ok=True)
+    max_bytes = max_bytes or settings.UPLOAD_MAX_BYTES
+    workers = min(max_parallel or settings.UPLOAD_MAX_PARALLEL, len(files))
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(_stage_one, file, dest_dir, max_bytes, signatures, keep_name)
+            for file in files
+        ]
+
+    staged, error = [], None
+    for future in futures:
+        try:
+            staged.append(future.result())
+        except BaseException as e:
+            error = error or e
+
+    if error:
+        discard(staged)
+        raise error
+
+    return staged
+
+
+def promote(staged: List[StagedFile]):
+    """
+    Hand staged files to storage under their final keys. On local disk the
+    temp file sits next to its final path, so this is an atomic rename.
+    """
+    storage = get_storage()
+    for item in staged:
+        storage.put_file(item.tmp_path, item.final_path)
+
+
+def discard(staged: List[StagedFile]):
+    """Remove staged files, whether or not they were already promoted."""
+    storage = get_storage()
+    for item in staged:
+        if os.path.exists(item.tmp_path):
+            os.remove(item.tmp_path)
+        storage.delete(item.final_path)
@@ -0,0 +1,243 @@
+import mimetypes
+import os
+import shutil
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import BinaryIO, Iterator, Optional
+
+from app.config import settings
+
+COPY_CHUNK_SIZE = 1024 * 1024
+
+
+@dataclass
+class FileInfo:
+    size: int
+    mtime: float
+
+
+class Storage:
+    """
+    Where uploaded files live. Keys are the paths stored in the database
+    ("uploads/job_applications/<uuid>_resume.pdf").
+    """
+
+    def save(self, key: str, fileobj: BinaryIO) -> int:
+        """Write a stream to key and return its size."""
+        raise NotImplementedError
+
+    def put_file(self, local_path: str, key: str):
+        """Move a finished local file to key; the local file is gone afterwards."""
+        raise NotImplementedError
+
+    def delete(self, key: str):
+        """Remove key; a missing key is not an error."""
+        raise NotImplementedError
+
+    def move(self, src_key: str, dst_key: str):
+        raise NotImplementedError
+
+    def info(self, key: str) -> Optional[FileInfo]:
+        raise NotImplementedError
+
+    def open(self, key: str) -> BinaryIO:
+        raise NotImplementedError
+
+    def download(self, key: str, local_path: str):
+        raise NotImplementedError
+
+    def iter_files(self, prefix: str) -> Iterator[tuple]:
+        """Yield (key, FileInfo) for every file below prefix."""
+        raise NotImplementedError
+
+    def url(self, key: str, expires: Optional[int] = None) -> str:
+        raise NotImplementedError
+
+    def local_path(self, key: str) -> Optional[str]:
+        """Filesystem path of key when the backend is a local disk, else None."""
+        return None
+
+    def exists(self, key: str) -> bool:
+        return self.info(key) is not None
+
+
+class LocalStorage(Storage):
+    # Top-level directories keys may live in; root is often the project
+    # directory itself, so nothing else under it is reachable.
+    KEY_DIRS = ("uploads", "uploads_quarantine")
+
+    def __init__(self, root: str = "."):
+        self.root = os.path.abspath(root)
+
+    def _path(self, key: str) -> str:
+        # Keys can come from clients and database rows: no absolute paths,
+        # no ".." segments, no backslashes, and only inside KEY_DIRS
+        parts = (key or "").split("/")
+        if (
+            "\\" in key
+            or os.path.isabs(key)
+            or parts[0] not in self.KEY_DIRS
+            or any(part in ("", ".", "..") for part in parts[1:])
+        ):
+            raise ValueError(f"Invalid storage key: {key!r}")
+
+        path = os.path.normpath(os.path.join(self.root, key))
+        if os.path.commonpath([self.root, path]) != self.root:
+            raise ValueError(f"Invalid storage key: {key!r}")
+        return path
+
+    def save(self, key: str, fileobj: BinaryIO) -> int:
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        with open(path, "wb") as out:
+            shutil.copyfileobj(fileobj, out, COPY_CHUNK_SIZE)
+            return out.tell()
+
+    def put_file(self, local_path: str, key: str):
+        path = self._path(key)
+        if os.path.abspath(local_path) == os.path.abspath(path):
+            return
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        shutil.move(local_path, path)
+
+    def delete(self, key: str):
+        try:
+            os.remove(self._path(key))
+        except FileNotFoundError:
+            pass
+
+    def move(self, src_key: str, dst_key: str):
+        self.put_file(self._path(src_key), dst_key)
+
+    def info(self, key: str) -> Optional[FileInfo]:
+        try:
+            stat = os.stat(self._path(key))
+        except FileNotFoundError:
+            return None
+        return FileInfo(size=stat.st_size, mtime=stat.st_mtime)
+
+    def open(self, key: str) -> BinaryIO:
+        return open(self._path(key), "rb")
+
+    def download(self, key: str, local_path: str):
+        shutil.copyfile(self._path(key), local_path)
+
+    def iter_files(self, prefix: str) -> Iterator[tuple]:
+        stack = [self._path(prefix.rstrip("/"))]
+        while stack:
+            directory = stack.pop()
+            try:
+                with os.scandir(directory) as it:
+                    for entry in it:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.is_file(follow_symlinks=False):
+                            stat = entry.stat(follow_symlinks=False)
+                            key = os.path.relpath(entry.path, self.root).replace("\\", "/")
+                            yield key, FileInfo(size=stat.st_size, mtime=stat.st_mtime)
+            except FileNotFoundError:
+                continue
+
+    def url(self, key: str, expires: Optional[int] = None) -> str:
+        return "/" + key
+
+    def local_path(self, key: str) -> Optional[str]:
+        return self._path(key)
+
+
+class S3Storage(Storage):
+    """
+    S3-compatible object storage (AWS, MinIO, ...). Large files are sent as
+    multipart uploads and read back through presigned GET URLs, so the bytes
+    never pass through the app workers.
+    """
+
+    def __init__(self, bucket: str, endpoint_url: Optional[str] = None, region: Optional[str] = None,
+                 access_key: Optional[str] = None, secret_key: Optional[str] = None):
+        # Only needed when this backend is configured
+        import boto3
+        from boto3.s3.transfer import TransferConfig
+
+        self.bucket = bucket
+        self.client = boto3.client(
+            "s3",
+            endpoint_url=endpoint_url,
+            region_name=region,
+            aws_access_key_id=access_key,
+            aws_secret_access_key=secret_key,
+        )
+        self.transfer = TransferConfig(
+            multipart_threshold=settings.S3_MULTIPART_THRESHOLD,
+            multipart_chunksize=settings.S3_MULTIPART_THRESHOLD,
+            max_concurrency=4,
+        )
+
+    @staticmethod
+    def _extra_args(key: str) -> dict:
+        content_type, _ = mimetypes.guess_type(key)
+        return {"ContentType": content_type or "application/octet-stream"}
+
+    def save(self, key: str, fileobj: BinaryIO) -> int:
+        # upload_fileobj closes the stream, so measure it first
+        start = fileobj.tell()
+        size = fileobj.seek(0, os.SEEK_END) - start
+        fileobj.seek(start)
+        self.client.upload_fileobj(fileobj, self.bucket, key, ExtraArgs=self._extra_args(key), Config=self.transfer)
+        return size
+
+    def put_file(self, local_path: str, key: str):
+        self.client.upload_file(local_path, self.bucket, key, ExtraArgs=self._extra_args(key), Config=self.transfer)
+        os.remove(local_path)
+
+    def delete(self, key: str):
+        self.client.delete_object(Bucket=self.bucket, Key=key)
+
+    def move(self, src_key: str, dst_key: str):
+        self.client.copy({"Bucket": self.bucket, "Key": src_key}, self.bucket, dst_key, Config=self.transfer)
+        self.delete(src_key)
+
+    def info(self, key: str) -> Optional[FileInfo]:
+        from botocore.exceptions import ClientError
+
+        try:
+            head = self.client.head_object(Bucket=self.bucket, Key=key)
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") in ("404", "NoSuchKey", "NotFound"):
+                return None
+            raise
+        return FileInfo(size=head["ContentLength"], mtime=head["LastModified"].timestamp())
+
+    def open(self, key: str) -> BinaryIO:
+        return self.client.get_object(Bucket=self.bucket, Key=key)["Body"]
+
+    def download(self, key: str, local_path: str):
+        self.client.download_file(self.bucket, key, local_path, Config=self.transfer)
+
+    def iter_files(self, prefix: str) -> Iterator[tuple]:
+        paginator = self.client.get_paginator("list_objects_v2")
+        for page in paginator.paginate(Bucket=self.bucket, Prefix=prefix.rstrip("/") + "/"):
+            for obj in page.get("Contents", []):
+                yield obj["Key"], FileInfo(size=obj["Size"], mtime=obj["LastModified"].timestamp())
+
+    def url(self, key: str, expires: Optional[int] = None) -> str:
+        return self.client.generate_presigned_url(
+            "get_object",
+            Params={"Bucket": self.bucket, "Key": key},
+            ExpiresIn=expires or settings.S3_PRESIGN_EXPIRE_SECONDS,
+        )
+
+
+@lru_cache
+def get_storage() -> Storage:
+    if settings.STORAGE_BACKEND == "s3":
+        return S3Storage(
+            bucket=settings.S3_BUCKET,
+            endpoint_url=settings.S3_ENDPOINT_URL,
+            region=settings.S3_REGION,
+            access_key=settings.S3_ACCESS_KEY_ID,
+            secret_key=settings.S3_SECRET_ACCESS_KEY,
+        )
+    if settings.STORAGE_BACKEND == "local":
+        return LocalStorage(settings.STORAGE_LOCAL_ROOT)
+    raise ValueError(f"Unknown STORAGE_BACKEND: {settings.STORAGE_BACKEND}")
@@ -0,0 +1,153 @@
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import List, Set
+
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.database import SessionLocal
+from app.models.csr import CSR
+from app.models.jobapplication import Application
+from app.models.onboarding_documents import OnboardingDocument
+from app.utils.image_pipeline import variant_paths
+from app.utils.storage import get_storage
+
+logger = logging.getLogger(__name__)
+
+UPLOAD_ROOT = "uploads"
+QUARANTINE_ROOT = "uploads_quarantine"
+BATCH_SIZE = 500
+
+# Every column that stores an "uploads/..." path
+PATH_COLUMNS = [
+    Application.pan_card_file,
+    Application.resume_file,
+    Application.photo_file,
+    OnboardingDocument.file_path,
+    CSR.image1,
+    CSR.image2,
+    CSR.image3,
+    CSR.image4,
+]
+
+
+@dataclass
+class GCStats:
+    scanned: int = 0
+    too_new: int = 0
+    orphaned: int = 0
+    orphaned_bytes: int = 0
+    seconds: float = 0.0
+
+    @property
+    def files_per_second(self) -> float:
+        return self.scanned / self.seconds if self.seconds else 0.0
+
+
+def variant_references(db: Session) -> Set[str]:
+    # JSON values cannot be matched with IN, and there is one row per CSR section
+    refs = set()
+    for (variants,) in db.query(CSR.variants).filter(CSR.variants.isnot(None)):
+        refs.update(variant_paths(variants))
+    return refs
+
+
+def referenced_paths(db: Session, paths: List[str]) -> Set[str]:
+    """The subset of paths stored in any path column, one IN query per column."""
+    found = set()
+    for column in PATH_COLUMNS:
+        remaining = [p for p in paths if p not in found]
+        if not remaining:
+            break
+        found.update(value for (value,) in db.query(column).filter(column.in_(remaining)))
+    return found
+
+
+def _dispose(storage, path: str, root: str, quarantine_root: str, quarantine: bool):
+    if quarantine:
+        storage.move(path, f"{quarantine_root}/{path[len(root):].lstrip('/')}")
+    else:
+        storage.delete(path)
+
+
+def collect_garbage(
+    db: Session,
+    grace_seconds: int,
+    dry_run: bool = True,
+    quarantine: bool = False,
+    root: str = UPLOAD_ROOT,
+    quarantine_root: str = QUARANTINE_ROOT,
+    batch_size: int = BATCH_SIZE,
+) -> GCStats:
+    """
+    Find files under the root prefix that no row references and that are
+    older than the grace period, then delete them (or move them to
+    quarantine_root).
+
+    The grace period protects uploads written before their row is committed,
+    including staged ".part" files.
+    """
+    storage = get_storage()
+    stats = GCStats()
+    start = time.monotonic()
+    cutoff = time.time() - grace_seconds
+    variants = variant_references(db)
+
+    def flush(batch):
+        refs = referenced_paths(db, [path for path, _ in batch])
+        for path, size in batch:
+            if path in refs or path in variants:
+                continue
+            stats.orphaned += 1
+            stats.orphaned_bytes += size
+            if dry_run:
+                logger.info("orphan: %s (%d bytes)", path, size)
+            else:
+                _dispose(storage, path, root, quarantine_root, quarantine)
+
+    batch = []
+    for path, info in storage.iter_files(root):
+        stats.scanned += 1
+        if info.mtime > cutoff:
+            stats.too_new += 1
+            continue
+
+        batch.append((path, info.size))
+        if len(batch) >= batch_size:
+            flush(batch)
+            batch = []
+
+    if batch:
+        flush(batch)
+
+    stats.seconds = time.monotonic() - start
+    return stats
+
+
+def _sweep() -> GCStats:
+    db = SessionLocal()
+    try:
+        return collect_garbage(
+            db,
+            grace_seconds=int(settings.UPLOAD_GC_GRACE_HOURS * 3600),
+            dry_run=False,
+        )
+    finally:
+        db.close()
+
+
+async def run_periodically():
+    """Background sweep every UPLOAD_GC_INTERVAL_HOURS (started from app startup)."""
+    while True:
+        await asyncio.sleep(settings.UPLOAD_GC_INTERVAL_HOURS * 3600)
+        try:
+            stats = await run_in_threadpool(_sweep)
+            logger.info(
+                "Upload GC: scanned %d files, removed %d (%d bytes) in %.1fs",
+                stats.scanned, stats.orphaned, stats.orphaned_bytes, stats.seconds,
+            )
+        except Exception:
+            logger.exception("Upload GC failed")
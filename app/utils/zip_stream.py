@@ -0,0 +1,92 @@
+import re
+import time
+import zipfile
+from typing import Iterable, Iterator, Tuple
+
+from app.utils.storage import get_storage
+
+CHUNK_SIZE = 64 * 1024
+
+_UNSAFE_RE = re.compile(r"[^A-Za-z0-9._-]+")
+
+
+def safe_name(value: str) -> str:
+    return _UNSAFE_RE.sub("_", value or "").strip("_") or "file"
+
+
+class _ZipSink:
+    """
+    Write-only target for ZipFile.
+
+    It reports tell() but refuses seek(), so zipfile falls back to data
+    descriptors and never rewinds; written bytes are handed back to the
+    generator after every chunk.
+    """
+
+    def __init__(self):
+        self._chunks = []
+        self._offset = 0
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        self._offset += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._offset
+
+    def seek(self, *args):
+        raise OSError("stream is not seekable")
+
+    def flush(self):
+        pass
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks = []
+        return data
+
+
+def stream_zip(entries: Iterable[Tuple[str, str]]) -> Iterator[bytes]:
+    """
+    Yield a ZIP archive of (arcname, storage key) entries without temp files.
+
+    Documents are already compressed (PDF/JPEG/PNG), so entries are STORED;
+    memory use is bounded by CHUNK_SIZE regardless of archive size.
+    Missing files and keys outside storage are skipped.
+    """
+    storage = get_storage()
+    sink = _ZipSink()
+
+    with zipfile.ZipFile(sink, "w", compression=zipfile.ZIP_STORED, allowZip64=True) as archive:
+        for arcname, key in entries:
+            try:
+                info = storage.info(key) if key else None
+            except ValueError:
+                # Stored path outside the storage root
+                info = None
+            if info is None:
+                continue
+
+            zinfo = zipfile.ZipInfo(arcname, time.localtime(info.mtime)[:6])
+            zinfo.compress_type = zipfile.ZIP_STORED
+            zinfo.file_size = info.size
+
+            with storage.open(key) as src, archive.open(zinfo, "w") as dest:
+                while True:
+                    chunk = src.read(CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    dest.write(chunk)
+
+                    data = sink.drain()
+                    if data:
+                        yield data
+
+            data = sink.drain()
+            if data:
+                yield data
+
+    data = sink.drain()
+    if data:
+        yield data
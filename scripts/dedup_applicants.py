@@ -0,0 +1,29 @@
+import argparse
+
+from app.database import SessionLocal
+from app.utils.dedup import backfill_blocking_keys, cluster_duplicates, DEFAULT_NAME_THRESHOLD
+
+
+def dedup_applicants(threshold: float):
+    db = SessionLocal()
+    try:
+        backfilled = backfill_blocking_keys(db)
+        clusters = cluster_duplicates(db, threshold)
+    finally:
+        db.close()
+
+    for ids in clusters:
+        print(f"{len(ids)} applications: {', '.join(str(i) for i in ids)}")
+
+    if backfilled:
+        print(f"Backfilled blocking keys for {backfilled} applications")
+    print(f"✅ Found {len(clusters)} duplicate clusters")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Cluster near-duplicate job applications")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_NAME_THRESHOLD,
+                        help="minimum name similarity (0-1) inside a block")
+    args = parser.parse_args()
+
+    dedup_applicants(args.threshold)
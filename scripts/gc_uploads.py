@@ -0,0 +1,44 @@
+import argparse
+
+from app.database import SessionLocal
+from app.utils.upload_gc import collect_garbage, BATCH_SIZE, QUARANTINE_ROOT, UPLOAD_ROOT
+
+
+def gc_uploads(args):
+    db = SessionLocal()
+    try:
+        stats = collect_garbage(
+            db,
+            grace_seconds=int(args.grace_hours * 3600),
+            dry_run=not args.apply,
+            quarantine=args.quarantine,
+            root=args.root,
+            quarantine_root=args.quarantine_root,
+            batch_size=args.batch_size,
+        )
+    finally:
+        db.close()
+
+    action = "would remove" if not args.apply else ("quarantined" if args.quarantine else "deleted")
+    print(
+        f"Scanned {stats.scanned} files in {stats.seconds:.1f}s "
+        f"({stats.files_per_second:,.0f} files/s), {stats.too_new} inside grace period"
+    )
+    print(f"✅ {action} {stats.orphaned} orphaned files ({stats.orphaned_bytes / (1024 * 1024):.1f} MB)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Remove uploaded files no database row references")
+    parser.add_argument("--apply", action="store_true",
+                        help="actually remove files (default is a dry run)")
+    parser.add_argument("--quarantine", action="store_true",
+                        help="move orphans to --quarantine-root instead of deleting them")
+    parser.add_argument("--grace-hours", type=float, default=24,
+                        help="ignore files modified more recently than this")
+    parser.add_argument("--root", default=UPLOAD_ROOT)
+    parser.add_argument("--quarantine-root", default=QUARANTINE_ROOT)
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE,
+                        help="paths per IN query")
+    args = parser.parse_args()
+
+    gc_uploads(args)
@@ -0,0 +1,9 @@
+import os
+
+# app.config requires these; tests never touch the database or SMTP
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("SECRET_KEY", "test-secret")
+os.environ.setdefault("SMTP_HOST", "localhost")
+os.environ.setdefault("SMTP_PORT", "25")
+os.environ.setdefault("SMTP_EMAIL", "noreply@example.com")
+os.environ.setdefault("SMTP_PASSWORD", "test")
@@ -0,0 +1,113 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip("pydantic_settings")
+pytest.importorskip("fastapi")
+
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+
+from app.config import settings
+from app.utils import rate_limit
+from app.utils.rate_limit import MemoryBackend, check
+
+WINDOW = 100
+
+
+@pytest.fixture(autouse=True)
+def memory_backend(monkeypatch):
+    monkeypatch.setattr(rate_limit, "_backend", MemoryBackend())
+    monkeypatch.setattr(settings, "RATE_LIMIT_ENABLED", True)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [10 * WINDOW]
+    monkeypatch.setattr(rate_limit.time, "time", lambda: now[0])
+    return now
+
+
+def hits(key, limit, n):
+    return [asyncio.run(check(key, limit, WINDOW)) for _ in range(n)]
+
+
+def test_allows_up_to_limit_then_reports_rest_of_window(clock):
+    clock[0] = 10 * WINDOW + 30
+
+    assert hits("k", 3, 3) == [None, None, None]
+    assert asyncio.run(check("k", 3, WINDOW)) == 70
+
+
+def test_previous_window_is_weighted_by_overlap(clock):
+    assert hits("k", 4, 4) == [None] * 4
+
+    # Next window, 75% through: previous 4 hits weigh 4 * 0.25 = 1
+    clock[0] = 11 * WINDOW + 75
+    assert hits("k", 4, 3) == [None] * 3  # 1 + 3 = 4
+    assert asyncio.run(check("k", 4, WINDOW)) == 25  # 1 + 4 = 5
+
+
+def test_counts_expire_after_two_windows(clock):
+    hits("k", 2, 5)
+
+    clock[0] = 12 * WINDOW
+    assert asyncio.run(check("k", 2, WINDOW)) is None
+
+
+def test_backend_failure_fails_open(monkeypatch):
+    class Down:
+        async def hit(self, key, window, now):
+            raise ConnectionError("redis unreachable")
+
+    monkeypatch.setattr(rate_limit, "_backend", Down())
+    assert asyncio.run(check("k", 0, WINDOW)) is None
+
+
+def make_client(**kwargs):
+    app = FastAPI()
+
+    @app.post("/login", dependencies=[Depends(rate_limit.rate_limit("login", 100, 2, window=WINDOW, **kwargs))])
+    def login():
+        return {"ok": True}
+
+    return TestClient(app)
+
+
+def test_429_with_retry_after():
+    client = make_client()
+
+    for _ in range(2):
+        assert client.post("/login", json={"email": "Admin@Example.com"}).status_code == 200
+
+    response = client.post("/login", json={"email": "admin@example.com"})
+    assert response.status_code == 429
+    assert 1 <= int(response.headers["Retry-After"]) <= WINDOW
+
+
+def test_email_per_ip_does_not_lock_out_other_clients(monkeypatch):
+    monkeypatch.setattr(settings, "RATE_LIMIT_TRUST_FORWARDED", True)
+    client = make_client(email_per_ip=True)
+    body = {"email": "admin@example.com"}
+
+    attacker = {"X-Forwarded-For": "203.0.113.9"}
+    statuses = [client.post("/login", json=body, headers=attacker).status_code for _ in range(3)]
+    assert statuses == [200, 200, 429]
+
+    admin = {"X-Forwarded-For": "198.51.100.7"}
+    assert client.post("/login", json=body, headers=admin).status_code == 200
+
+
+def test_per_account_limit_spans_ips(monkeypatch):
+    monkeypatch.setattr(settings, "RATE_LIMIT_TRUST_FORWARDED", True)
+    client = make_client(email_per_ip=True, per_account=3)
+    body = {"email": "admin@example.com"}
+
+    statuses = [
+        client.post("/login", json=body, headers={"X-Forwarded-For": f"203.0.113.{i}"}).status_code
+        for i in range(4)
+    ]
+    assert statuses == [200, 200, 200, 429]
+
+    other = {"email": "other@example.com"}
+    assert client.post("/login", json=other, headers={"X-Forwarded-For": "203.0.113.9"}).status_code == 200
@@ -0,0 +1,110 @@
+import io
+
+import pytest
+
+pytest.importorskip("pydantic_settings")
+moto = pytest.importorskip("moto")
+boto3 = pytest.importorskip("boto3")
+
+from starlette.datastructures import UploadFile
+
+from app.utils.file_upload import save_upload_file
+from app.utils.storage import LocalStorage, S3Storage
+
+BUCKET = "test-uploads"
+
+
+@pytest.fixture
+def s3(monkeypatch):
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+    with moto.mock_aws():
+        boto3.client("s3", region_name="us-east-1").create_bucket(Bucket=BUCKET)
+        yield S3Storage(BUCKET, region="us-east-1")
+
+
+def test_s3_save_info_open_delete(s3):
+    key = "uploads/csr/photo.png"
+
+    assert s3.save(key, io.BytesIO(b"\x89PNG" + b"x" * 100)) == 104
+    assert s3.info(key).size == 104
+    assert s3.exists(key)
+    with s3.open(key) as body:
+        assert body.read(4) == b"\x89PNG"
+
+    s3.delete(key)
+    assert s3.info(key) is None
+    s3.delete(key)  # missing keys are not an error
+
+
+def test_s3_put_file_removes_local_copy(s3, tmp_path):
+    local = tmp_path / "resume.pdf.part"
+    local.write_bytes(b"%PDF-1.7")
+
+    s3.put_file(str(local), "uploads/job_applications/resume.pdf")
+
+    assert not local.exists()
+    head = s3.client.head_object(Bucket=BUCKET, Key="uploads/job_applications/resume.pdf")
+    assert head["ContentType"] == "application/pdf"
+
+
+def test_s3_move_and_iter_files(s3):
+    s3.save("uploads/onboarding/a.pdf", io.BytesIO(b"a"))
+    s3.save("uploads/onboarding/b.pdf", io.BytesIO(b"bb"))
+    s3.save("uploads/csr/c.png", io.BytesIO(b"c"))
+
+    s3.move("uploads/onboarding/a.pdf", "uploads/quarantine/a.pdf")
+
+    keys = {key: info.size for key, info in s3.iter_files("uploads/onboarding")}
+    assert keys == {"uploads/onboarding/b.pdf": 2}
+    assert s3.exists("uploads/quarantine/a.pdf")
+
+
+def test_s3_download_and_url(s3, tmp_path):
+    s3.save("uploads/csr/c.png", io.BytesIO(b"image"))
+
+    local = tmp_path / "c.png"
+    s3.download("uploads/csr/c.png", str(local))
+    assert local.read_bytes() == b"image"
+
+    assert "uploads/csr/c.png" in s3.url("uploads/csr/c.png", expires=60)
+    assert s3.local_path("uploads/csr/c.png") is None
+
+
+@pytest.mark.parametrize("key", [
+    "/etc/passwd",
+    "../outside",
+    "uploads/../../outside",
+    "uploads/../app/evil.py",
+    "app/evil.py",
+    "uploads/a\\..\\..\\evil.py",
+    "",
+])
+def test_local_rejects_keys_outside_root(tmp_path, key):
+    storage = LocalStorage(str(tmp_path / "root"))
+
+    with pytest.raises(ValueError):
+        storage.delete(key)
+
+
+def test_local_round_trip(tmp_path):
+    storage = LocalStorage(str(tmp_path))
+
+    storage.save("uploads/csr/a.png", io.BytesIO(b"abc"))
+    assert storage.info("uploads/csr/a.png").size == 3
+    assert [key for key, _ in storage.iter_files("uploads")] == ["uploads/csr/a.png"]
+
+    storage.delete("uploads/csr/a.png")
+    assert not storage.exists("uploads/csr/a.png")
+
+
+@pytest.mark.parametrize("filename", ["../../../../app/evil.py", "..\\..\\app\\evil.py", "/app/evil.py"])
+def test_save_upload_file_keeps_client_names_inside_upload_dir(tmp_path, monkeypatch, filename):
+    monkeypatch.setattr("app.utils.file_upload.get_storage", lambda: LocalStorage(str(tmp_path)))
+
+    key = save_upload_file("uploads/job_applications", UploadFile(io.BytesIO(b"%PDF"), filename=filename))
+
+    assert key.startswith("uploads/job_applications/") and key.count("/") == 2
+    assert key.endswith("_evil.py")
+    assert not (tmp_path / "app").exists()
+    assert (tmp_path / key).read_bytes() == b"%PDF"